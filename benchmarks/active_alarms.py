@@ -0,0 +1,65 @@
+""" Measures the active alarm bookkeeping of the AlarmHandler with 10k
+standing alarms: activating them, checking whether each is active, and
+clearing and acknowledging them, which removes them from the active alarms.
+For comparison it also times the same membership checks against a list of
+the alarms, which is how the active alarms used to be kept.
+
+Run from the repository root:
+
+    PYTHONPATH=. python benchmarks/active_alarms.py [alarms]
+
+"""
+import logging
+import sys
+import time
+
+from pyAutomation.DataObjects.Alarm import Alarm
+from pyAutomation.Supervisory.AlarmHandler import AlarmHandler
+
+
+def report(what, count, elapsed):
+    print(
+      f"{what:32} {elapsed * 1e3:8.1f}ms "
+      f"({elapsed / count * 1e6:.2f}us each)")
+
+
+def run(count):
+    # the handler logs each alarm added and removed.
+    logging.getLogger('benchmark').setLevel(logging.WARNING)
+    handler = AlarmHandler(logger='benchmark', name="benchmark_handler")
+    Alarm.alarm_handler = handler
+
+    alarms = []
+    for i in range(count):
+        a = Alarm(description=f"alarm {i}")
+        a.name = f"alarm_{i}"
+        alarms.append(a)
+
+    start = time.perf_counter()
+    for a in alarms:
+        a.input = True
+    report(f"activate {count} alarms", count, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for a in alarms:
+        assert a.handle in handler.active_alarms
+    report("membership by handle", count, time.perf_counter() - start)
+
+    # a tenth of the checks, a list takes too long for all of them.
+    standing = handler.active_alarm_list
+    sample = alarms[::10]
+    start = time.perf_counter()
+    for a in sample:
+        assert a in standing
+    report("membership in a list", len(sample), time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for a in alarms:
+        a.input = False
+        a.acknowledge()
+    report(f"clear {count} alarms", count, time.perf_counter() - start)
+    assert not handler.active_alarms
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
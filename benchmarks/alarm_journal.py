@@ -0,0 +1,74 @@
+""" Measures the AlarmJournal with months of alarm history: records 500k
+transitions of 1000 alarms spread over 90 days (daily segments), then
+times queries for one 8 hour shift, and for one alarm over the whole
+history.
+
+Run from the repository root:
+
+    PYTHONPATH=. python benchmarks/alarm_journal.py [transitions]
+
+"""
+import datetime
+import shutil
+import sys
+import tempfile
+import time
+
+from pyAutomation.DataObjects.Alarm import Alarm
+from pyAutomation.Supervisory.AlarmJournal import AlarmJournal
+from pyAutomation.Supervisory.VirtualClock import VirtualClock
+
+DAYS = 90
+ALARMS = 1000
+
+
+def run(count):
+    directory = tempfile.mkdtemp()
+    try:
+        alarms = []
+        for i in range(ALARMS):
+            a = Alarm(description=f"alarm {i}")
+            a.name = f"alarm_{i}"
+            alarms.append(a)
+
+        start = datetime.datetime(2019, 1, 1, tzinfo=datetime.timezone.utc)
+        step = DAYS * 86400.0 / count
+        journal = AlarmJournal(directory=directory, logger='benchmark')
+        journal.start()
+        with VirtualClock(start=start) as clock:
+            begin = time.perf_counter()
+            for i in range(count):
+                old, new = ("OFF", "ALARM") if i % 2 else ("ALARM", "OFF")
+                journal.record(alarms[i % ALARMS], old, new)
+                clock.advance(step)
+            recorded = time.perf_counter() - begin
+            journal.close()
+            written = time.perf_counter() - begin
+        print(
+          f"record {count} transitions: {recorded * 1e3:8.1f}ms "
+          f"({recorded / count * 1e6:.2f}us each), "
+          f"{written * 1e3:.1f}ms until written, "
+          f"{len(AlarmJournal.segments(directory))} segments")
+
+        shift = start + datetime.timedelta(days=DAYS // 2, hours=6)
+        begin = time.perf_counter()
+        entries = list(AlarmJournal.query(
+          directory, start=shift, end=shift + datetime.timedelta(hours=8)))
+        elapsed = time.perf_counter() - begin
+        print(
+          f"query one shift: {elapsed * 1e3:8.1f}ms "
+          f"for {len(entries)} transitions")
+
+        begin = time.perf_counter()
+        entries = list(AlarmJournal.query(directory, alarms=["alarm_7"]))
+        elapsed = time.perf_counter() - begin
+        print(
+          f"query one alarm: {elapsed * 1e3:8.1f}ms "
+          f"for {len(entries)} transitions")
+
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 500000)
@@ -0,0 +1,82 @@
+""" Measures the AlarmHandler with a flood of delayed alarms: arming the on
+delays of 50k alarms at once, cancelling half of them, and the handler
+cycles that activate the rest. For comparison it also times one walk of
+every alarm's wake time, which is what each handler wakeup used to cost.
+
+Run from the repository root:
+
+    PYTHONPATH=. python benchmarks/alarm_timers.py [alarms]
+
+"""
+import datetime
+import sys
+import time
+
+from pyAutomation.DataObjects.Alarm import Alarm
+from pyAutomation.Supervisory.AlarmHandler import AlarmHandler
+from pyAutomation.Supervisory.VirtualClock import VirtualClock
+
+
+class CountingHandler(AlarmHandler):
+    """ Counts the wakeups requested of the handler. """
+
+    wakeups = 0
+
+    def interrupt(self, name, reason):
+        self.wakeups += 1
+        super().interrupt(name, reason)
+
+
+def run(count):
+    handler = CountingHandler(logger='benchmark', name="benchmark_handler")
+    Alarm.alarm_handler = handler
+
+    # on delays of 1 to 100 seconds.
+    alarms = []
+    for i in range(count):
+        a = Alarm(description=f"alarm {i}", on_delay=1.0 + i % 100)
+        a.name = f"alarm_{i}"
+        alarms.append(a)
+
+    with VirtualClock(start=datetime.datetime(2019, 1, 1)) as clock:
+        start = time.perf_counter()
+        for a in alarms:
+            a.input = True
+        armed = time.perf_counter() - start
+        print(
+          f"arm {count} delays: {armed * 1e3:8.1f}ms "
+          f"({armed / count * 1e6:.2f}us each), "
+          f"{handler.wakeups} handler wakeups")
+
+        start = time.perf_counter()
+        for a in alarms[::2]:
+            a.input = False
+        cancelled = time.perf_counter() - start
+        print(
+          f"cancel {count // 2} delays: {cancelled * 1e3:6.1f}ms "
+          f"({cancelled / (count // 2) * 1e6:.2f}us each)")
+
+        start = time.perf_counter()
+        walk = [a.wake_time for a in alarms]
+        walked = time.perf_counter() - start
+        print(f"walk of every wake time: {walked * 1e3:6.1f}ms")
+
+        cycles = 0
+        busy = 0.0
+        sleep_time = 0.0
+        while sleep_time is not None:
+            clock.advance(sleep_time)
+            start = time.perf_counter()
+            sleep_time = handler.run_cycle()
+            busy += time.perf_counter() - start
+            cycles += 1
+
+        active = sum(1 for a in alarms if a.active)
+        print(
+          f"activate {active} alarms: {busy * 1e3:8.1f}ms in {cycles} "
+          f"handler cycles ({busy / active * 1e6:.2f}us per alarm)")
+        del walk
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 50000)
@@ -0,0 +1,98 @@
+""" Measures the time from a PointAbstract.value assignment to the start of
+loop() in a SupervisedThread observing that point, on a dedicated thread and
+on a SupervisedThreadPool.
+
+Run from the repository root:
+
+    PYTHONPATH=. python benchmarks/interrupt_latency.py [samples]
+
+"""
+import sys
+import threading
+import time
+
+from pyAutomation.DataObjects.PointDiscrete import PointDiscrete
+from pyAutomation.Supervisory.SupervisedThread import SupervisedThread
+from pyAutomation.Supervisory.SupervisedThreadPool import \
+  SupervisedThreadPool
+
+
+class Reader(SupervisedThread):
+    """ Records when loop() starts after each write to the point."""
+
+    def __init__(self, name, point):
+        self.point = point
+        self.write_ns = 0
+        self.latencies = []
+        self.ran = threading.Event()
+        super().__init__(
+          name=name,
+          loop=self.loop,
+          period=None,
+          logger='benchmark',
+        )
+
+    def config(self, data):
+        pass
+
+    def loop(self):
+        now = time.monotonic_ns()
+        if self.interrupted_by(self.point):
+            self.latencies.append(now - self.write_ns)
+        self.ran.set()
+        return None
+
+
+class Writer(object):
+    name = "writer"
+
+
+def percentile(samples, p):
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(len(samples) * p / 100.0))]
+
+
+def run(mode, samples):
+    point = PointDiscrete(description="latency point")
+    point.name = f"latency_point_{mode}"
+    point.writer = Writer()
+
+    reader = Reader(f"reader_{mode}", point)
+    point.add_observer(reader.name, reader.interrupt)
+
+    pool = None
+    if mode == 'pool':
+        pool = SupervisedThreadPool(workers=2, logger='benchmark')
+        pool.start()
+        reader.executor = pool
+
+    reader.start()
+    reader.ran.wait(1.0)
+
+    for i in range(samples):
+        reader.ran.clear()
+        # give the reader time to go back to sleep.
+        time.sleep(0.0005)
+        reader.write_ns = time.monotonic_ns()
+        point.value = bool(i % 2 == 0)
+        reader.ran.wait(1.0)
+
+    reader.quit()
+    if pool is not None:
+        pool.shutdown()
+    else:
+        reader.thread.join()
+
+    lat = reader.latencies
+    print(
+      f"{mode:>10}: samples={len(lat)} "
+      f"p50={percentile(lat, 50) / 1000.0:.1f}us "
+      f"p99={percentile(lat, 99) / 1000.0:.1f}us "
+      f"max={max(lat) / 1000.0:.1f}us"
+    )
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    for m in ('dedicated', 'pool'):
+        run(m, n)
@@ -0,0 +1,78 @@
+""" Counts the observers woken by each point write as the number of points
+grows, with one observer subscribed to each point. The 'shared' rows
+reproduce the old behaviour where every point shared one class level
+observer dict, so every write woke every observer in the system.
+
+Run from the repository root:
+
+    PYTHONPATH=. python benchmarks/observer_fanout.py [max points]
+
+"""
+import sys
+import time
+
+from pyAutomation.DataObjects.PointAnalog import PointAnalog
+
+
+class SharedRegistryPoint(PointAnalog):
+    # a class level dict is shared by every instance.
+    shared_observers = {}
+
+    @property
+    def _observers(self):
+        return SharedRegistryPoint.shared_observers
+
+    @_observers.setter
+    def _observers(self, observers):
+        pass
+
+
+class Writer(object):
+    name = "writer"
+
+
+class Counter(object):
+
+    def __init__(self):
+        self.wakeups = 0
+
+    def interrupt(self, name, reason):
+        self.wakeups += 1
+
+
+def run(point_class, count):
+    if point_class is SharedRegistryPoint:
+        SharedRegistryPoint.shared_observers = {}
+    writer = Writer()
+    counter = Counter()
+    points = []
+    for i in range(count):
+        p = point_class(description=f"fan out point {i}")
+        p.name = f"fan_out_{i}"
+        p.writer = writer
+        p.add_observer(f"observer_{i}", counter.interrupt)
+        points.append(p)
+
+    start = time.perf_counter_ns()
+    for i, p in enumerate(points):
+        p.value = float(i + 1)
+    elapsed = time.perf_counter_ns() - start
+
+    return counter.wakeups / count, elapsed / count
+
+
+if __name__ == '__main__':
+    maximum = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    counts = [n for n in (10, 100, 1000, 10000, 100000) if n <= maximum]
+    for mode, point_class in (
+      ('per point', PointAnalog),
+      ('shared', SharedRegistryPoint),
+    ):
+        for n in counts:
+            if point_class is SharedRegistryPoint and n > 10000:
+                continue
+            wakeups, ns = run(point_class, n)
+            print(
+              f"{mode:>10}: points={n:<6} wakeups/write={wakeups:<8g} "
+              f"time/write={ns / 1000.0:.1f}us"
+            )
@@ -0,0 +1,75 @@
+""" Measures the memory used per point and alarm object with tracemalloc,
+building a database of 100k objects of each type.
+
+Run from the repository root:
+
+    PYTHONPATH=. python benchmarks/point_memory.py [objects]
+
+"""
+import gc
+import sys
+import tracemalloc
+
+from pyAutomation.DataObjects.Alarm import Alarm
+from pyAutomation.DataObjects.AlarmAnalog import AlarmAnalog
+from pyAutomation.DataObjects.PointAnalog import PointAnalog
+from pyAutomation.DataObjects.PointDiscrete import PointDiscrete
+from pyAutomation.DataObjects.PointEnumeration import PointEnumeration
+
+
+class Writer(object):
+    name = "writer"
+
+
+def build(kind, i, name, writer):
+    if kind is PointAnalog:
+        p = PointAnalog(description="analog point", u_of_m="kPa")
+    elif kind is PointDiscrete:
+        p = PointDiscrete(description="discrete point")
+    elif kind is PointEnumeration:
+        p = PointEnumeration(
+          description="enumeration point", states=["Hand", "Off", "Auto"])
+    elif kind is AlarmAnalog:
+        p = AlarmAnalog(description="analog alarm", alarm_value=10.0)
+    else:
+        p = Alarm(description="alarm", on_delay=1.0)
+    p.name = name
+
+    # populate the state a running system would have.
+    if kind is PointAnalog:
+        p.writer = writer
+        p.value = float(i)
+    elif kind is PointDiscrete:
+        p.writer = writer
+        p.value = True
+    return p
+
+
+def run(kind, count):
+    writer = Writer()
+
+    # the names and the list holding the objects are made up front so they
+    # aren't counted.
+    names = [f"point_{i}" for i in range(count)]
+    objects = [None] * count
+    gc.collect()
+
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    for i in range(count):
+        objects[i] = build(kind, i, names[i], writer)
+    total = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+
+    print(
+      f"{kind.__name__:>16}: objects={count} "
+      f"total={total / 1e6:.1f}MB per object={total / count:.0f}B"
+    )
+    del objects
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    for k in (PointAnalog, PointDiscrete, PointEnumeration, Alarm,
+              AlarmAnalog):
+        run(k, n)
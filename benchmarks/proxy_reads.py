@@ -0,0 +1,64 @@
+""" Measures the cost of reading point attributes directly, through the
+read only view of a point, through a ProcessValue and through a scaled
+point, the way logic routines read their inputs.
+
+Run from the repository root:
+
+    PYTHONPATH=. python benchmarks/proxy_reads.py [reads]
+
+"""
+import sys
+import timeit
+
+from pyAutomation.DataObjects.PointAnalog import PointAnalog
+from pyAutomation.DataObjects.PointAnalogScaled import PointAnalogScaled
+from pyAutomation.DataObjects.ProcessValue import ProcessValue
+
+
+class Writer(object):
+    name = "writer"
+
+
+def build():
+    point = PointAnalog(description="proxy point", u_of_m="kPa")
+    point.name = "proxy_point"
+    point.writer = Writer()
+    point.value = 12.5
+
+    pv = ProcessValue(
+      PointAnalog(description="proxy process value", u_of_m="kPa"))
+    pv.name = "proxy_pv"
+    pv.config()
+
+    source = PointAnalog(description="proxy scaled source", u_of_m="kPa")
+    source.name = "proxy_source"
+    scaled = PointAnalogScaled(
+      scaling=2.0, offset=-1.0, point=source, readonly=False)
+    scaled.name = "proxy_scaled"
+    scaled.value = 12.5
+
+    return {
+      'point': point,
+      'readonly': point.readonly_object,
+      'process value': pv,
+      'scaled': scaled,
+      'scaled readonly': scaled.readonly_object,
+    }
+
+
+def run(count):
+    objects = build()
+    for attribute in ('value', 'quality', 'last_update'):
+        for label, obj in objects.items():
+            t = min(timeit.repeat(
+              f"obj.{attribute}",
+              globals={'obj': obj},
+              number=count,
+              repeat=5,
+            ))
+            print(
+              f"{attribute:>12} {label:>16}: {t / count * 1e9:6.0f}ns per read")
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
@@ -7,6 +7,7 @@ import signal
 import argparse
 import inspect
 import threading
+import multiprocessing
 from importlib import import_module
 from rpyc.utils.server import ThreadedServer
 from typing import List
@@ -14,15 +15,31 @@ import ruamel
 
 from pyAutomation.DataObjects.Alarm import Alarm
 from pyAutomation.Supervisory.AlarmHandler import AlarmHandler
+from pyAutomation.Supervisory.AlarmJournal import AlarmJournal
 from pyAutomation.Supervisory.SupervisedThread import SupervisedThread
+from pyAutomation.Supervisory.SupervisedThreadPool import \
+  SupervisedThreadPool
+from pyAutomation.Supervisory.AsyncSupervisedTask import AsyncSupervisedTask
+from pyAutomation.Supervisory.AsyncEventLoop import AsyncEventLoop
 from pyAutomation.Supervisory.Interruptable import Interruptable
 from pyAutomation.Supervisory.PointManager import PointManager
 from pyAutomation.Supervisory.AlarmNotifier import AlarmNotifier
 from pyAutomation.Supervisory.RpcServer import RpcServer
+from pyAutomation.Supervisory.MetricsServer import MetricsServer
+from pyAutomation.Supervisory.OsScheduling import OsScheduling
+from pyAutomation.Supervisory.GcManager import GcManager
+from pyAutomation.Supervisory.RemoteThread import RemoteThread
+from pyAutomation.Supervisory.SharedPointTable import SharedPointTable, \
+  MAIN_PROCESS
+from pyAutomation.Supervisory.ConfigurationException import \
+  ConfigurationException
 
 
 sys.path.insert(0, os.getcwd())
 
+# seconds between the thread status reports of the worker processes.
+THREAD_REPORT_PERIOD = 1.0
+
 
 # build the formatter
 formatter = logging.Formatter(
@@ -175,20 +192,110 @@ class Supervisor(object):
 
                     supervised_thread.config(config=config)
 
+                    # Apply the scheduling settings for the thread.
+                    supervised_thread.configure_execution(
+                      cfg[section][thread_name])
+
                     # Append the fully built module to the threads dict.
                     self.threads.append(supervised_thread)
 
-        # Fire up all the threads.
+        section = 'Supervisor'
+        if section in cfg and cfg[section] is not None:
+            self.settings = cfg[section]
+        else:
+            self.settings = {}
+
+        # Group the threads by the process they run in. Threads without a
+        # process setting stay in this process.
+        process_names = [None]  # type: List[str]
+        self.process_threads = [[]]  # type: List[List[Interruptable]]
         for thread in self.threads:
-            self.logger.info(f"starting: {thread.name}")
-            thread.start()
+            process_name = getattr(thread, 'process', None)
+            if process_name not in process_names:
+                process_names.append(process_name)
+                self.process_threads.append([])
+            self.process_threads[process_names.index(process_name)] \
+              .append(thread)
+
+        # Everything built so far lives until shutdown, freeze it before the
+        # workers are forked so they share it too.
+        self.gc_manager = GcManager.from_config(self.settings.get('gc'))
+        if self.gc_manager is not None:
+            self.gc_manager.start()
+
+        # Number of point changes remembered for the delta updates of the
+        # HMI, a client that falls further behind is sent every point.
+        if 'change_log_size' in self.settings:
+            PointManager.use_change_log(self.settings['change_log_size'])
+
+        # Alarm flood detection, see AlarmHandler.
+        flood = self.settings.get('alarm_flood') or {}
+        for setting in (
+          'flood_threshold',
+          'flood_window',
+          'flood_group_limit',
+          'hmi_period',
+        ):
+            if setting in flood:
+                setattr(self.alarm_handler, setting, flood[setting])
+
+        # Journal the alarm state transitions.
+        journal = self.settings.get('alarm_journal')
+        if journal is not None:
+            Alarm.alarm_journal = AlarmJournal(
+              directory=journal['directory'],
+              segment_period=float(journal.get('segment_period', 86400.0)),
+              logger="supervisory",
+            )
+            Alarm.alarm_journal.start()
+
+        # Keep the state of the points in a columnar store.
+        if self.settings.get('point_store', False):
+            PointManager.create_point_store()
+
+        self.local_threads = self.process_threads[MAIN_PROCESS]
+        # threads shown on the HMI and the metrics endpoint, those of the
+        # workers are stood in for by a RemoteThread.
+        self.thread_list = list(self.local_threads)
+        self.point_table = None
+        self.worker_processes = []  # type: List[multiprocessing.Process]
+        if len(self.process_threads) > 1:
+            self.share_point_database()
+
+            # Fork the workers before any threads are started.
+            ctx = multiprocessing.get_context('fork')
+            for index in range(1, len(self.process_threads)):
+                process = ctx.Process(
+                  target=self.run_worker_process,
+                  args=(index,),
+                  name=process_names[index],
+                )
+                process.start()
+                self.logger.info(
+                  f"started process {process_names[index]} ({process.pid})")
+                self.worker_processes.append(process)
+
+            for threads in self.process_threads[1:]:
+                for thread in threads:
+                    remote = RemoteThread(thread)
+                    self.point_table.remote_threads[remote.name] = remote
+                    self.thread_list.append(remote)
+
+            self.point_table.attach(MAIN_PROCESS)
+            threading.Thread(
+              target=self.point_table.serve,
+              name="point table",
+              daemon=True,
+            ).start()
+
+        self.start_threads(self.local_threads)
 
         # Start the point database server
         rpc_object = RpcServer()
-        rpc_object.active_alarm_list = self.alarm_handler.active_alarm_list
+        rpc_object.alarm_handler = self.alarm_handler
         rpc_object.global_alarm_list = PointManager().global_alarms()
         rpc_object.point_dict = PointManager().global_points()
-        rpc_object.thread_list = self.threads
+        rpc_object.thread_list = self.thread_list
         rpc_object.get_hmi_point = PointManager().get_hmi_point
 
         self.rpc_server = ThreadedServer(
@@ -197,19 +304,175 @@ class Supervisor(object):
           logger=self.logger,
           protocol_config={"allow_public_attrs": True})
 
-        self.rpc_server_thread = threading.Thread(target=self.rpc_server.start)
+        # The RPC server (and the connection threads it spawns) can be kept
+        # off the CPUs used by the control logic.
+        rpc_scheduling = None
+        if 'rpc_server' in self.settings:
+            rpc_scheduling = OsScheduling.from_config(
+              self.settings['rpc_server'])
+
+        def run_rpc_server():
+            if rpc_scheduling is not None:
+                rpc_scheduling.apply(self.logger)
+            self.rpc_server.start()
+
+        self.rpc_server_thread = threading.Thread(target=run_rpc_server)
         self.rpc_server_thread.start()
 
+        # Serve the thread statistics for a local scraper if configured.
+        self.metrics_server = None
+        if 'metrics_port' in self.settings:
+            self.metrics_server = MetricsServer(
+              thread_list=self.thread_list,
+              port=int(self.settings['metrics_port']),
+              address=self.settings.get('metrics_address', '127.0.0.1'),
+            )
+            self.metrics_server.start()
+
         self.logger.info("Completed Supervisor setup")
 
+    def start_threads(self, threads: 'List[SupervisedThread]') -> 'None':
+        """ Starts the threads that run in this process. """
+
+        # Async tasks all share one event loop.
+        self.event_loop = None
+        tasks = [t for t in threads if isinstance(t, AsyncSupervisedTask)]
+        if tasks:
+            self.event_loop = AsyncEventLoop(logger='supervisory')
+            for task in tasks:
+                task.event_loop = self.event_loop
+            self.event_loop.start()
+
+        # Run the threads on a shared worker pool if one is configured.
+        # Threads that ask for a dedicated thread keep their own.
+        self.thread_pool = None
+        if 'worker_threads' in self.settings:
+            workers = int(self.settings['worker_threads'])
+            self.logger.info(f"running threads on a pool of {workers} workers")
+            self.thread_pool = SupervisedThreadPool(
+              workers=workers,
+              logger='supervisory',
+            )
+            for thread in threads:
+                if not thread.dedicated_thread \
+                  and not isinstance(thread, AsyncSupervisedTask):
+                    thread.executor = self.thread_pool
+            self.thread_pool.start()
+
+        for thread in threads:
+            thread.gc_manager = self.gc_manager
+
+        # Fire up all the threads.
+        for thread in threads:
+            self.logger.info(f"starting: {thread.name}")
+            thread.start()
+
+    def share_point_database(self) -> 'None':
+        """ Moves the point values into shared memory and makes the process
+        running the writer of each point its owner. """
+        process_of = {}
+        for index, threads in enumerate(self.process_threads):
+            for thread in threads:
+                process_of[id(thread)] = index
+
+        self.point_table = SharedPointTable(
+          points=PointManager().all_points(),
+          processes=len(self.process_threads),
+        )
+        PointManager.use_point_store(self.point_table.store)
+        for point in self.point_table.points:
+            if point.writer is not None:
+                self.point_table.claim(
+                  point_name=point.name,
+                  process=process_of.get(id(point.writer), MAIN_PROCESS),
+                )
+
+        # The alarm handler and notifiers only run in this process.
+        for alarm in PointManager().global_alarms().values():
+            if alarm.writer is not None \
+              and process_of.get(id(alarm.writer), MAIN_PROCESS) \
+              != MAIN_PROCESS:
+                raise ConfigurationException(
+                  f"Alarm {alarm.name} is written by {alarm.writer.name} "
+                  "which runs in a worker process. Alarms can only be "
+                  "written by threads in the Supervisor process."
+                )
+
+    def run_worker_process(self, index: 'int') -> 'None':
+        """ Entry point of a forked worker process. Runs its share of the
+        threads until the Supervisor stops it. """
+        # Shutdown is driven by the Supervisor process.
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+        threads = self.process_threads[index]
+        self.point_table.attach(index)
+        self.start_threads(threads)
+
+        # the Supervisor serves the HMI and the metrics for every process.
+        stopped = threading.Event()
+
+        def report_threads():
+            while not stopped.wait(THREAD_REPORT_PERIOD):
+                self.point_table.report_threads(threads)
+
+        reporter = threading.Thread(
+          target=report_threads,
+          name="thread report",
+          daemon=True,
+        )
+        reporter.start()
+
+        self.point_table.serve()
+
+        stopped.set()
+        reporter.join()
+        for t in threads:
+            t.quit()
+        if self.thread_pool is not None:
+            self.thread_pool.shutdown()
+        if self.event_loop is not None:
+            self.event_loop.shutdown()
+        for t in threads:
+            if t.thread is not None:
+                t.thread.join(timeout=5.0)
+        self.point_table.report_threads(threads)
+
     def exit(self):
         self.logger.info("Shutdown signal received.")
         # self.simulator_thread.quit()
-        for t in self.threads:
+        for t in self.local_threads:
             t.quit()
 
+        if self.thread_pool is not None:
+            self.thread_pool.shutdown()
+
+        if self.event_loop is not None:
+            self.event_loop.shutdown()
+
+        for index in range(1, len(self.process_threads)):
+            self.point_table.stop(index)
+        for process in self.worker_processes:
+            process.join(timeout=10.0)
+
+        if self.point_table is not None:
+            self.point_table.stop(MAIN_PROCESS)
+            self.point_table.close()
+
+        # sends the alarm notifications still queued.
+        for notifier in Alarm.alarm_notifiers:
+            notifier.close(timeout=10.0)
+
+        if Alarm.alarm_journal is not None:
+            Alarm.alarm_journal.close(timeout=10.0)
+
         self.rpc_server.close()
 
+        if self.metrics_server is not None:
+            self.metrics_server.close()
+
+        if self.gc_manager is not None:
+            self.gc_manager.stop()
+
 
 parser = argparse.ArgumentParser(description='Start the pyAutomation system.')
 
@@ -1,83 +1,120 @@
 import datetime
+import itertools
 import dateutil.parser
 import logging
-import time
 from .Observable import Observable
+from pyAutomation.Supervisory.AlarmJournal import STATES
+from pyAutomation.Supervisory.Clock import Clock
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
-    from typing import Dict, List, Any
+    from typing import Dict, List, Any, Optional
     from .Supervisory.AlarmHandler import AlarmHandler
+    from .Supervisory.AlarmJournal import AlarmJournal
     from .Supervisory.AlarmNotifier import AlarmNotifier
-    from .Supervisory.Interruptable import Interruptable
 
 logger = logging.getLogger('alarms')
 
+# Bits of Alarm._flags, the boolean state of an alarm and the index of its
+# state in AlarmJournal.STATES are packed into a single int to keep the per
+# alarm size down.
+_INPUT = 0x01
+_BLOCKED = 0x02
+_ACKNOWLEDGED = 0x04
+_ENABLED = 0x08
+_STATE_SHIFT = 4
+_STATE_MASK = 0x70
+_STATE_INDEX = {state: i for i, state in enumerate(STATES)}
+
 
 class Alarm(Observable):
     """
     Represents an alarm object, which is an event which requires intervention
     to prevent damage.
+
+    Each alarm has an integer handle, unique within the process, that the
+    AlarmHandler and the HMI key it by. Alarms compare by handle, so two
+    alarms configured alike are still different alarms while a copy of an
+    alarm (e.g. sent to the HMI) is the same alarm.
     """
     keywords = [
       'description',
       'on_delay',
       'off_delay',
       'more_info',
-      'consequences'
+      'consequences',
+      'group',
     ]
 
     # notifiers are global alarm watchers for all alarms. They are used for
     # logging and remote alarm notification (e.g. email).
     alarm_notifiers = []  # type: List[AlarmNotifier]
 
-    alarm_handler = None  # type: AlarmHandler
+    # records the state transitions of all alarms, if set.
+    alarm_journal = None  # type: Optional[AlarmJournal]
 
-    # The value set by logic to indicating an alarm condition
-    _input = False  # type: bool
+    alarm_handler = None  # type: AlarmHandler
 
-    # The value which allows the operator to suppress the alarm
-    blocked = False  # type: bool
+    # hands out the alarm handles.
+    _handles = itertools.count(1)
 
-    # Indicates that the alarm has been ack'd by the operator
-    acknowledged = True  # type: bool
+    __slots__ = (
+      '_flags',
+      'consequences',
+      'more_info',
+      'group',
+      '_activation_time',
+      '_is_reset_time',
+      'on_delay',
+      'off_delay',
+      '_timer',
+      '_handle',
+    )
 
-    # Interlock value
-    enabled = True  # type: bool
+    def _set_defaults(self) -> 'None':
+        super()._set_defaults()
 
-    # description of the bad things that will happen if this alarm is not
-    # addressed.
-    consequences = "None"  # type: str
+        # input, blocked, acknowledged and enabled, see the properties of
+        # the same names, and the state, see _state. The alarm starts OFF.
+        self._flags = _ACKNOWLEDGED | _ENABLED  # type: int
 
-    # Additional info for this alarm
-    more_info = "None"  # type: str
+        # description of the bad things that will happen if this alarm is not
+        # addressed.
+        self.consequences = "None"  # type: str
 
-    # The time that the alarm was put into ALARM
-    _activation_time = None  # type: datetime.datetime
+        # Additional info for this alarm
+        self.more_info = "None"  # type: str
 
-    # The time that the alarm was reset
-    _is_reset_time = None  # type: datetime.datetime
+        # Name shared by related alarms (e.g. of one piece of equipment),
+        # which are annunciated together during an alarm flood. None if the
+        # alarm is in a group of its own.
+        self.group = None  # type: Optional[str]
 
-    # The current state of the alarm.
-    # Valid states are: OFF, ON_DELAY, ALARM, OFF_DELAY
-    _state = "OFF"  # type: str
+        # The time that the alarm was put into ALARM
+        self._activation_time = None  # type: datetime.datetime
 
-    # The delay before the alarm is acted upon by logic
-    on_delay = 0.0  # type: float
+        # The time that the alarm was reset
+        self._is_reset_time = None  # type: datetime.datetime
 
-    # The delay before the alarm is marked as reset when the input is
-    # lowered.
-    off_delay = 0.0  # type: float
+        # The delay before the alarm is acted upon by logic
+        self.on_delay = 0.0  # type: float
 
-    _writer = None  # type: object
+        # The delay before the alarm is marked as reset when the input is
+        # lowered.
+        self.off_delay = 0.0  # type: float
 
-    # events that will be run on change of state this alarm.
-    _observers = {}  # type: Dict[str, Interruptable]
+        # Current timer value.
+        self._timer = None  # type: float
 
-    # Current timer value.
-    _timer = None  # type: float
+        # see handle.
+        self._handle = None  # type: int
 
     def __eq__(self, other):
-        return self.__dict__ == other.__dict__
+        if not isinstance(other, Alarm):
+            return NotImplemented
+        return self.handle == other.handle
+
+    def __hash__(self):
+        return self.handle
 
     def __init__(self, **kwargs) -> None:
         """
@@ -94,7 +131,9 @@ class Alarm(Observable):
             alarm in a timely manner.
           more_info (str): Additional information helpful in rectifing the
             alarm condition (e.g. links to: drawings, manuals, or procedures)
+          group (str): Name shared by related alarms, see AlarmHandler.
         """
+        super().__init__()
 
         for kw in kwargs:
             assert kw in self.keywords, \
@@ -102,8 +141,10 @@ class Alarm(Observable):
                 + str(kw) + "' property of Alarm, property does not exist"
             setattr(self, kw, kwargs[kw])
 
-        self._is_reset_time = datetime.datetime.now()
-        self._activation_time = datetime.datetime.now()
+        # datetimes are immutable so both can share one object.
+        now = Clock.now()
+        self._is_reset_time = now
+        self._activation_time = now
 
     def config(self) -> 'None':
         """
@@ -132,6 +173,15 @@ class Alarm(Observable):
         )
         self._name = name
 
+    @property
+    def handle(self) -> 'int':
+        """ The integer handle of the alarm. Given out when the alarm is
+        added to the database, or when it's first used for alarms that
+        aren't (e.g. the alarms of a ProcessValue). """
+        if self._handle is None:
+            self._handle = next(Alarm._handles)
+        return self._handle
+
     # description
     @property
     def description(self) -> 'str':
@@ -157,6 +207,16 @@ class Alarm(Observable):
         """ Gets the state of the alarm. """
         return self._state
 
+    # The current state of the alarm, one of STATES, kept in _flags.
+    @property
+    def _state(self) -> 'str':
+        return STATES[(self._flags & _STATE_MASK) >> _STATE_SHIFT]
+
+    @_state.setter
+    def _state(self, state: 'str') -> 'None':
+        self._flags = self._flags & ~_STATE_MASK \
+          | _STATE_INDEX[state] << _STATE_SHIFT
+
     @property
     def data_display_width(self) -> int:
         """
@@ -167,7 +227,7 @@ class Alarm(Observable):
         # Used by the HMI
         return len("ACKNOWLEDGED")
 
-    # Get the time.monotonic() where the alarm should be evaluated for a state
+    # Get the Clock.monotonic() where the alarm should be evaluated for a state
     # change, only makes sense when we're waiting on a on/off timer.
     @property
     def wake_time(self) -> 'float':
@@ -201,15 +261,48 @@ class Alarm(Observable):
     @property
     def input(self) -> 'bool':
         """ Gets the input value of the alarm. """
-        return self._input
+        return bool(self._flags & _INPUT)
 
     @input.setter
     def input(self, b: 'bool') -> 'None':
         """ Sets the input value of the alarm. """
-        if self._input != b:
-            self._input = b
+        if self.input != b:
+            self._set_flag(_INPUT, b)
             self.evaluate()
 
+    def _set_flag(self, flag: 'int', b: 'bool') -> 'None':
+        if b:
+            self._flags |= flag
+        else:
+            self._flags &= ~flag
+
+    @property
+    def blocked(self) -> 'bool':
+        """ The value which allows the operator to suppress the alarm. """
+        return bool(self._flags & _BLOCKED)
+
+    @blocked.setter
+    def blocked(self, b: 'bool') -> 'None':
+        self._set_flag(_BLOCKED, b)
+
+    @property
+    def acknowledged(self) -> 'bool':
+        """ Indicates that the alarm has been ack'd by the operator. """
+        return bool(self._flags & _ACKNOWLEDGED)
+
+    @acknowledged.setter
+    def acknowledged(self, b: 'bool') -> 'None':
+        self._set_flag(_ACKNOWLEDGED, b)
+
+    @property
+    def enabled(self) -> 'bool':
+        """ Interlock value. """
+        return bool(self._flags & _ENABLED)
+
+    @enabled.setter
+    def enabled(self, b: 'bool') -> 'None':
+        self._set_flag(_ENABLED, b)
+
     def acknowledge(self) -> 'None':
         """ Marks the alarm as acknowledged. """
         self.acknowledged = True
@@ -232,6 +325,7 @@ class Alarm(Observable):
 
         """
         notify = False  # flag to notify logic observers
+        old_state = self._state
 
         # We don't want to have the routine notify all the observers mid
         # evaluation as that could trigger another evaluation before this one is
@@ -241,7 +335,7 @@ class Alarm(Observable):
                 if self.on_delay > 0.0:
                     self._state = "ON_DELAY"
                     logger.debug(f"Alarm: {self.name} OFF->ON_DELAY")
-                    self._timer = time.monotonic()
+                    self._timer = Clock.monotonic()
                     Alarm.alarm_handler.add_alarm_timer(self)
                 else:
                     logger.debug(f"Alarm: {self.name} OFF->ALARM")
@@ -249,12 +343,14 @@ class Alarm(Observable):
 
         # ON_DELAY is used to prevent an alarm from latching in too quickly.
         # This is generally used to prevent alarm chatter.
+        # The delay is up once the wake time is reached, the AlarmHandler
+        # evaluates the alarm when its timer reaches the same wake time.
         if self._state == "ON_DELAY":
             if not self.input or not self.enabled:
                 self._state = "OFF"
                 Alarm.alarm_handler.remove_alarm_timer(self)
                 logger.debug(f"Alarm: {self.name} ON_DELAY->OFF")
-            elif time.monotonic() - self._timer >= self.on_delay:
+            elif Clock.monotonic() >= self.wake_time:
                 self._state = "NEW_ALARM"
                 Alarm.alarm_handler.remove_alarm_timer(self)
                 logger.debug(f"Alarm: {self.name} ON_DELAY->ALARM")
@@ -268,18 +364,17 @@ class Alarm(Observable):
                 self.acknowledged = False
 
             Alarm.alarm_handler.add_active_alarm(self)
-            self._activation_time = datetime.datetime.now(datetime.timezone.utc)
+            self._activation_time = Clock.now(datetime.timezone.utc)
 
             # fire off any remote notification if any
-            for notifier in Alarm.alarm_notifiers:
-                notifier.notify(self, "activated")
+            Alarm.alarm_handler.annunciate(self, "activated")
 
         # The ALARM state.
         if self._state == "ALARM":
             if not self.input or not self.enabled:
                 if self.off_delay > 0.0:
                     self._state = "OFF_DELAY"
-                    self._timer = time.monotonic()
+                    self._timer = Clock.monotonic()
                     Alarm.alarm_handler.add_alarm_timer(self)
                     logger.debug(f"Alarm: {self.name} ALARM->OFF_DELAY")
                 else:
@@ -287,8 +382,7 @@ class Alarm(Observable):
                     logger.debug(f"Alarm: {self.name} ALARM->OFF")
 
                     # fire off any remote notification if any
-                    for notifier in Alarm.alarm_notifiers:
-                        notifier.notify(self, "reset")
+                    Alarm.alarm_handler.annunciate(self, "reset")
 
         # OFF_DELAY is used to prevent the alarm from clearing too quickly.
         # This is a tool to reduce alarm chatter.
@@ -297,27 +391,35 @@ class Alarm(Observable):
                 self._state = "ALARM"
                 Alarm.alarm_handler.remove_alarm_timer(self)
                 logger.debug(f"Alarm: {self.name} OFF_DELAY->ALARM")
-            elif time.monotonic() - self._timer >= self.off_delay:
+            elif Clock.monotonic() >= self.wake_time:
                 self._state = "ALARM_RESET"
                 Alarm.alarm_handler.remove_alarm_timer(self)
                 logger.debug(f"Alarm: {self.name} OFF_DELAY->OFF")
 
                 # fire off any remote notification if any
-                for notifier in Alarm.alarm_notifiers:
-                    notifier.notify(self, "reset")
+                Alarm.alarm_handler.annunciate(self, "reset")
 
         # ALARM_RESET is a transitory state. Cleans up and returns to the OFF
         # state.
         if self._state == "ALARM_RESET":
             notify = True
             self._state = "OFF"
-            self._is_reset_time = datetime.datetime.now(datetime.timezone.utc)
+            self._is_reset_time = Clock.now(datetime.timezone.utc)
             if self.acknowledged:
                 Alarm.alarm_handler.remove_active_alarm(self)
 
+        journal = Alarm.alarm_journal
+        if journal is not None and self._state != old_state:
+            journal.record(self, old_state, self._state)
+
         if notify:
             self._notify_observers()
 
+    @property
+    def transition_value(self) -> 'Optional[float]':
+        """ The value journaled with a state transition, the input. """
+        return float(self.input)
+
     def _notify_observers(self):
         """
         Notifies all interested routines that there has been a change in the
@@ -328,11 +430,14 @@ class Alarm(Observable):
           f"Alarm: {self.description} defined without name."
         )
 
-        for key, callback in self._observers.items():
+        if not self._observers:
+            return
+
+        for key, callback in tuple(self._observers.items()):
             logger.debug(f"firing callback for {key} from {self.name}")
             callback(
               name=self.name,
-              reason="Alarm timer expired.",
+              reason=self,
             )
 
     @property
@@ -388,6 +493,7 @@ class Alarm(Observable):
         """
         d= dict(
           name=self._name,
+          handle=self.handle,
           description=self.description,
           # input=self._input,
           blocked=self.blocked,
@@ -395,6 +501,7 @@ class Alarm(Observable):
           enabled=self.enabled,
           consequences=self.consequences,
           more_info=self.more_info,
+          group=self.group,
           state=self._state,
           timer=self._timer,
           on_delay=self.on_delay,
@@ -413,13 +520,16 @@ class Alarm(Observable):
             dict: JSON dict of alarm properties.
 
         """
+        self._set_defaults()
         self._name        = d['name']
+        self._handle      = d['handle']
         self.description  = d['description']
         self.blocked      = d['blocked']
         self.acknowledged = d['acknowledged']
         self.enabled      = d['enabled']
         self.consequences = d['consequences']
         self.more_info    = d['more_info']
+        self.group        = d['group']
         self._state       = d['state']
         self._timer       = d['timer']
         self.on_delay     = d['on_delay']
@@ -437,13 +547,16 @@ class Alarm(Observable):
             dict: a dict of alarm properties.
 
         """
-        return dict(
+        d = dict(
           description=self.description,
           consequences=self.consequences,
           more_info=self.more_info,
           on_delay=self.on_delay,
           off_delay=self.off_delay,
         )
+        if self.group is not None:
+            d['group'] = self.group
+        return d
 
     # used to produce a yaml representation for config storage.
     @classmethod
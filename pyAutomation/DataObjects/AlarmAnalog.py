@@ -1,5 +1,5 @@
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from .Alarm import Alarm
 
 logger = logging.getLogger('controller')
@@ -16,6 +16,8 @@ class AlarmAnalog(Alarm):
         "hysteresis",
         "high_low_limit"]
 
+    __slots__ = ('alarm_value', 'hysteresis', 'high_low_limit', '_value')
+
     def __init__(self, **kwargs) -> None:
         """
         The constructor for AlarmAnalog class.
@@ -37,17 +39,29 @@ class AlarmAnalog(Alarm):
           more_info (str): Additional information helpful in rectifing the
             alarm condition (e.g. links to: drawings, manuals, or procedures)
         """
+        super().__init__(**kwargs)
+
+    def _set_defaults(self) -> 'None':
+        super()._set_defaults()
         self.alarm_value = 0.0
         self.hysteresis = 0.0
         self.high_low_limit = "HIGH"
 
-        super().__init__(**kwargs)
+        # the value last evaluated.
+        self._value = None  # type: Optional[float]
 
     @property
     def human_readable_value(self) -> str:
         return str(self.alarm_value)
 
+    @property
+    def transition_value(self) -> 'Optional[float]':
+        """ The value journaled with a state transition, the analog value
+        last evaluated. """
+        return self._value
+
     def evaluate_analog(self, value: 'float') -> None:
+        self._value = value
         if self.high_low_limit == "HIGH":
             if not self.input:
                 if value > self.alarm_value:
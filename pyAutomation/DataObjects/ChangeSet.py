@@ -0,0 +1,55 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, Callable, Dict, Iterator, Tuple
+    from pyAutomation.DataObjects.PointAbstract import PointAbstract
+
+
+class ChangeSet(object):
+    """ The points changed by a batch of writes (see PointManager.batch()).
+    Each observer of the points is interrupted once at the end of the batch
+    with a ChangeSet of the points it observes as the reason, rather than
+    once per point.
+
+    """
+
+    __slots__ = ('points',)
+
+    def __init__(self) -> 'None':
+        # changed points, keyed by name.
+        self.points = {}  # type: Dict[str, PointAbstract]
+
+    def add(self, point: 'PointAbstract') -> 'None':
+        self.points[point.name] = point
+
+    def __contains__(self, point: 'Any') -> 'bool':
+        """ True if the supplied point (or point name) changed. """
+        return getattr(point, 'name', point) in self.points
+
+    def __iter__(self) -> 'Iterator[PointAbstract]':
+        return iter(self.points.values())
+
+    def __len__(self) -> 'int':
+        return len(self.points)
+
+    def notify_observers(self) -> 'None':
+        """ Interrupts each observer of the changed points once, with the
+        points it observes. """
+
+        # observers are told apart by their name and callback, as the same
+        # name can be used by unrelated observers of different points.
+        changes = {}  # type: Dict[Tuple[str, Callable], ChangeSet]
+        writers = {}  # type: Dict[Tuple[str, Callable], str]
+        for point in self.points.values():
+            for key in tuple(point._observers.items()):
+                change_set = changes.get(key)
+                if change_set is None:
+                    change_set = changes[key] = ChangeSet()
+                    writers[key] = point.writer.name
+                change_set.points[point.name] = point
+
+        for key, change_set in changes.items():
+            key[1](
+              name=writers[key] + "  > batch of " + str(len(change_set)),
+              reason=change_set,
+            )
@@ -9,17 +9,41 @@ logger = logging.getLogger('controller')
 
 
 class Observable(ABC):
+    """ Base of the points and alarms. These are held in slots rather than
+    an instance dict to keep large point databases small, so every slot has
+    to be given a value in _set_defaults() (called by __init__ and by
+    __setstate__ when jsonpickle builds an object without __init__).
 
-    # name of the point in the global point dict.
-    _name = None  # type: Any
+    Subclasses that don't declare __slots__ still work, they just get an
+    instance dict as well.
 
-    # human readable description of the point
-    _description = "No description"
+    """
 
-    # object that is able to write to this point.
-    _writer = None  # type: object
+    __slots__ = (
+      # name of the point in the global point dict.
+      '_name',
 
-    _observers = {}  # type: Dict[str, Callable]
+      # human readable description of the point
+      '_description',
+
+      # object that is able to write to this point.
+      '_writer',
+
+      # observers of this object, keyed by the name of the observer. Created
+      # on the first add_observer so each instance gets its own.
+      '_observers',
+    )
+
+    def __init__(self) -> 'None':
+        self._set_defaults()
+
+    def _set_defaults(self) -> 'None':
+        """ Gives every slot its initial value. Subclasses with slots of
+        their own extend this. """
+        self._name = None  # type: Any
+        self._description = "No description"
+        self._writer = None  # type: object
+        self._observers = None  # type: Dict[str, Callable]
 
     # name
     @property
@@ -40,6 +64,8 @@ class Observable(ABC):
 
     @property
     def observers(self) -> 'Dict[str, Callable[[str, Any], str]]':
+        if self._observers is None:
+            self._observers = {}
         return self._observers
 
     def add_observer(
@@ -55,11 +81,11 @@ class Observable(ABC):
         assert name is not None, (
           "No name supplied for observer added to %s" % self.description
         )
-        self._observers.update({name: observer})
+        self.observers[name] = observer
 
         logger.info(f"observer: {name} added to point {self.name}")
 
     def del_observer(self, name: 'str') -> 'None':
         """ Removes an interseted routine from this alarm's observer list. """
-        self._observers.pop(name)
+        self.observers.pop(name)
         logger.info(f"observer: {name} removed from point {self.name}")
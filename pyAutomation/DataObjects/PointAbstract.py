@@ -1,57 +1,68 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Union
+from typing import TYPE_CHECKING, Dict, List, Any, Union
 from datetime import datetime, timedelta
+import itertools
 import logging
+import os
+import time
 
 from .PointReadOnlyAbstract import PointReadOnlyAbstract
+from .VQT import VQT
 from pyAutomation.Supervisory.Interruptable import Interruptable
+from pyAutomation.Supervisory.ChangeLog import ChangeLog
+from pyAutomation.Supervisory.Clock import Clock
+from pyAutomation.Supervisory.PointBatch import PointBatch
 from pyAutomation.Supervisory.ConfigurationException import \
     ConfigurationException
 
-logger = logging.getLogger('controller')
-
-
-class PointAbstract(PointReadOnlyAbstract, ABC):
-    ''' Extends the PointAbstract method and provides additional writing methods
-    such that a concrete read/write point can be derived from this class '''
-
-    # Quality of the point
-    _quality = False  # type: bool
-
-    # Current value of the point.
-    _value = None  # type: Any
-
-    # the time the point should be next updated.
-    _next_update = datetime.now()  # type: datetime
-
-    # the time the point was last updated.
-    _last_update = datetime.now()  # type: datetime
-
-    # value being requested of the point by a non-owner process
-    _request_value = None  # type: object
+if TYPE_CHECKING:
+    from pyAutomation.Supervisory.PointStore import PointStore
+    from typing import Optional, Tuple
 
-    # point will accept requested values from non-owner processes.
-    requestable = False  # type: bool
+logger = logging.getLogger('controller')
 
-    # should the value of this point persist past a restart?
-    retentive = False
+# Bits of PointAbstract._flags. The boolean settings of a point are packed
+# into a single int to keep the per point size down.
+_REQUESTABLE = 0x01
+_RETENTIVE = 0x02
+_FORCED = 0x04
+_HMI_WRITEABLE = 0x08
+_WRITE_REQUEST = 0x10
+_SHARED = 0x20
 
-    # Point is in a forced state (i.e. the value is only writable from
-    # the HMI/Programmer)
-    _forced = False  # type: bool
+# Bumped by every write of the value, quality and last update of a point
+# that isn't bound to a PointStore, so a reader can tell that a write ran
+# while it read them, see PointAbstract._read(). A single counter shared by
+# every point keeps the per point size down, next() on it is atomic.
+_epochs = itertools.count(1)
+_epoch = 0
 
-    # point can be requested by HMI
-    hmi_writeable = False  # type: bool
+# reads of a point being written retried before the reader yields the CPU.
+READ_SPINS = 4
 
-    # This value is queued to be written to a remote device.
-    write_request = None  # type: object
+# sleep(0) releases the GIL where sched_yield isn't available.
+_yield = getattr(os, 'sched_yield', None) or (lambda: time.sleep(0))
 
-    # How often the point value should be refreshed.
-    update_period = None  # type: Union[timedelta, None]
 
-    _writer = None  # type: Interruptable
+class PointAbstract(PointReadOnlyAbstract, ABC):
+    ''' Extends the PointAbstract method and provides additional writing methods
+    such that a concrete read/write point can be derived from this class '''
 
-    _name = None  # type: str
+    __slots__ = (
+      '_local_value',
+      '_local_quality',
+      '_local_update_ns',
+      '_request_value',
+      '_flags',
+      '_period_ns',
+      '_store',
+      '_handle',
+      '_readonly_view',
+    )
+
+    # every change to the value, quality or forced state of a point in this
+    # process is numbered and logged here, see PointManager.changed_since.
+    change_log = ChangeLog()
 
     _keywords = [
       'description',
@@ -62,6 +73,41 @@ class PointAbstract(PointReadOnlyAbstract, ABC):
       'update_period'
     ]
 
+    def _set_defaults(self) -> 'None':
+        super()._set_defaults()
+
+        # The row of the PointStore holding the value, quality, last update
+        # and forced state of the point, see bind(). The _local_ slots hold
+        # them while the point isn't bound to a store.
+        self._store = None  # type: PointStore
+        self._handle = None  # type: int
+
+        # Times are kept as Clock.monotonic_ns() values, the datetimes of
+        # next_update and last_update are only made when they are read.
+
+        # value, quality and last update of the point. The last update is
+        # None while they are being written, see _write().
+        self._local_value = None  # type: Any
+        self._local_quality = False  # type: bool
+        self._local_update_ns = 0  # type: Optional[int]
+
+        # value being requested of the point by a non-owner process
+        self._request_value = None  # type: object
+
+        # requestable, retentive, forced, hmi_writeable and write_request,
+        # see the properties of the same names, and whether changes are
+        # published to the SharedPointTable of the store (set in the process
+        # that owns the point when the point database is shared between
+        # processes).
+        self._flags = 0  # type: int
+
+        # How often the point value should be refreshed, see update_period.
+        self._period_ns = None  # type: Union[int, None]
+
+        # the read only view of the point, made on the first readonly_object
+        # and shared by every reader.
+        self._readonly_view = None  # type: PointReadOnlyAbstract
+
     def configure_parameters(self, **kwargs: 'str') -> 'None':
         if 'update_period' in kwargs:
             s = kwargs['update_period']
@@ -92,50 +138,193 @@ class PointAbstract(PointReadOnlyAbstract, ABC):
     def config(self):
         pass
 
+    def bind(self, store: 'PointStore', handle: 'int') -> 'None':
+        """ Moves the value, quality, last update and forced state of the
+        point into row handle of store. The point is a view of the row from
+        then on. """
+        value, quality, update_ns = self._read()
+        forced = self.forced
+
+        self._store = store
+        self._handle = handle
+        store.write(handle, value, quality, update_ns)
+        store.set_forced(handle, forced)
+
+    def unbind(self) -> 'None':
+        """ Moves the state of the point back out of its PointStore. """
+        if self._store is None:
+            return
+        vqt = self._read()
+        forced = self.forced
+
+        self._store = None
+        self._handle = None
+        self._write(*vqt)
+        self._set_flag(_FORCED, forced)
+        self._set_flag(_SHARED, False)
+
+    # Storage of the value, quality and last update, in the PointStore if
+    # the point is bound to one. Changes to more than one of them are made
+    # with _write() so that readers never see part of the change.
+    # A point is only written by one thread at a time. Without a store the
+    # last update is cleared for the duration of the write and the shared
+    # epoch bumped before it's restored, the way the sequence number of a
+    # PointStore row is, so _read() never returns part of a write.
+    def _write(
+      self,
+      value: 'Any',
+      quality: 'bool',
+      update_ns: 'int',
+    ) -> 'None':
+        global _epoch
+        if self._store is None:
+            self._local_update_ns = None
+            self._local_value = value
+            self._local_quality = quality
+            _epoch = next(_epochs)
+            self._local_update_ns = update_ns
+        else:
+            self._store.write(self._handle, value, quality, update_ns)
+
+    @property
+    def _value(self) -> 'Any':
+        if self._store is None:
+            return self._local_value
+        return self._store.value(self._handle)
+
+    @_value.setter
+    def _value(self, v: 'Any') -> 'None':
+        if self._store is None:
+            _, q, t = self._read()
+            self._write(v, q, t)
+        else:
+            self._store.set_value(self._handle, v)
+
+    @property
+    def _quality(self) -> 'bool':
+        if self._store is None:
+            return self._local_quality
+        return self._store.quality(self._handle)
+
+    @_quality.setter
+    def _quality(self, q: 'bool') -> 'None':
+        if self._store is None:
+            v, _, t = self._read()
+            self._write(v, q, t)
+        else:
+            self._store.set_quality(self._handle, q)
+
+    @property
+    def _update_ns(self) -> 'int':
+        if self._store is None:
+            return self._read()[2]
+        return self._store.timestamp(self._handle)
+
+    @_update_ns.setter
+    def _update_ns(self, ns: 'int') -> 'None':
+        if self._store is None:
+            v, q, _ = self._read()
+            self._write(v, q, ns)
+        else:
+            self._store.set_timestamp(self._handle, ns)
+
+    # The value, quality and time of the last update of the point, all from
+    # the same update even while the writer updates the point on another
+    # thread. Read this rather than the separate properties when they have
+    # to agree, e.g. to send them to the HMI.
+    @property
+    def vqt(self) -> 'VQT':
+        return VQT._make(self._read())
+
+    def _read(self) -> 'Tuple[Any, bool, int]':
+        """ The stored (value, quality, last update), see vqt. """
+        if self._store is not None:
+            return self._store.read(self._handle)
+
+        spins = 0
+        while True:
+            update_ns = self._local_update_ns
+            if update_ns is not None:
+                epoch = _epoch
+                value = self._local_value
+                quality = self._local_quality
+                if epoch == _epoch and self._local_update_ns == update_ns:
+                    return value, quality, update_ns
+
+            # the writer may have been preempted mid write, let it finish
+            # rather than spinning on the point.
+            spins += 1
+            if spins >= READ_SPINS:
+                _yield()
+
     # value
     @property
     def value(self) -> 'Any':
-        return self._value
+        if self._store is None:
+            return self._local_value
+        return self._store.value(self._handle)
 
     @value.setter
     def value(self, v: 'Any'):
-        if not self.forced:
-            self._quality = True
-            self.last_update = datetime.now()
-            try:
-                if self.update_period is not None\
-                  and self.update_period > timedelta.min:
-                    while self.next_update < datetime.now():
-                        self.next_update += self.update_period
-            except AttributeError:
-                self.update_period = None
-
-            try:
-                if self._value != v:
-                    self._value = v
-                    self.write_request = True
-
-                    # don't fire callbacks unless it's coming from a valid
-                    # thread. (i.e. we're currently starting up.)
-
-                    if self._writer is not None:
-                        assert self.name is not None, (
-                          f'"{self.description}" attempted callback without '
-                          f'a writer object.'
-                        )
-
-                        assert self.name != '', (
-                          f'{self.description} attempted callback without '
-                          f'an identifer.'
-                        )
-
-                        for callback in self._observers.values():
-                            callback(
-                              name=self._writer.name + "  > " + self.name
-                            )
-
-            except AttributeError:
-                self._value = v
+        # This is the busiest path of the drivers, so the clock is read once
+        # and the flags and the store are used directly.
+        store = self._store
+        if store is None:
+            if self._flags & _FORCED:
+                return
+        elif store.forced(self._handle):
+            return
+
+        now = Clock.monotonic_ns()
+
+        # the value, quality and time are written together.
+        if store is None:
+            old = self._local_value
+            changed = old != v
+            self._write(v if changed else old, True, now)
+        else:
+            old = store.value(self._handle)
+            changed = old != v
+            store.write(self._handle, v if changed else old, True, now)
+
+        if changed:
+            self._flags |= _WRITE_REQUEST
+            self._notify_observers()
+
+    def _notify_observers(self) -> 'None':
+        """ Interrupts the observers of this point. The point itself is
+        passed as the reason so that observers can tell which of their points
+        changed. Inside a PointManager.batch() the point is added to the
+        batch's ChangeSet instead. """
+
+        PointAbstract.change_log.record(self)
+
+        if self._flags & _SHARED:
+            self._store.shared_table.publish(self)
+
+        # don't fire callbacks unless it's coming from a valid
+        # thread. (i.e. we're currently starting up.)
+        if self._writer is not None and self._observers:
+            assert self.name is not None, (
+              f'"{self.description}" attempted callback without '
+              f'a writer object.'
+            )
+
+            assert self.name != '', (
+              f'{self.description} attempted callback without '
+              f'an identifer.'
+            )
+
+            change_set = PointBatch.current()
+            if change_set is not None:
+                change_set.add(self)
+                return
+
+            for callback in tuple(self._observers.values()):
+                callback(
+                  name=self._writer.name + "  > " + self.name,
+                  reason=self,
+                )
 
     # Description
     @property
@@ -163,40 +352,115 @@ class PointAbstract(PointReadOnlyAbstract, ABC):
 
         self._writer = w
 
+    def _set_flag(self, flag: 'int', b: 'bool') -> 'None':
+        if b:
+            self._flags |= flag
+        else:
+            self._flags &= ~flag
+
+    # point will accept requested values from non-owner processes.
+    @property
+    def requestable(self) -> 'bool':
+        return bool(self._flags & _REQUESTABLE)
+
+    @requestable.setter
+    def requestable(self, b: 'bool') -> 'None':
+        self._set_flag(_REQUESTABLE, b)
+
+    # should the value of this point persist past a restart?
+    @property
+    def retentive(self) -> 'bool':
+        return bool(self._flags & _RETENTIVE)
+
+    @retentive.setter
+    def retentive(self, b: 'bool') -> 'None':
+        self._set_flag(_RETENTIVE, b)
+
+    # point can be requested by HMI
+    @property
+    def hmi_writeable(self) -> 'bool':
+        return bool(self._flags & _HMI_WRITEABLE)
+
+    @hmi_writeable.setter
+    def hmi_writeable(self, b: 'bool') -> 'None':
+        self._set_flag(_HMI_WRITEABLE, b)
+
+    # This value is queued to be written to a remote device.
+    @property
+    def write_request(self) -> 'bool':
+        return bool(self._flags & _WRITE_REQUEST)
+
+    @write_request.setter
+    def write_request(self, b: 'bool') -> 'None':
+        self._set_flag(_WRITE_REQUEST, b)
+
     # The Hmi is allowed to edit the point
     @property
     def hmi_editable(self):
         return self.hmi_requestable or self.forced
 
+    # How often the point value should be refreshed.
+    @property
+    def update_period(self) -> 'Union[timedelta, None]':
+        if self._period_ns is None:
+            return None
+        return timedelta(microseconds=self._period_ns // 1000)
+
+    @update_period.setter
+    def update_period(self, period: 'Union[timedelta, None]') -> 'None':
+        if period is None:
+            self._period_ns = None
+        else:
+            ns = (period.days * 86400 + period.seconds) * 1000000000 \
+              + period.microseconds * 1000
+            assert ns > 0, \
+                f"invalid update period: {period} supplied for " \
+                f"{self.description}"
+            self._period_ns = ns
+
     # The time that the point should be updated next.
     @property
     def next_update(self) -> datetime:
-        try:
-            if self.update_period is not None:
-                return self._next_update
-            else:
-                return datetime.max
-        except AttributeError:
-            return datetime.max
-
-    @next_update.setter
-    def next_update(self, nu) -> None:
-        self._next_update = nu
+        if self._period_ns is not None:
+            return Clock.to_datetime(self.next_update_ns)
+        return datetime.max
+
+    # The time that the point should be updated next as Clock.monotonic_ns(),
+    # None if it isn't updated periodically. The drivers are scheduled on
+    # this, next_update is for display. It isn't stored: updates fall on
+    # whole multiples of the period, and the next one is the first after the
+    # point was last written, so any number of missed periods are skipped.
+    @property
+    def next_update_ns(self) -> 'Optional[int]':
+        period = self._period_ns
+        if period is None:
+            return None
+        return (self._written_ns // period + 1) * period
+
+    # The time the writer last wrote the point, which the update schedule
+    # follows.
+    @property
+    def _written_ns(self) -> 'int':
+        return self._update_ns
 
-    #  forced
+    # Point is in a forced state (i.e. the value is only writable from
+    # the HMI/Programmer)
     @property
     def forced(self) -> bool:
-        return self._forced
+        if self._store is None:
+            return bool(self._flags & _FORCED)
+        return self._store.forced(self._handle)
 
     @forced.setter
     def forced(self, value: bool) -> None:
-        if not hasattr(self, "_forced"):
-            self._forced = value
-            self._last_update = datetime.now()
-        elif self._forced != value:
-            self._forced = value
-            self._last_update = datetime.now()
-        if self._forced is False:
+        if self.forced != value:
+            if self._store is None:
+                self._set_flag(_FORCED, value)
+            else:
+                self._store.set_forced(self._handle, value)
+            self._update_ns = Clock.monotonic_ns()
+            PointAbstract.change_log.record(self)
+        if not value:
             # Fire the writer to reset the point to its correct value.
             if self.writer is not None:
                 self.writer.interrupt(
@@ -204,18 +468,20 @@ class PointAbstract(PointReadOnlyAbstract, ABC):
                   reason = self,
                 )
 
+    # sequence number of the last change to the point, 0 once it has left
+    # the change_log, see ChangeLog.seq_of.
+    @property
+    def change_seq(self) -> 'int':
+        return PointAbstract.change_log.seq_of(self)
+
     # last update
     @property
     def last_update(self) -> datetime:
-        try:
-            return self._last_update
-        except AttributeError:
-            self._last_update = datetime.now()
-            return self._last_update
+        return Clock.to_datetime(self._update_ns)
 
     @last_update.setter
     def last_update(self, d: datetime):
-        self._last_update = d
+        self._update_ns = Clock.to_monotonic_ns(d)
 
     # name
     @property
@@ -237,9 +503,9 @@ class PointAbstract(PointReadOnlyAbstract, ABC):
 
     @quality.setter
     def quality(self, value) -> 'None':
-        if not self._forced and self._quality != value:
-            self._quality = value
-            self._last_update = datetime.now()
+        if not self.forced and self._quality != value:
+            self._write(self._value, value, Clock.monotonic_ns())
+            self._notify_observers()
 
     # Get and set the requested value from non-owner processes.
     @property
@@ -278,12 +544,12 @@ class PointAbstract(PointReadOnlyAbstract, ABC):
         # Note that the behaviour changes depending upon if the point is
         # forced or not. A forced point is written directly to, an unforced
         # point has a entry made in the request field.
-        if self._forced:
+        if self.forced:
             if self.value != value:
                 logger.error(
                   "Doing a forced write of %s to %s", value, self.description)
-                self.forced_value = value
-                self._last_update = datetime.now()
+                self._write(value, self._quality, Clock.monotonic_ns())
+                PointAbstract.change_log.record(self)
                 assert self.value == value, \
                     "Forcing " + value + " to " + self.description + " failed."
             else:
@@ -311,27 +577,31 @@ class PointAbstract(PointReadOnlyAbstract, ABC):
 
     # values for live object data for transport over JSON.
     def __getstate__(self) -> 'Dict[str, Any]':
+        value, quality, update_ns = self._read()
         return dict(
             name=self._name,
             description=self.description,
-            value=self._value,
+            value=value,
             requestable=self.requestable,
             # _request_value=self._request_value,
-            forced=self._forced,
-            last_update=self._last_update,
+            forced=self.forced,
+            last_update=Clock.to_datetime(update_ns),
             hmi_writeable=self.hmi_writeable,
-            quality=self._quality,
+            quality=quality,
         )
 
     def __setstate__(self, d: 'Dict[str, Any]') -> 'None':
+        self._set_defaults()
         self._name = d['name']
         self.description = d['description']
-        self._value = d['value']
+        self._write(
+          d['value'],
+          d['quality'],
+          Clock.to_monotonic_ns(d['last_update']),
+        )
         self.requestable = d['requestable']
-        self._forced = d['forced']
-        self._last_update = d['last_update']
+        self._set_flag(_FORCED, d['forced'])
         self.hmi_writeable = d['hmi_writeable']
-        self._quality = d['quality']
 
     # used to produce a yaml representation for config storage.
     @property
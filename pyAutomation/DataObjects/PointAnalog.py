@@ -1,23 +1,52 @@
 from .PointReadOnly import PointReadOnly
 from .PointAbstract import PointAbstract
 from .PointAnalogReadOnlyAbstract import PointAnalogReadOnlyAbstract
-from typing import Dict, List, Any
+from pyAutomation.Supervisory.Clock import Clock
+from typing import TYPE_CHECKING, Dict, List, Any
+
+if TYPE_CHECKING:
+    from typing import Optional
+
+# the value setter of every point, used when there's no deadband.
+_set_value = PointAbstract.value.fset
+
+# indexes of PointAnalog._report after the three settings.
+_RAW = 3
+_WRITTEN_NS = 4
 
 
 class PointAnalog(PointAbstract, PointAnalogReadOnlyAbstract):
     """ Concrete implementation of an Analog point. Stores values as floats.
     PointAnalogs can be quantized or continous.
+
+    Noisy inputs can be given a deadband, an absolute amount (deadband) or
+    a percentage of the reported value (deadband_percent) that the value
+    has to move by before it's reported. Writes inside the deadband only
+    change raw_value: value, last_update and the observers are left alone.
+    max_report_interval (seconds) reports the value at least that often
+    even if it hasn't moved, so consumers can tell a quiet input from a
+    dead one.
     """
 
-    yaml_tag = u'!PointAnalog'
+    __slots__ = ('_u_of_m', '_report')
 
-    _value = 0.0  # type: 'float'
-    _u_of_m = None  # type: 'str'
-    _name = None  # type: 'str'
+    yaml_tag = u'!PointAnalog'
 
     def __init__(self, **kwargs: 'str') -> 'None':
+        super().__init__()
         super().configure_parameters(**kwargs)
 
+    def _set_defaults(self) -> 'None':
+        super()._set_defaults()
+        self._value = 0.0  # type: float
+        self._u_of_m = None  # type: str
+
+        # [deadband, deadband_percent, max report interval in nanoseconds,
+        # last value written (see raw_value), time it was written], None if
+        # every change is reported. The list is replaced when a setting
+        # changes, so the settings are always read together.
+        self._report = None  # type: Optional[List[Any]]
+
     @property
     def name(self) -> 'str':
         return self._name
@@ -26,13 +55,118 @@ class PointAnalog(PointAbstract, PointAnalogReadOnlyAbstract):
     def name(self, name) -> 'None':
         self._name = name
 
+    # value
     @property
     def value(self) -> 'float':
-        return self._value
+        if self._store is None:
+            return self._local_value
+        return self._store.value(self._handle)
 
     @value.setter
-    def value(self, val: 'float') -> 'None':
-        self._value = val
+    def value(self, v: 'float') -> 'None':
+        report = self._report
+        if report is None:
+            _set_value(self, v)
+
+        else:
+            report[_RAW] = v
+            if self.forced:
+                return
+            old = self.value
+            now = Clock.monotonic_ns()
+
+            # keeps the update schedule as the driver did read the point,
+            # even if the write is in the deadband.
+            report[_WRITTEN_NS] = now
+            if self._in_deadband(old, v, now, report):
+                return
+
+            _set_value(self, v)
+            if old == v:
+                # reported because the max report interval is up (or the
+                # quality came back), tell the observers it's still current.
+                self._notify_observers()
+
+    def _in_deadband(
+      self,
+      old: 'float',
+      v: 'float',
+      now: 'int',
+      report: 'List[Any]',
+    ) -> 'bool':
+        """ True if writing v shouldn't be reported. """
+        if old is None or v is None or not self.quality:
+            return False
+
+        deadband, deadband_percent, max_report_ns = report[:_RAW]
+        if max_report_ns is not None \
+          and now - self._update_ns >= max_report_ns:
+            return False
+
+        band = 0.0
+        if deadband is not None:
+            band = deadband
+        if deadband_percent is not None:
+            band = max(band, abs(old) * deadband_percent / 100.0)
+        return abs(v - old) <= band
+
+    # The last value written to the point, including writes inside the
+    # deadband.
+    @property
+    def raw_value(self) -> 'float':
+        report = self._report
+        if report is None or report[_RAW] is None:
+            return self.value
+        return report[_RAW]
+
+    @property
+    def _written_ns(self) -> 'int':
+        report = self._report
+        if report is None or report[_WRITTEN_NS] is None:
+            return self._update_ns
+        return report[_WRITTEN_NS]
+
+    def _set_report(self, index: 'int', setting: 'Any') -> 'None':
+        report = list(self._report or (None, None, None, None, None))
+        report[index] = setting
+        if report[:_RAW] == [None, None, None]:
+            self._report = None
+        else:
+            self._report = report
+
+    @property
+    def deadband(self) -> 'Optional[float]':
+        return None if self._report is None else self._report[0]
+
+    @deadband.setter
+    def deadband(self, value: 'Optional[float]') -> 'None':
+        assert value is None or value >= 0.0, \
+            f"invalid deadband: {value} supplied for {self.description}"
+        self._set_report(0, value)
+
+    @property
+    def deadband_percent(self) -> 'Optional[float]':
+        return None if self._report is None else self._report[1]
+
+    @deadband_percent.setter
+    def deadband_percent(self, value: 'Optional[float]') -> 'None':
+        assert value is None or value >= 0.0, \
+            f"invalid deadband_percent: {value} supplied for " \
+            f"{self.description}"
+        self._set_report(1, value)
+
+    @property
+    def max_report_interval(self) -> 'Optional[float]':
+        if self._report is None or self._report[2] is None:
+            return None
+        return self._report[2] / 1e9
+
+    @max_report_interval.setter
+    def max_report_interval(self, value: 'Optional[float]') -> 'None':
+        assert value is None or value > 0.0, \
+            f"invalid max_report_interval: {value} supplied for " \
+            f"{self.description}"
+        self._set_report(2, None if value is None else int(value * 1e9))
 
     @property
     def u_of_m(self) -> 'str':
@@ -44,7 +178,12 @@ class PointAnalog(PointAbstract, PointAnalogReadOnlyAbstract):
 
     @property
     def keywords(self) -> 'List[str]':
-        return super().keywords + ['u_of_m']
+        return super().keywords + [
+          'u_of_m',
+          'deadband',
+          'deadband_percent',
+          'max_report_interval',
+        ]
 
     # human readable value
     @property
@@ -75,7 +214,9 @@ class PointAnalog(PointAbstract, PointAnalogReadOnlyAbstract):
     # Return readonly and read/write copies of this object.
     @property
     def readonly_object(self) -> 'PointReadOnly':
-        return PointReadOnly(self)
+        if self._readonly_view is None:
+            self._readonly_view = PointReadOnly(self)
+        return self._readonly_view
 
     @property
     def readwrite_object(self) -> 'PointAnalog':
@@ -84,18 +225,23 @@ class PointAnalog(PointAbstract, PointAnalogReadOnlyAbstract):
     # values for live object data for transport over JSON.
     def __getstate__(self) -> 'Dict[str, Any]':
         d = super().__getstate__()
-        d.update({'u_of_m': self.u_of_m})
+        d.update({'u_of_m': self.u_of_m, 'raw_value': self.raw_value})
         return d
 
     def __setstate__(self, d: 'Dict[str, Any]') -> 'None':
         super().__setstate__(d)
         self._u_of_m = d['u_of_m']
+        if self._report is not None:
+            self._report[_RAW] = d['raw_value']
 
     # YAML representation for configuration storage.
     @property
     def yaml_dict(self) -> 'Dict[str, Any]':
         d = super().yaml_dict
         d.update({'u_of_m': self.u_of_m})
+        for kw in ('deadband', 'deadband_percent', 'max_report_interval'):
+            if getattr(self, kw) is not None:
+                d[kw] = getattr(self, kw)
         return d
 
     # used to produce a yaml representation for config storage.
@@ -4,4 +4,4 @@ from .PointAbstract import PointAbstract
 
 
 class PointAnalogAbstract(PointAbstract, PointAnalogReadOnlyAbstract, ABC):
-    pass
+    __slots__ = ()
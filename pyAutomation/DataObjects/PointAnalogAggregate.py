@@ -0,0 +1,374 @@
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from .ChangeSet import ChangeSet
+from .PointAnalogReadOnlyAbstract import PointAnalogReadOnlyAbstract
+from .PointReadOnlyAbstract import PointReadOnlyAbstract
+from .VQT import VQT
+from pyAutomation.Supervisory.Interruptable import Interruptable
+from pyAutomation.Supervisory.Clock import Clock
+
+if TYPE_CHECKING:
+    from typing import Any, Dict, List, Optional
+
+
+def _median(values: 'List[float]') -> 'float':
+    values = sorted(values)
+    middle = len(values) // 2
+    if len(values) % 2:
+        return values[middle]
+    return (values[middle - 1] + values[middle]) / 2.0
+
+
+def _default_min_good(mode: 'str') -> 'int':
+    return 2 if mode == '2oo3' else 1
+
+
+def _chain(point: 'Any') -> 'List[Any]':
+    """ point and the points it wraps. Any of them can be the reason passed
+    to the observers of point: views pass on the callbacks of the point
+    they wrap, scaled points and process values pass themselves and a
+    batch passes the points written. """
+    chain = [point]
+    while True:
+        inner = getattr(point, '_source', None)
+        if inner is None:
+            inner = getattr(point, '_point', None)
+        if inner is None:
+            return chain
+        point = inner
+        chain.append(point)
+
+
+class PointAnalogAggregate(
+  PointReadOnlyAbstract,
+  PointAnalogReadOnlyAbstract,
+  Interruptable,
+):
+    """ A read only analog point worked out from a set of redundant inputs,
+    e.g. a tank level read by three transmitters. The mode sets how:
+
+        average, median, min, max: of the inputs with good quality.
+
+        2oo3: two out of three voting, the median of the inputs with good
+          quality. Needs three inputs and a tolerance, the quality is bad
+          unless at least two (min_good) inputs are within tolerance of
+          the median.
+
+    Inputs with bad quality are always left out, the point has bad quality
+    once fewer than min_good inputs are left. The median and 2oo3 modes
+    also leave out inputs further than tolerance from the median of the
+    good inputs, so a transmitter that drifts is outvoted by the others.
+
+    The point observes its inputs. When one changes only that input is read
+    again, the value is worked out from the inputs last read and the
+    observers of the point are interrupted if the value or quality changed.
+
+    """
+
+    __slots__ = (
+      '_points',
+      '_mode',
+      '_tolerance',
+      '_min_good',
+
+      # value, quality and monotonic time of the last update of each input
+      # as last read, and the index of the inputs by the id of the point
+      # that can interrupt for them, see interrupt().
+      '_inputs',
+      '_index',
+
+      '_value',
+      '_quality',
+      '_update_ns',
+      'write_request',
+    )
+
+    modes = ('average', 'median', 'min', 'max', '2oo3')
+
+    def __init__(
+      self,
+      points: 'List[PointAnalogReadOnlyAbstract]',
+      description: 'str',
+      mode: 'str' = 'average',
+      tolerance: 'Optional[float]' = None,
+      min_good: 'Optional[int]' = None,
+    ) -> 'None':
+        super().__init__()
+
+        assert mode in PointAnalogAggregate.modes, \
+          f"invalid mode: {mode} supplied for {description}"
+        assert len(points) > 0, \
+          f"no points supplied for {description}"
+        if mode == '2oo3':
+            assert len(points) == 3, \
+              f"2oo3 needs 3 points, {len(points)} supplied for " \
+              f"{description}"
+            assert tolerance is not None, \
+              f"no tolerance supplied for 2oo3 voting of {description}"
+        if min_good is None:
+            min_good = _default_min_good(mode)
+        assert 0 < min_good <= len(points), \
+          f"invalid min_good: {min_good} supplied for {description}"
+
+        self._points = list(points)
+        self._description = description
+        self._mode = mode
+        self._tolerance = tolerance
+        self._min_good = min_good
+
+    def _set_defaults(self) -> 'None':
+        super()._set_defaults()
+        self._points = []  # type: List[PointAnalogReadOnlyAbstract]
+        self._mode = 'average'  # type: str
+        self._tolerance = None  # type: Optional[float]
+        self._min_good = 1  # type: int
+        self._inputs = []  # type: List[Any]
+        self._index = {}  # type: Dict[int, List[int]]
+        self._value = 0.0  # type: float
+        self._quality = False  # type: bool
+        self._update_ns = 0  # type: int
+        self.write_request = False  # type: bool
+
+    def config(self) -> 'None':
+        self._index = {}
+        for i, p in enumerate(self._points):
+            for point in _chain(p):
+                indexes = self._index.setdefault(id(point), [])
+                if i not in indexes:
+                    indexes.append(i)
+            p.add_observer(self.name, self.interrupt)
+        super().sanity_check()
+
+        self._inputs = [p.vqt for p in self._points]
+        self._update()
+
+    # callback sent to points that feed this object.
+    def interrupt(
+      self,
+      name: 'str',
+      reason: 'Any',
+    ) -> 'None':
+        points = reason if isinstance(reason, ChangeSet) else (reason,)
+        for point in points:
+            indexes = self._index.get(id(point))
+            if indexes is None:
+                # not one of ours, read them all.
+                self._inputs = [p.vqt for p in self._points]
+                break
+            for i in indexes:
+                self._inputs[i] = self._points[i].vqt
+
+        if self._update():
+            self.write_request = True
+            for callback in tuple(self.observers.values()):
+                callback(name=name + ">" + self.name, reason=self)
+
+    def _update(self) -> 'bool':
+        """ Works out the value and quality from the inputs, returns True if
+        either changed. """
+        good = [vqt for vqt in self._inputs if vqt.quality]
+        value = self._value
+        quality = False
+
+        if len(good) >= self._min_good:
+            values = [vqt.value for vqt in good]
+            mode = self._mode
+            if mode == 'average':
+                value = sum(values) / len(values)
+            elif mode == 'min':
+                value = min(values)
+            elif mode == 'max':
+                value = max(values)
+            else:
+                value = _median(values)
+                if self._tolerance is not None:
+                    good = [
+                      vqt for vqt in good
+                      if abs(vqt.value - value) <= self._tolerance
+                    ]
+                    if len(good) >= self._min_good:
+                        value = _median([vqt.value for vqt in good])
+            quality = len(good) >= self._min_good
+
+        if quality:
+            update_ns = max(vqt.timestamp for vqt in good)
+            if update_ns > self._update_ns:
+                self._update_ns = update_ns
+
+        changed = value != self._value or quality != self._quality
+        self._value = value
+        self._quality = quality
+        return changed
+
+    # get the engineering units value
+    @property
+    def value(self) -> 'float':
+        return self._value
+
+    @property
+    def vqt(self) -> 'VQT':
+        return VQT(self._value, self._quality, self._update_ns)
+
+    @property
+    def mode(self) -> 'str':
+        return self._mode
+
+    @property
+    def tolerance(self) -> 'Optional[float]':
+        return self._tolerance
+
+    @property
+    def min_good(self) -> 'int':
+        return self._min_good
+
+    @property
+    def points(self) -> 'List[PointAnalogReadOnlyAbstract]':
+        return self._points
+
+    # human readable value
+    @property
+    def human_readable_value(self):
+        return str(round(self._value, 2))
+
+    # data display width
+    @property
+    def data_display_width(self) -> int:
+        return 8
+
+    # HMI window type
+    @property
+    def hmi_object_name(self) -> str:
+        return "PointAnalogWindow"
+
+    @property
+    def hmi_writeable(self) -> 'bool':
+        return False
+
+    @property
+    def forced(self) -> bool:
+        return any(p.forced for p in self._points)
+
+    @property
+    def hmi_value(self) -> str:
+        return str(self.value)
+
+    @property
+    def last_update(self) -> 'datetime':
+        return Clock.to_datetime(self._update_ns)
+
+    @property
+    def next_update(self) -> 'datetime':
+        return min(p.next_update for p in self._points)
+
+    @property
+    def next_update_ns(self) -> 'Optional[int]':
+        updates = [
+          ns for ns in (p.next_update_ns for p in self._points)
+          if ns is not None
+        ]
+        return min(updates) if updates else None
+
+    @property
+    def readonly(self) -> 'bool':
+        return True
+
+    @property
+    def quality(self):
+        return self._quality
+
+    # Unit of measure
+    @property
+    def u_of_m(self) -> str:
+        return self._points[0].u_of_m
+
+    # Description
+    @property
+    def description(self) -> str:
+        return self._description
+
+    # name
+    @property
+    def name(self) -> 'str':
+        return self._name
+
+    @name.setter
+    def name(self, value) -> 'None':
+        self._name = value
+
+    # Writer
+    @property
+    def writer(self) -> object:
+        return None
+
+    @property
+    def readonly_object(self) -> 'PointAnalogReadOnlyAbstract':
+        return self
+
+    @property
+    def readwrite_object(self) -> 'PointAnalogAggregate':
+        assert False, \
+          f"Cannot get a writable object from a {type(self).__name__}"
+
+    # The dict property is what is used by jsonpickle to transport the object
+    # over the network.
+    def __getstate__(self) -> 'Dict[str, Any]':
+        d = {
+          'name': self._name,
+          'value': self._value,
+          'quality': self._quality,
+          'description': self._description,
+          'last_update': self.last_update,
+          'mode': self._mode,
+          'tolerance': self._tolerance,
+          'min_good': self._min_good,
+          'points': self._points,
+        }
+        return d
+
+    def __setstate__(self, d: 'Dict[str, Any]') -> 'None':
+        self._set_defaults()
+        self._name        = d['name']
+        self._value       = d['value']
+        self._description = d['description']
+        self._update_ns   = Clock.to_monotonic_ns(d['last_update'])
+        self._quality     = d['quality']
+        self._mode        = d['mode']
+        self._tolerance   = d['tolerance']
+        self._min_good    = d['min_good']
+        self._points      = d['points']
+
+    # YAML representation for configuration storage.
+    @property
+    def yaml_dict(self) -> 'Dict[str, Any]':
+        d = {
+          'points': self._points,
+          'description': self._description,
+          'mode': self._mode,
+        }
+        if self._tolerance is not None:
+            d['tolerance'] = self._tolerance
+        if self._min_good != _default_min_good(self._mode):
+            d['min_good'] = self._min_good
+        return d
+
+    # used to produce a yaml representation for config storage.
+    @classmethod
+    def to_yaml(cls, dumper, node):
+        return dumper.represent_mapping(
+          u'!PointAnalogAggregate',
+          node.yaml_dict)
+
+    @classmethod
+    def from_yaml(cls, constructor, node):
+        value = constructor.construct_mapping(node, deep=True)
+
+        p = PointAnalogAggregate(
+          description = value['description'],
+          points      = value['points'],
+          mode        = value.get('mode', 'average'),
+          tolerance   = value.get('tolerance'),
+          min_good    = value.get('min_good'),
+        )
+
+        return p
@@ -1,23 +1,14 @@
-from datetime import datetime
-from typing import Dict, Any, Callable
+from typing import Dict, Any
 
+from .PointAnalogAggregate import PointAnalogAggregate
 from .PointAnalogReadOnlyAbstract import PointAnalogReadOnlyAbstract
-from .PointReadOnlyAbstract import PointReadOnlyAbstract
-from pyAutomation.Supervisory.Interruptable import Interruptable
 
 
-class PointAnalogDual(
-  PointReadOnlyAbstract,
-  PointAnalogReadOnlyAbstract,
-  Interruptable,
-):
+class PointAnalogDual(PointAnalogAggregate):
+    """ The average of two redundant analog points, see
+    PointAnalogAggregate. """
 
-    _name = None  # type: str
-    _value = 0.0  # type: float
-    _quality = False  # type: bool
-    _last_update = datetime.now()
-    _observers = {}  # type: Dict[str, Callable]
-    write_request = False
+    __slots__ = ()
 
     def __init__(
       self,
@@ -25,61 +16,18 @@ class PointAnalogDual(
       point_2: 'PointAnalogReadOnlyAbstract',
       description: 'str'
     ) -> 'None':
+        super().__init__(
+          points=[point_1, point_2],
+          description=description,
+        )
 
-        self._point_1 = point_1
-        self._point_2 = point_2
-        self._description = description
-
-    def config(self) -> 'None':
-        self._point_1.add_observer(self.name, self.interrupt)
-        self._point_2.add_observer(self.name, self.interrupt)
-        super().sanity_check()
-
-    # callback sent to points that feed this object.
-    def interrupt(
-      self,
-      name: 'str',
-      reason: 'Any',
-    ):
-        i = 0.0
-        j = 0.0
-        if self._point_1.quality:
-            i += self._point_1.value
-            j += 1.0
-            if self._point_1.last_update > self._last_update:
-                self._last_update = self._point_1.last_update
-        if self._point_2.quality:
-            i += self._point_2.value
-            j += 1.0
-            if self._point_2.last_update > self._last_update:
-                self._last_update = self._point_2.last_update
-        if j > 0.0:
-            value = i / j
-
-            self._quality = True
-            if self._value != value:
-                self._value = value
-                self.write_request = True
-
-                for callback in self._observers.values():
-                    callback(name + ">" + self.name)
-        else:
-            self._quality = False
-
-    # get the engineering units value
-    @property
-    def value(self) -> 'Any':
-        return self._value
-
-    # human readable value
     @property
-    def human_readable_value(self):
-        return str(round(self._value, 2))
+    def _point_1(self) -> 'PointAnalogReadOnlyAbstract':
+        return self._points[0]
 
-    # data display width
     @property
-    def data_display_width(self) -> int:
-        return 8
+    def _point_2(self) -> 'PointAnalogReadOnlyAbstract':
+        return self._points[1]
 
     # HMI window type
     @property
@@ -87,65 +35,6 @@ class PointAnalogDual(
         # TODO make a PointAnalogDualWindow
         return "PointAnalogDualWindow"
 
-    @property
-    def forced(self) -> bool:
-        return self._point_1.forced or self._point_2.forced
-
-    @property
-    def hmi_value(self) -> str:
-        return str(self.value)
-
-    @property
-    def last_update(self) -> 'datetime':
-        return self._last_update
-
-    @property
-    def next_update(self) -> 'datetime':
-        if self._point_1.next_update > self._point_2.next_update:
-            return self._point_2.next_update
-        else:
-            return self._point_1.next_update
-
-    @property
-    def readonly(self) -> 'bool':
-        return True
-
-    @property
-    def quality(self):
-        return self._quality
-
-    # Unit of measure
-    @property
-    def u_of_m(self) -> str:
-        return self._point_1.u_of_m
-
-    # Description
-    @property
-    def description(self) -> str:
-        return self._description
-
-    # name
-    @property
-    def name(self) -> 'str':
-        return self._name
-
-    @name.setter
-    def name(self, value) -> 'None':
-        self._name = value
-
-    # Writer
-    @property
-    def writer(self) -> object:
-        return None
-
-    @property
-    def readonly_object(self) -> 'PointAnalogReadOnlyAbstract':
-        return self
-
-    @property
-    def readwrite_object(self) -> 'PointAnalogDual':
-        assert False, "Cannot get a writable object from a PointAnalogDual"
-
     # The dict property is what is used by jsonpickle to transport the object
     # over the network.
     def __getstate__(self) -> 'Dict[str, Any]':
@@ -154,20 +43,21 @@ class PointAnalogDual(
           'value': self._value,
           'quality': self._quality,
           'description': self._description,
-          'last_update': self._last_update,
+          'last_update': self.last_update,
           'point_1': self._point_1,
           'point_2': self._point_2,
         }
         return d
 
     def __setstate__(self, d: 'Dict[str, Any]') -> 'None':
-        self._name        = d['name']
-        self._value       = d['value']
-        self._description = d['description']
-        self._last_update = d['last_update']
-        self._quality     = d['quality']
-        self._point_1     = d['point_1']
-        self._point_2     = d['point_2']
+        d = dict(d)
+        d.update(
+          mode='average',
+          tolerance=None,
+          min_good=1,
+          points=[d.pop('point_1'), d.pop('point_2')],
+        )
+        super().__setstate__(d)
 
     # YAML representation for configuration storage.
     @property
@@ -3,13 +3,19 @@ from typing import TYPE_CHECKING
 from datetime import datetime
 
 if TYPE_CHECKING:
-    from typing import Dict, Any
+    from typing import Dict, Any, Callable
     from .PointAnalogAbstract import PointAnalogAbstract
+    from .VQT import VQT
 
 
 class PointAnalogReadOnly(PointAnalogReadOnlyAbstract):
 
+    __slots__ = ('_point',)
+
     def __init__(self, point: 'PointAnalogReadOnlyAbstract') -> None:
+        # views of views read straight from the point.
+        if isinstance(point, PointAnalogReadOnly):
+            point = point._point
         self._point = point
 
     def config(self) -> None:
@@ -23,6 +29,14 @@ class PointAnalogReadOnly(PointAnalogReadOnlyAbstract):
     def value(self):
         return self._point.value
 
+    @property
+    def vqt(self) -> 'VQT':
+        return self._point.vqt
+
+    @property
+    def raw_value(self):
+        return self._point.raw_value
+
     @property
     def hmi_writeable(self):
         return self._point.hmi_writeable
@@ -47,6 +61,22 @@ class PointAnalogReadOnly(PointAnalogReadOnlyAbstract):
     def writer(self) -> object:
         return self._point.writer
 
+    # Observers subscribe to the point this object wraps, so they are
+    # interrupted by changes to it.
+    @property
+    def observers(self) -> 'Dict[str, Callable[[str, Any], Any]]':
+        return self._point.observers
+
+    def add_observer(
+      self,
+      name: 'str',
+      observer: 'Callable[[str, Any], Any]',
+    ) -> 'None':
+        self._point.add_observer(name, observer)
+
+    def del_observer(self, name: 'str') -> 'None':
+        self._point.del_observer(name)
+
     @property
     def human_readable_value(self):
         return self._point.human_readable_value
@@ -83,7 +113,7 @@ class PointAnalogReadOnly(PointAnalogReadOnlyAbstract):
     # Return a pointer to a read/write instance of this object.
     @property
     def readwrite_object(self) -> 'PointAnalogAbstract':
-        return self._point.readwrite_object()
+        return self._point.readwrite_object
 
     @property
     def hmi_object_name(self):
@@ -93,6 +123,10 @@ class PointAnalogReadOnly(PointAnalogReadOnlyAbstract):
     def next_update(self):
         return self._point.next_update
 
+    @property
+    def next_update_ns(self):
+        return self._point.next_update_ns
+
     @property
     def readonly(self):
         return True
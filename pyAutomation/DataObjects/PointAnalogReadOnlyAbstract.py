@@ -21,6 +21,7 @@ data_formats = [
 class PointAnalogReadOnlyAbstract(ABC):
     """ Abstract implementation of a read-only analog point """
 
+    __slots__ = ()
 
     @staticmethod
     def datatype_length_bytes(data_type: 'str') -> 'int':
@@ -7,7 +7,8 @@ from .PointAbstract import PointAbstract
 import logging
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
-    from typing import Dict, Any, List
+    from typing import Dict, Any, List, Callable, Optional, Tuple
+    from .VQT import VQT
 
 logger = logging.getLogger('controller')
 
@@ -15,6 +16,17 @@ logger = logging.getLogger('controller')
 class PointAnalogScaled(
     PointAnalogAbstract,
 ):
+    __slots__ = (
+      '_scaling',
+      '_offset',
+      '_point',
+      '_readonly',
+
+      # (last value read from the point, scaled value worked out from it),
+      # see value.
+      '_cache',
+    )
+
     keywords = [
       'scaling',
       'offset',
@@ -22,12 +34,6 @@ class PointAnalogScaled(
       'readonly'
     ]  # type: List[str]
 
-    scaling = 1.0  # type: float
-    offset = 0.0  # type: float
-    _point = None  # type: PointAnalogAbstract
-    _name = None  # type: str
-    _readonly = False  # type: bool
-
     def __init__(
       self,
       scaling: 'float',
@@ -35,6 +41,7 @@ class PointAnalogScaled(
       point: 'PointAbstract',
       readonly: 'bool',
     ):
+        super().__init__()
         self.scaling = scaling
         self.offset = offset
         self._point = point
@@ -43,6 +50,14 @@ class PointAnalogScaled(
         if self._readonly:
             self._point.writer = self
 
+    def _set_defaults(self) -> 'None':
+        super()._set_defaults()
+        self._scaling = 1.0  # type: float
+        self._offset = 0.0  # type: float
+        self._point = None  # type: PointAnalogAbstract
+        self._readonly = False  # type: bool
+        self._cache = None  # type: Optional[Tuple[float, float]]
+
     def config(self) -> 'None':
         pass
 
@@ -50,6 +65,26 @@ class PointAnalogScaled(
         assert self._point is not None, \
           "No point assigned to this PointAnalogScaled"
 
+    # Values are written to the wrapped point, so its changes are passed on
+    # to the observers of this one. Only subscribed while there are any.
+    def add_observer(
+      self,
+      name: 'str',
+      observer: 'Callable[[str, Any], Any]',
+    ) -> 'None':
+        if not self.observers:
+            self._point.add_observer(self.name, self._point_changed)
+        super().add_observer(name, observer)
+
+    def del_observer(self, name: 'str') -> 'None':
+        super().del_observer(name)
+        if not self.observers:
+            self._point.del_observer(self.name)
+
+    def _point_changed(self, name: 'str', reason: 'Any') -> 'None':
+        for callback in tuple(self.observers.values()):
+            callback(name=name + " > " + self.name, reason=self)
+
     @property
     def name(self) -> 'str':
         return self._name
@@ -82,14 +117,54 @@ class PointAnalogScaled(
     def quality(self, q: 'bool') -> 'None':
         self._point.quality = q
 
+    @property
+    def scaling(self) -> 'float':
+        return self._scaling
+
+    @scaling.setter
+    def scaling(self, scaling: 'float') -> 'None':
+        self._scaling = scaling
+        self._cache = None
+
+    @property
+    def offset(self) -> 'float':
+        return self._offset
+
+    @offset.setter
+    def offset(self, offset: 'float') -> 'None':
+        self._offset = offset
+        self._cache = None
+
     @property
     def value(self) -> 'float':
-        return (self._point.value - self.offset) / self.scaling
+        # the scaling is only worked out again when the point changes. The
+        # cache is read and replaced as a whole so a reader on another
+        # thread never pairs a point value with the wrong scaled value.
+        v = self._point.value
+        cache = self._cache
+        if cache is None or cache[0] != v:
+            if v is None:
+                return None
+            cache = (v, (v - self._offset) / self._scaling)
+            self._cache = cache
+        return cache[1]
 
     @value.setter
     def value(self, value: 'float') -> 'None':
         self._point.value = value * self.scaling + self.offset
 
+    @property
+    def vqt(self) -> 'VQT':
+        vqt = self._point.vqt
+        if vqt.value is None:
+            return vqt
+        return vqt._replace(
+          value=(vqt.value - self._offset) / self._scaling)
+
+    @property
+    def raw_value(self) -> 'float':
+        return (self._point.raw_value - self.offset) / self.scaling
+
     @property
     def writer(self):
         return self._point.writer
@@ -102,6 +177,10 @@ class PointAnalogScaled(
     def next_update(self):
         return self._point.next_update
 
+    @property
+    def next_update_ns(self):
+        return self._point.next_update_ns
+
     @property
     def data_display_width(self) -> 'int':
         return len(self.hmi_value)
@@ -116,7 +195,9 @@ class PointAnalogScaled(
 
     @property
     def readonly_object(self) -> 'PointAnalogReadOnlyAbstract':
-        return PointAnalogReadOnly(self)
+        if self._readonly_view is None:
+            self._readonly_view = PointAnalogReadOnly(self)
+        return self._readonly_view
 
     @property
     def readwrite_object(self) -> 'PointAnalogScaled':
@@ -143,6 +224,7 @@ class PointAnalogScaled(
         return d
 
     def __setstate__(self, d: 'Dict[str, Any]') -> 'None':
+        self._set_defaults()
         self._point = d['point']
         self.scaling = d['scaling']
         self.offset = d['offset']
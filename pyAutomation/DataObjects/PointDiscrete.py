@@ -10,12 +10,18 @@ logger = logging.getLogger('controller')
 
 
 class PointDiscrete(PointAbstract):
+    __slots__ = ('on_state_description', 'off_state_description')
+
     yaml_tag = u'!PointDiscrete'
 
     def __init__(self, **kwargs):
+        super().__init__()
+        super().configure_parameters(**kwargs)
+
+    def _set_defaults(self) -> 'None':
+        super()._set_defaults()
         self.on_state_description = "ON"
         self.off_state_description = "OFF"
-        super().configure_parameters(**kwargs)
 
     @property
     def keywords(self) -> 'List[str]':
@@ -69,7 +75,9 @@ class PointDiscrete(PointAbstract):
 
     @property
     def readonly_object(self) -> 'PointReadOnly':
-        return PointReadOnly(self)
+        if self._readonly_view is None:
+            self._readonly_view = PointReadOnly(self)
+        return self._readonly_view
 
     @property
     def readwrite_object(self) -> 'PointDiscrete':
@@ -3,15 +3,23 @@ from .PointAbstract import PointAbstract
 from .PointReadOnly import PointReadOnly
 
 if TYPE_CHECKING:
-    from typing import Dict, Any, List
+    from typing import Dict, Any, Iterable, List, Tuple
     from .PointReadOnlyAbstract import PointReadOnlyAbstract
+    from .VQT import VQT
+
+# One tuple of each distinct list of states, shared by the points using it.
+# Large databases have many points with the same states (e.g. Hand, Off,
+# Auto), so this saves a list per point.
+_interned_states = {}  # type: Dict[Tuple[str, ...], Tuple[str, ...]]
 
 
 class PointEnumeration(PointAbstract):
 
-    states = []  # type: List[str]
+    __slots__ = ('_states',)
 
     def __init__(self, **kwargs) -> None:
+        super().__init__()
+
         tmp_value = None
         if 'value' in kwargs:
             tmp_value = kwargs['value']
@@ -22,10 +30,24 @@ class PointEnumeration(PointAbstract):
         if tmp_value is not None:
             self._value = tmp_value
 
+    def _set_defaults(self) -> 'None':
+        super()._set_defaults()
+        self._states = ()  # type: Tuple[str, ...]
+
     @property
     def keywords(self):
         return super().keywords + ['states']
 
+    # the names of the states, the value of the point is one of them.
+    @property
+    def states(self) -> 'Tuple[str, ...]':
+        return self._states
+
+    @states.setter
+    def states(self, states: 'Iterable[str]') -> 'None':
+        states = tuple(states)
+        self._states = _interned_states.setdefault(states, states)
+
     # hmi_value
     @property
     def hmi_value(self) -> 'str':
@@ -46,6 +68,15 @@ class PointEnumeration(PointAbstract):
           " to a state of " + str(v) + " which is not a valid state."
         self._value = self.states.index(v)
 
+    # value, quality and last update read together, with the state name
+    # as the value.
+    @property
+    def vqt(self) -> 'VQT':
+        vqt = super().vqt
+        if vqt.value is None:
+            return vqt
+        return vqt._replace(value=self.states[vqt.value])
+
     @property
     def data_display_width(self) -> 'int':
         x = 0
@@ -64,7 +95,9 @@ class PointEnumeration(PointAbstract):
 
     @property
     def readonly_object(self) -> 'PointReadOnlyAbstract':
-        return PointReadOnly(self)
+        if self._readonly_view is None:
+            self._readonly_view = PointReadOnly(self)
+        return self._readonly_view
 
     @property
     def readwrite_object(self) -> 'PointEnumeration':
@@ -81,18 +114,18 @@ class PointEnumeration(PointAbstract):
 
         """
         d = super().__getstate__()
-        d.update({'states': self.states})
+        d.update({'states': list(self.states)})
         return d
 
     def __setstate__(self, d: 'Dict[str, Any]'):
-        self.states = d['states']
         super().__setstate__(d)
+        self.states = d['states']
 
     # used to produce a yaml representation for config storage.
     @property
     def yaml_dict(self) -> 'Dict[str, Any]':
         d = super().yaml_dict
-        d.update({'states': self.states})
+        d.update({'states': list(self.states)})
         return d
 
     # used to produce a yaml representation for config storage.
@@ -1,12 +1,19 @@
 from .PointReadOnlyAbstract import PointReadOnlyAbstract
 from .PointAbstract import PointAbstract
-from typing import Dict, Any
+from .VQT import VQT
+from typing import Dict, Any, Callable, Optional
 from datetime import datetime
 
 
 class PointReadOnly(PointReadOnlyAbstract):
 
+    __slots__ = ('_point',)
+
     def __init__(self, point: 'PointReadOnlyAbstract') -> None:
+        super().__init__()
+        # views of views read straight from the point.
+        if isinstance(point, PointReadOnly):
+            point = point._point
         self._point = point
 
     def config(self) -> None:
@@ -32,6 +39,14 @@ class PointReadOnly(PointReadOnlyAbstract):
     def hmi_value(self, v: 'str') -> 'None':
         self._point.hmi_value = v
 
+    @property
+    def vqt(self) -> 'VQT':
+        return self._point.vqt
+
+    @property
+    def raw_value(self) -> 'Any':
+        return self._point.raw_value
+
     @property
     def quality(self) -> 'bool':
         return self._point.quality
@@ -40,6 +55,10 @@ class PointReadOnly(PointReadOnlyAbstract):
     def next_update(self) -> 'datetime':
         return self._point.next_update
 
+    @property
+    def next_update_ns(self) -> 'Optional[int]':
+        return self._point.next_update_ns
+
     @property
     def readonly(self) -> 'bool':
         return False
@@ -52,6 +71,22 @@ class PointReadOnly(PointReadOnlyAbstract):
     def writer(self) -> object:
         return self._point.writer
 
+    # Observers subscribe to the point this object wraps, so they are
+    # interrupted by changes to it.
+    @property
+    def observers(self) -> 'Dict[str, Callable[[str, Any], Any]]':
+        return self._point.observers
+
+    def add_observer(
+      self,
+      name: 'str',
+      observer: 'Callable[[str, Any], Any]',
+    ) -> 'None':
+        self._point.add_observer(name, observer)
+
+    def del_observer(self, name: 'str') -> 'None':
+        self._point.del_observer(name)
+
     @property
     def data_display_width(self) -> 'int':
         return self._point.data_display_width
@@ -94,6 +129,7 @@ class PointReadOnly(PointReadOnlyAbstract):
         return d
 
     def __setstate__(self, d: 'Dict[str, Any]') -> None:
+        self._set_defaults()
         self._point = d['point']
 
     # YAML representation for configuration storage.
@@ -3,10 +3,12 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 import logging
 from .Observable import Observable
+from .VQT import VQT
+from pyAutomation.Supervisory.Clock import Clock
 
 if TYPE_CHECKING:
     from pyAutomation.DataObjects.PointAbstract import PointAbstract
-    from typing import Any
+    from typing import Any, Optional
 
 logger = logging.getLogger('controller')
 
@@ -16,8 +18,12 @@ class PointReadOnlyAbstract(Observable, ABC):
     concrete are derived from. The functions contained in this class will be
     present for every point in the database. '''
 
+    __slots__ = ()
+
     def __eq__(self, other):
-        return self.__dict__ == other.__dict__
+        if type(self) is not type(other):
+            return NotImplemented
+        return self.__getstate__() == other.__getstate__()
 
     @abstractmethod
     def config(self) -> 'None':
@@ -27,6 +33,23 @@ class PointReadOnlyAbstract(Observable, ABC):
     def value(self) -> 'Any':
         pass
 
+    # The last value written to the point, which can differ from value for
+    # points that report by exception, see PointAnalog.
+    @property
+    def raw_value(self) -> 'Any':
+        return self.value
+
+    # The value, quality and last update read together. Points that store
+    # their state read it from a single update (see PointAbstract.vqt),
+    # points worked out from several others read them one after another.
+    @property
+    def vqt(self) -> 'VQT':
+        return VQT(
+          self.value,
+          self.quality,
+          Clock.to_monotonic_ns(self.last_update),
+        )
+
     # hmi value
     @property
     @abstractmethod
@@ -44,6 +67,14 @@ class PointReadOnlyAbstract(Observable, ABC):
     def next_update(self) -> 'datetime':
         return datetime.max
 
+    # next_update as Clock.monotonic_ns(), None if there isn't one.
+    @property
+    def next_update_ns(self) -> 'Optional[int]':
+        next_update = self.next_update
+        if next_update is None or next_update == datetime.max:
+            return None
+        return Clock.to_monotonic_ns(next_update)
+
     # description
     @property
     @abstractmethod
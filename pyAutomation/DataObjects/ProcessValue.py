@@ -2,30 +2,43 @@ import logging
 from typing import TYPE_CHECKING
 
 from .PointAnalogReadOnlyAbstract import PointAnalogReadOnlyAbstract
+from .PointAnalogReadOnly import PointAnalogReadOnly
+from .PointReadOnly import PointReadOnly
+from .Observable import Observable
 
 if TYPE_CHECKING:
     from .PointAbstract import PointAbstract
     from .AlarmAnalog import AlarmAnalog
     from .PointAnalog import PointAnalog
-    from typing import Dict, Any
+    from typing import Dict, Any, Optional
     from datetime import datetime
+    from .VQT import VQT
 
 logger = logging.getLogger('controller')
 
 
-class ProcessValue(PointAnalogReadOnlyAbstract):
+class ProcessValue(PointAnalogReadOnlyAbstract, Observable):
     yaml_tag = u'!ProcessValue'
     _name = None  # type: str
 
     # this is the callback passed to the pointAnalog that this ProcessValue
     # wraps
-    def point_updated(self, name: 'str'):
+    def point_updated(self, name: 'str', reason: 'Any' = None):
         # logger.debug("called for " + self.name + " from: " + name)
         for key in self.alarms:
-            self.alarms[key].evaluate_analog(self._point.value)
+            self.alarms[key].evaluate_analog(self._source.value)
+
+        # pass the change on to the observers of the process value.
+        if self._observers:
+            for callback in tuple(self._observers.values()):
+                callback(name=name + " > " + self._name, reason=self)
 
     _point = None  # type: PointAnalogReadOnlyAbstract
 
+    # the point at the end of the chain of read only views, the properties
+    # below read it directly rather than going through the views.
+    _source = None  # type: PointAnalogReadOnlyAbstract
+
     def __init__(self, point_analog: 'PointAnalogReadOnlyAbstract') -> 'None':
 
         self.control_points = {}  # type: 'Dict[str, PointAbstract]'
@@ -41,6 +54,7 @@ class ProcessValue(PointAnalogReadOnlyAbstract):
             "ProcessValue instanciated with null point."
 
         self._point = point_analog
+        self._find_source()
 
     def config(self) -> 'None':
         self._point.name = f"{self._name}.point"
@@ -50,8 +64,9 @@ class ProcessValue(PointAnalogReadOnlyAbstract):
         # read-only copy of the object.
 
         self._point = self._point.readonly_object
+        self._find_source()
 
-        self._point.add_observer("ProcessValue", self.point_updated)
+        self._point.add_observer(self._name, self.point_updated)
 
         for key, value in self.control_points.items():
             value.config()
@@ -62,6 +77,12 @@ class ProcessValue(PointAnalogReadOnlyAbstract):
         for key, value in self.alarms.items():
             value.config()
 
+    def _find_source(self) -> 'None':
+        source = self._point
+        while isinstance(source, (PointReadOnly, PointAnalogReadOnly)):
+            source = source._point
+        self._source = source
+
     # methods to add alarms and points.
     def add_alarm(self, name, alarm_analog):
         self.alarms[name] = alarm_analog
@@ -90,12 +111,22 @@ class ProcessValue(PointAnalogReadOnlyAbstract):
     # Point EU value
     @property
     def value(self) -> 'float':
-        return self._point.value
+        return self._source.value
+
+    # Point value, quality and last update read together.
+    @property
+    def vqt(self) -> 'VQT':
+        return self._source.vqt
+
+    # Point value before the deadband, see PointAnalog.
+    @property
+    def raw_value(self) -> 'float':
+        return self._source.raw_value
 
     # point HMI value
     @property
     def hmi_value(self) -> 'str':
-        return self._point.hmi_value
+        return self._source.hmi_value
 
     @hmi_value.setter
     def hmi_value(self, value) -> 'None':
@@ -104,31 +135,35 @@ class ProcessValue(PointAnalogReadOnlyAbstract):
     # Point quaity
     @property
     def quality(self) -> 'bool':
-        return self._point.quality
+        return self._source.quality
 
     # Point forced
     @property
     def forced(self) -> 'bool':
-        return self._point.forced
+        return self._source.forced
 
     # Description
     @property
     def description(self) -> 'str':
-        return self._point.description
+        return self._source.description
 
     # human readable value
     @property
     def human_readable_value(self) -> 'str':
-        return self._point.human_readable_value
+        return self._source.human_readable_value
 
     # last update property
     @property
     def last_update(self) -> 'datetime':
-        return self._point.last_update
+        return self._source.last_update
 
     @property
     def next_update(self) -> 'datetime':
-        return self._point.next_update
+        return self._source.next_update
+
+    @property
+    def next_update_ns(self) -> 'Optional[int]':
+        return self._source.next_update_ns
 
     @property
     def readonly(self) -> 'bool':
@@ -136,7 +171,7 @@ class ProcessValue(PointAnalogReadOnlyAbstract):
 
     @property
     def request_value(self) -> 'str':
-        return self._point.request_value
+        return self._source.request_value
 
     @request_value.setter
     def request_value(self, value: 'str') -> 'None':
@@ -145,12 +180,12 @@ class ProcessValue(PointAnalogReadOnlyAbstract):
     # HMI writable
     @property
     def hmi_writeable(self) -> 'bool':
-        return self._point.hmi_writeable
+        return self._source.hmi_writeable
 
     # data display width
     @property
     def data_display_width(self) -> 'int':
-        return self._point.data_display_width
+        return self._source.data_display_width
 
     @property
     def hmi_object_name(self) -> 'str':
@@ -164,7 +199,7 @@ class ProcessValue(PointAnalogReadOnlyAbstract):
     # unit of measure
     @property
     def u_of_m(self) -> 'str':
-        return self._point.u_of_m
+        return self._source.u_of_m
 
     @property
     def readonly_object(self) -> 'PointAnalogReadOnlyAbstract':
@@ -188,6 +223,7 @@ class ProcessValue(PointAnalogReadOnlyAbstract):
 
     def __setstate__(self, d: 'Dict[str, Any]') -> 'None':
         self._point = d['point']
+        self._find_source()
         self.high_display_limit = d['high_display_limit']
         self.low_display_limit = d['low_display_limit']
         self.control_points = d['control_points']
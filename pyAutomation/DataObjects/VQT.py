@@ -0,0 +1,25 @@
+from datetime import datetime
+from typing import Any, NamedTuple
+from pyAutomation.Supervisory.Clock import Clock
+
+
+class VQT(NamedTuple):
+    """ The value, quality and time of the last update of a point, read
+    together, see PointAbstract.vqt.
+
+    A point publishes its state as a whole, so a VQT read by one thread
+    while another writes the point is always one the writer made: never a
+    new value with the old time or quality.
+
+    """
+
+    value: Any
+
+    quality: bool
+
+    # Clock.monotonic_ns() of the update.
+    timestamp: int
+
+    @property
+    def last_update(self) -> 'datetime':
+        return Clock.to_datetime(self.timestamp)
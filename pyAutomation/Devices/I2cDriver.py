@@ -1,13 +1,12 @@
 # This thread is the only thread allowed to write to the i2c bus.
 
-from datetime import datetime
-from datetime import timedelta
 import traceback
 from importlib import import_module
 import inspect
 from pyAutomation.Devices.i2c.i2cPrototype import i2cPrototype
 from pyAutomation.Supervisory.SupervisedThread import SupervisedThread
 from pyAutomation.Supervisory.PointManager import PointManager
+from pyAutomation.Supervisory.Clock import Clock
 
 
 class I2cDriver(SupervisedThread):
@@ -18,7 +17,8 @@ class I2cDriver(SupervisedThread):
 
     def __init__(self, name, logger):
         self.devices = []
-        self.min_sleep_time = timedelta(milliseconds=10)
+        # seconds.
+        self.min_sleep_time = 0.01
         self.bus = None
         self.period = None
         self.current_read_device = None
@@ -69,16 +69,18 @@ class I2cDriver(SupervisedThread):
 
         for d in self.devices:
             for p in d.interrupt_points:
-                p.add_observer(self.name, self)
+                p.add_observer(self.name, self.interrupt)
 
         self.current_read_device = self.devices[0]
 
     def loop(self):
         self.logger.debug("Entering function")
 
-        now = datetime.now()
+        # the devices are scheduled on the monotonic clock, the datetimes
+        # are only used for logging.
+        now = Clock.monotonic_ns()
         device_to_run = None
-        longest_wait_time = timedelta.min
+        longest_wait_time = None
 
         for device in self.devices:
             if device.has_write_data:
@@ -89,36 +91,40 @@ class I2cDriver(SupervisedThread):
                 # data writes get pushed to the front of the queue by 1 second.
                 # this prevents a device that cannot write from monopolizing
                 # the queue, but it will drive this routine to 100% CPU.
-                i = now - device.last_io_attempt + timedelta(seconds=1)
-                if i > longest_wait_time:
+                i = now - device.last_io_attempt_ns + 1000000000
+                if longest_wait_time is None or i > longest_wait_time:
                     longest_wait_time = i
                     device_to_run = device
 
         # check and see if the next device to read is ready.
-        if self.current_read_device.next_update is not None:
-            if self.current_read_device.next_update <= now:
-                i = now - self.current_read_device.last_io_attempt
-                if i > longest_wait_time:
+        next_update = self.current_read_device.next_update_ns
+        if next_update is not None:
+            if next_update <= now:
+                i = now - self.current_read_device.last_io_attempt_ns
+                if longest_wait_time is None or i > longest_wait_time:
                     device_to_run = self.current_read_device
 
         if device_to_run is not None:
             self.logger.debug("doing I/O for: %s", device_to_run.name)
             try:
-                device_to_run.last_io_attempt = datetime.now()
+                device_to_run.last_io_attempt_ns = Clock.monotonic_ns()
                 if not device_to_run.is_setup:
                     device_to_run.setup()
                 if device_to_run.is_setup:
-                    if device_to_run.has_write_data:
-                        device_to_run.write_data()
-                    else:
-                        device_to_run.read_data()
+                    # the points of the device notify their observers once
+                    # the whole device has been read.
+                    with PointManager.batch():
+                        if device_to_run.has_write_data:
+                            device_to_run.write_data()
+                        else:
+                            device_to_run.read_data()
                 else:
                     # the setup failed. Cool down for a few seconds
-                    t = datetime.now() + timedelta(seconds=5.0)
+                    t = Clock.monotonic_ns() + 5000000000
                     self.logger.error(
                       " %s can't be setup. Delaying until %s",
-                      device_to_run.name, str(t))
-                    device_to_run.delay_until = t
+                      device_to_run.name, str(Clock.to_datetime(t)))
+                    device_to_run.delay_until_ns = t
 
             except Exception:
                 self.logger.error(traceback.format_exc())
@@ -127,44 +133,44 @@ class I2cDriver(SupervisedThread):
 
         # Figure out which device will be read next.
         # The earliest next read time
-        next_read_time = datetime.max
+        next_read_time = None
 
         # The longest time that a device has been waiting
-        longest_wait_time = timedelta.min
+        longest_wait_time = None
 
         device_next_read = None
 
         for device in self.devices:
-            i = device.next_update
+            i = device.next_update_ns
             if i is not None:
 
                 # if i is in the past, then pick the device that's been waiting
                 # the longest.
                 if i < now:
-                    i = now - device.last_io_attempt
-                    if i > longest_wait_time:
+                    i = now - device.last_io_attempt_ns
+                    if longest_wait_time is None or i > longest_wait_time:
                         longest_wait_time = i
                         device_next_read = device
                         next_read_time = now
 
                 # if i is in the future, select the shortest wait time among the
                 # devices
-                elif i < next_read_time:
+                elif next_read_time is None or i < next_read_time:
                     next_read_time = i
                     device_next_read = device
 
         if device_next_read is not None:
             self.current_read_device = device_next_read
-        self.logger.debug(
-          "%s will be read at %s",
-          self.current_read_device.name,
-          next_read_time
-        )
-
-        if next_read_time != datetime.max:
-            sleep_time = next_read_time - datetime.now()
+
+        if next_read_time is not None:
+            self.logger.debug(
+              "%s will be read at %s",
+              self.current_read_device.name,
+              Clock.to_datetime(next_read_time),
+            )
+            sleep_time = (next_read_time - Clock.monotonic_ns()) / 1e9
         else:
-            sleep_time = timedelta(seconds=5)
+            sleep_time = 5.0
 
         # Looks like we're all done. Check if we're done writing
         # before we go to sleep.
@@ -177,8 +183,8 @@ class I2cDriver(SupervisedThread):
                 return 0
 
         if sleep_time > self.min_sleep_time:
-            self.logger.debug("Sleeping %s", sleep_time.total_seconds())
-            return sleep_time.total_seconds()
+            self.logger.debug("Sleeping %s", sleep_time)
+            return sleep_time
         else:
             self.logger.debug("Sleep time less than minimum - not Sleeping.")
             return 0
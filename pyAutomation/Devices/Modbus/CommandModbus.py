@@ -1,6 +1,8 @@
 from datetime import datetime
+from typing import Optional
 from pyAutomation.DataObjects.Point import Point
 from pyAutomation.DataObjects.PointDiscrete import PointDiscrete
+from pyAutomation.Supervisory.Clock import Clock
 import re
 
 address_regex = re.compile(r"(?P<register>\d+)\.(?P<bit>\d+)")
@@ -130,23 +132,20 @@ class CommandModbus:
             point.quality = False
 
     @property
-    def next_update(self) -> 'datetime':
+    def next_update_ns(self) -> 'Optional[int]':
         next_point = "no point"
-        next_update = datetime.max
+        next_update = None
         if self.points is not None:
             for point in self.points.values():
                 if point is not None:
-                    next_update_time = p.next_update
+                    next_update_time = point.next_update_ns
 
                     if next_update_time is None:
                         continue
-                    else:
-                        if next_update_time < next_update:
-                            next_update = next_update_time
-                            next_point = p.name
-
-        if datetime.max == next_update:
-            next_update = None
+                    elif next_update is None \
+                      or next_update_time < next_update:
+                        next_update = next_update_time
+                        next_point = point.name
 
         self.logger.debug(
           "next update for: %s is %s (%s)",
@@ -157,6 +156,14 @@ class CommandModbus:
 
         return next_update
 
+    # next_update_ns as a datetime, for display.
+    @property
+    def next_update(self) -> 'Optional[datetime]':
+        next_update = self.next_update_ns
+        if next_update is None:
+            return None
+        return Clock.to_datetime(next_update)
+
     def getLengthRegisters(self) -> 'int':
         """ Gets the total number of registers read by this command.
         Note that there may be several registers requested by this command that
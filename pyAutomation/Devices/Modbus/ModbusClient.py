@@ -1,17 +1,16 @@
-from datetime import datetime
-from datetime import timedelta
 import asyncio
 from typing import TYPE_CHECKING
 
 from pyAutomation.DataObjects.PointAnalogReadOnlyAbstract import \
   data_formats
-from pyAutomation.Supervisory.SupervisedThread import SupervisedThread
+from pyAutomation.Supervisory.AsyncSupervisedTask import AsyncSupervisedTask
 from pyAutomation.Supervisory.PointHandler import PointHandler
+from pyAutomation.Supervisory.Clock import Clock
 from pyAutomation.Devices.Modbus.CommandModbus import \
   CommandModbus, makeCommandObjects
 
 if TYPE_CHECKING:
-    from typing import List, Dict, Any
+    from typing import List, Dict, Any, Optional
 
 valid_commands = [
   'COIL',
@@ -21,7 +20,7 @@ valid_commands = [
 ]
 
 
-class ModbusCient(SupervisedThread, PointHandler):
+class ModbusCient(AsyncSupervisedTask, PointHandler):
     """Provides a mechanism to read and write to a single remote Modbus/TCP
     endpoint. If multiple endpoints are required, then multiple ModbusClients
     need to be instanciated."""
@@ -40,14 +39,17 @@ class ModbusCient(SupervisedThread, PointHandler):
     def __init__(self, name, logger):
         self.state = "DISCONNECTED"  # type: str
         self.sock = None
+        self.reader = None  # type: asyncio.StreamReader
+        self.writer = None  # type: asyncio.StreamWriter
         self.endpoint_address = ""
         self.endpoint_port = 0
-        self.min_sleep_time = timedelta(milliseconds=10)
+        # seconds.
+        self.min_sleep_time = 0.01
         self.period = None
         self.point_data = []  # type: List[Dict[str, Any]]
         self.modbus_commands = []  # type: List[CommandModbus]
 
-        # SupervisedThread __init__ call
+        # AsyncSupervisedTask __init__ call
         super().__init__(
           name=name,
           logger=logger,
@@ -65,7 +67,7 @@ class ModbusCient(SupervisedThread, PointHandler):
 
         for point in self.point_data:
             key = point['drop'] + '-' + point['command']
-            if key not in dicts:
+            if key not in data:
                 data[key] = []
             data[key].append(point)
 
@@ -78,73 +80,96 @@ class ModbusCient(SupervisedThread, PointHandler):
             for cmd in cmds:
                 self.modbus_commands.append(cmd)
 
-    # SupervisedThread manditory override.
-    def loop(self) -> 'float':
-        data = bytearray()
-        active_modbus_command = None
-
-        # Since python has a GIL, do the connect asyncronously
-
-        reader, writer = await asyncio.open_connection(
+    # AsyncSupervisedTask override. The connection is made on the shared
+    # event loop so waiting on the remote end doesn't tie up a thread.
+    async def open(self) -> 'None':
+        self.reader, self.writer = await asyncio.open_connection(
           self.endpoint_address,
           self.endpoint_port,
         )
 
-        while True:
-            # Deal with the read only (from the perspective of this program)
-            # points. Make write commands and fire them off to the remote end.
-            # Look for ro points and build outgoing commands on an as-needed
-            # basis.
-            # N.B. read only points are still read from the remote end and sent
-            # as 'requested values' to the owning routine when changes are
-            # noticed.
-
-            # locate the point in the point_data array and build a commands
-            # to write that data out to the remote end.
-            # we expect that the point that initated the interrupt will have
-            # its name included in the deque.
-            while self.interrupt_request_deque:
-                write_item = self.interrupt_request_deque.pop()
-                for modbus_command in self.modbus_commands:
-                    for point in modbus_command.points:
-                        if point.name == write_item:
-                            write_command = CommandModbus(
-                              points = {'point': point},
-                              command = point.command,
-                              write = True,
-                              drop = point.drop,
-                            )
-
-            # run the business as usual read commands.
-            next_update = datetime.max
-            active_modbus_command = None
-            for modbus_command in self.modbus_commands:
-                if modbus_command.next_update < next_update:
-                    next_update = modbus_command.next_update
-                    active_modbus_command = modbus_command
+    # AsyncSupervisedTask override.
+    async def close(self) -> 'None':
+        if self.writer is not None:
+            self.writer.close()
+            await self.writer.wait_closed()
 
-            if next_update < datetime.now():
-                yield next_update
-                continue  # restart the while loop to preseve the stream.
-
-            # This deals with the read/write points that are owned by this
-            # process.
-            data = active_modbus_command.command_chars
-            return_data = asyncio.run(self.do_io(data))
-            active_modbus_command.processReply(return_data)
+    # SupervisedThread manditory override.
+    async def loop(self) -> 'Optional[float]':
+        # Deal with the read only (from the perspective of this program)
+        # points. Make write commands and fire them off to the remote end.
+        # Look for ro points and build outgoing commands on an as-needed
+        # basis.
+        # N.B. read only points are still read from the remote end and sent
+        # as 'requested values' to the owning routine when changes are
+        # noticed.
+
+        # locate the point in the point_data array and build a commands
+        # to write that data out to the remote end.
+        # the points that initated the interrupts are keyed by name in
+        # interrupt_reasons.
+        for write_item in self.interrupt_reasons:
+            for modbus_command in self.modbus_commands:
+                for point in modbus_command.points:
+                    if point.name == write_item:
+                        write_command = CommandModbus(
+                          points = {'point': point},
+                          command = point.command,
+                          write = True,
+                          drop = point.drop,
+                        )
+                        write_command.processReply(
+                          await self.do_io(write_command.command_chars))
+
+        # run the business as usual read commands.
+        active_modbus_command = self.next_command()
+        if active_modbus_command is None:
+            return None
+
+        # scheduled on the monotonic clock, so steps of the wall clock
+        # don't stall or rush the reads.
+        next_update = active_modbus_command.next_update_ns
+        if next_update is not None and next_update > Clock.monotonic_ns():
+            return (next_update - Clock.monotonic_ns()) / 1e9
+
+        # This deals with the read/write points that are owned by this
+        # process.
+        data = active_modbus_command.command_chars
+        return_data = await self.do_io(data)
+        active_modbus_command.processReply(return_data)
+
+        active_modbus_command = self.next_command()
+        if active_modbus_command is None:
+            return None
+        return (
+          active_modbus_command.next_update_ns - Clock.monotonic_ns()
+        ) / 1e9
+
+    def next_command(self) -> 'Optional[CommandModbus]':
+        """ Returns the read command that is due the soonest. """
+        next_update = None
+        active_modbus_command = None
+        for modbus_command in self.modbus_commands:
+            i = modbus_command.next_update_ns
+            if i is None:
+                continue
+            if next_update is None or i < next_update:
+                next_update = i
+                active_modbus_command = modbus_command
+        return active_modbus_command
 
     async def do_io(self, data: 'bytearray') -> 'bytearray':
         """ Run the I/O routine asyncronously."""
         # Send the modbus query
-        writer.write(data)
-        await writer.drain()
+        self.writer.write(data)
+        await self.writer.drain()
 
         # Wait for the data to be returned.
-        return_data = await reader.read(3)
+        return_data = bytearray(await self.reader.readexactly(3))
 
         # Process the returned data
-        message_length = data[2]
-        return_data.append(await reader.read(message_length))
+        message_length = return_data[2]
+        return_data.extend(await self.reader.readexactly(message_length))
         return return_data
 
     # PointHandler override.
@@ -2,8 +2,9 @@ from datetime import timedelta
 import asyncio
 import socket
 
-from pyAutomation.Supervisory.SupervisedThread import SupervisedThread
+from pyAutomation.Supervisory.AsyncSupervisedTask import AsyncSupervisedTask
 from pyAutomation.Supervisory.PointHandler import PointHandler
+from pyAutomation.Supervisory.PointManager import PointManager
 from pyAutomation.Supervisory.ConfigurationException \
   import ConfigurationException
 
@@ -26,7 +27,7 @@ valid_commands = [
 data_formats.extend(['bit', 'bit-in-word'])
 
 
-class ModbusServer(SupervisedThread, PointHandler):
+class ModbusServer(AsyncSupervisedTask, PointHandler):
     """Provides a Modbus server to provide visibility of point database
     quantities to remote Modbus clients.
 
@@ -48,12 +49,14 @@ class ModbusServer(SupervisedThread, PointHandler):
 
     def __init__(self, name, logger):
         self.sock = None
-        self.endpoint_address = ""
-        self.endpoint_port = 0
+        self.point_mapping = {}  # type: Dict[Any, Any]
+        self.server = None  # type: asyncio.AbstractServer
+        self.endpoint_address = "0.0.0.0"
+        self.port = 5000
         self.min_sleep_time = timedelta(milliseconds=10)
         self.period = None
 
-        # SupervisedThread __init__ call
+        # AsyncSupervisedTask __init__ call
         super().__init__(
           name=name,
           logger=logger,
@@ -64,16 +67,16 @@ class ModbusServer(SupervisedThread, PointHandler):
 
     # SupervisedThread manditory override
     def config(self, data: 'dict') -> 'None':
-        """ Fires up the I/O co-routine."""
-        asyncio.run(self.run_server('0.0.0.0', 5000))
+        pass
 
-    async def run_server(self, host, port) -> 'None':
-        server = await asyncio.start_server(
+    # AsyncSupervisedTask override. Fires up the I/O co-routine.
+    async def open(self) -> 'None':
+        self.server = await asyncio.start_server(
           self.do_io,
-          host=host,
-          port=port,
+          host=self.endpoint_address,
+          port=int(self.port),
           # loop=None,
-          limit=None,
+          # limit is left at the asyncio default, None breaks the reader.
           family=socket.AF_UNSPEC,
           flags=socket.AI_PASSIVE,
           sock=None,
@@ -84,7 +87,14 @@ class ModbusServer(SupervisedThread, PointHandler):
           ssl_handshake_timeout=None,
           start_serving=True,
         )
-        server.serve_forever()
+        self.logger.info(
+          "Modbus server listening on %s:%s", self.endpoint_address, self.port)
+
+    # AsyncSupervisedTask override.
+    async def close(self) -> 'None':
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
 
     def interrupt(self, name: 'str', reason: 'Any') -> 'None':
         # A modbus server doesn't ever push information to clients, so we can
@@ -96,21 +106,30 @@ class ModbusServer(SupervisedThread, PointHandler):
       reader: 'asyncio.StreamReader',
       writer: 'asyncio.StreamWriter',
     )-> 'None':
-        """ Run the I/O routine asyncronously."""
+        """ Run the I/O routine asyncronously. Serves requests on the
+        connection until the client closes it."""
         data  = None  # type: bytearray  # type: ignore
-        # Wait on incoming data.
-        data = bytearray(await reader.read(5))
-        message_length = self.__from_bytes(data[4:5])
+        try:
+            while True:
+                # Wait on the MBAP header, the length field is the number of
+                # bytes that follow it.
+                data = bytearray(await reader.readexactly(6))
+                message_length = self.__from_bytes(data[4:6])
+
+                # wait for the remainder of the data from the buffer
+                data.extend(await reader.readexactly(message_length))
 
-        # wait for the remainder of the data from the buffer
-        data.extend(bytearray(await reader.read(message_length)))
+                reply_data = self.process_request(data)
 
-        reply_data = self.process_request(data)
+                # send the reply data back to the client
+                writer.write(reply_data)
+                await writer.drain()
 
-        # send the reply data back to the client
-        writer.write(reply_data)
-        await writer.drain()
-        writer.close()  # Not sure I should be doing this now.
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+
+        finally:
+            writer.close()
 
     def process_request(self, data: 'bytearray') -> 'bytearray':
         # populate additional fields.
@@ -313,20 +332,22 @@ class ModbusServer(SupervisedThread, PointHandler):
                             break
 
                     # all the points checked out. Proceed with the write.
-                    for i in range(0, payload_data):
-                        point = self.point_mapping\
-                          [unit_identifier]\
-                          ['COIL']\
-                          [starting_address + i]\
-                          ['point']
-
-                        byte_index = int(i / 8)
-                        bit_index = i % 8
-
-                        if (force_data[byte_index] and (1 << bit_index)) > 0:
-                            point.value = True
-                        else:
-                            point.value = False
+                    with PointManager.batch():
+                        for i in range(0, payload_data):
+                            point = self.point_mapping\
+                              [unit_identifier]\
+                              ['COIL']\
+                              [starting_address + i]\
+                              ['point']
+
+                            byte_index = int(i / 8)
+                            bit_index = i % 8
+
+                            if (force_data[byte_index]
+                                and (1 << bit_index)) > 0:
+                                point.value = True
+                            else:
+                                point.value = False
 
                     # reply data is already correct.
 
@@ -359,24 +380,25 @@ class ModbusServer(SupervisedThread, PointHandler):
                             reply_data = self.__make_error_response(data, 0x02)
                             break
 
-                    for i in range(0, payload_data):
-                        point = self.point_mapping\
-                          [unit_identifier]\
-                          ['HOLDING']\
-                          [starting_address + i]\
-                          ['point']
-
-                        data_type = self.point_mapping\
-                          [unit_identifier]\
-                          ['HOLDING']\
-                          [starting_address + i]\
-                          ['data_type']
-
-                        index = 13 + i * 2
-                        point.decode_datatype(
-                          data=preset_data[index:index + 1],
-                          data_type=data_type,
-                        )
+                    with PointManager.batch():
+                        for i in range(0, payload_data):
+                            point = self.point_mapping\
+                              [unit_identifier]\
+                              ['HOLDING']\
+                              [starting_address + i]\
+                              ['point']
+
+                            data_type = self.point_mapping\
+                              [unit_identifier]\
+                              ['HOLDING']\
+                              [starting_address + i]\
+                              ['data_type']
+
+                            index = 13 + i * 2
+                            point.decode_datatype(
+                              data=preset_data[index:index + 1],
+                              data_type=data_type,
+                            )
 
             except KeyError:
                 # address is invalid, fail the command with a 'illegal data
@@ -393,7 +415,7 @@ class ModbusServer(SupervisedThread, PointHandler):
     # goes to sleep, the 'loop' isn't really required. On a DNP3 system, the
     # loop would be required as the DNP3 system is expected to provide
     # unsolicited updates on a running channel.
-    def loop(self) -> 'Optional[float]':
+    async def loop(self) -> 'Optional[float]':
         return None
 
     # PointHandler override.
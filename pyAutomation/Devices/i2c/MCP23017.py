@@ -261,7 +261,7 @@ class MCP23017(i2cPrototype, PointHandler):
 
             self.dev.close()
 
-    def data_updated(self, name):
+    def data_updated(self, name, reason=None):
         self._has_write_data = True
         self.logger.debug("Got Interrupt from %s", name)
 
@@ -1,10 +1,11 @@
 from datetime import datetime
 from abc import ABC
 from abc import abstractmethod
-from typing import List
+from typing import List, Optional
 import logging
 from pyAutomation.DataObjects.PointReadOnlyAbstract import PointReadOnlyAbstract
 from pyAutomation.DataObjects.PointAbstract import PointAbstract
+from pyAutomation.Supervisory.Clock import Clock
 
 
 class i2cPrototype(ABC):
@@ -12,7 +13,9 @@ class i2cPrototype(ABC):
     def __init__(self, name: str, logger: str) -> None:
         self.device_points = []  # type: List[PointAbstract]
         self._has_write_data = False  # type: bool
-        self.last_io_attempt = datetime.now()  # type: datetime.datetime
+        # the times below are Clock.monotonic_ns(), so the scheduling isn't
+        # upset by steps of the wall clock.
+        self.last_io_attempt_ns = Clock.monotonic_ns()  # type: int
         self.is_setup = False
         self.name = name
         self._logger = None
@@ -22,7 +25,7 @@ class i2cPrototype(ABC):
           self.name,
           logger,
         )
-        self.delay_until = None
+        self.delay_until_ns = None  # type: Optional[int]
 
     @abstractmethod
     def read_data(self):
@@ -62,9 +65,9 @@ class i2cPrototype(ABC):
 
     @property
     def has_write_data(self) -> bool:
-        if self.delay_until is not None:
-            if self.delay_until < datetime.now():
-                self.delay_until = None
+        if self.delay_until_ns is not None:
+            if self.delay_until_ns < Clock.monotonic_ns():
+                self.delay_until_ns = None
             else:
                 return False
 
@@ -74,29 +77,26 @@ class i2cPrototype(ABC):
             return False
 
     @property
-    def next_update(self) -> datetime:
-        if self.delay_until is not None:
-            if self.delay_until < datetime.now():
-                self.delay_until = None
+    def next_update_ns(self) -> 'Optional[int]':
+        if self.delay_until_ns is not None:
+            if self.delay_until_ns < Clock.monotonic_ns():
+                self.delay_until_ns = None
             else:
-                return self.delay_until
+                return self.delay_until_ns
 
         next_point = "no point"
-        next_update = datetime.max
+        next_update = None
         if self.device_points is not None:
             for p in self.device_points:
                 if p is not None:
-                    next_update_time = p.next_update
+                    next_update_time = p.next_update_ns
 
                     if next_update_time is None:
                         continue
-                    else:
-                        if next_update_time < next_update:
-                            next_update = next_update_time
-                            next_point = p.name
-
-        if datetime.max == next_update:
-            next_update = None
+                    elif next_update is None \
+                      or next_update_time < next_update:
+                        next_update = next_update_time
+                        next_point = p.name
 
         self.logger.debug(
           "next update for: %s is %s (%s)",
@@ -106,3 +106,11 @@ class i2cPrototype(ABC):
         )
 
         return next_update
+
+    # next_update_ns as a datetime, for display.
+    @property
+    def next_update(self) -> 'Optional[datetime]':
+        next_update = self.next_update_ns
+        if next_update is None:
+            return None
+        return Clock.to_datetime(next_update)
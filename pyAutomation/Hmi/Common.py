@@ -52,13 +52,28 @@ def hmi_interact(o) -> None:
         logger.debug("Leaving function")
 
 
+# Points and alarms keep their state in slots rather than a __dict__, so
+# both are gathered here.
+def has_attributes(o) -> bool:
+    return hasattr(o, '__dict__') or hasattr(o, '__slots__')
+
+
+def instance_attributes(o) -> dict:
+    d = dict(getattr(o, '__dict__', {}))
+    for cls in type(o).__mro__:
+        for key in cls.__dict__.get('__slots__', ()):
+            if hasattr(o, key):
+                d[key] = getattr(o, key)
+    return d
+
+
 # Update a dict with new properties
 def update_dict(local: dict, remote: dict, path: str) -> None:
     for key, value in remote.items():
         if isinstance(value, dict) and isinstance(local[key], dict):
             path = path + " > dict-" + local['name']
             update_dict(local[key], value, path)
-        elif hasattr(value, '__dict__') and hasattr(local[key], '__dict__'):
+        elif has_attributes(value) and has_attributes(local[key]):
             path = path + ">" + value.name
             update_object(local[key], value, path)
         elif not local[key] == value:
@@ -70,13 +85,13 @@ def update_dict(local: dict, remote: dict, path: str) -> None:
 
 # Updates an object with new properties from the point database
 def update_object(local, remote, path: str) -> None:
-    for key, value in remote.__dict__.items():
+    for key, value in instance_attributes(remote).items():
         # logger.debug("Working on " + str(key) + "-" + str(value))
         local_item = getattr(local, key)
         if isinstance(value, dict) and isinstance(local_item, dict):
             path = path + " > dict-" + str(key)
             update_dict(local_item, value, path)
-        elif hasattr(value, '__dict__') and hasattr(local_item, '__dict__'):
+        elif has_attributes(value) and has_attributes(local_item):
             path = path + ">" + value.name
             update_object(local_item, value, path)
         elif not local_item == value:
@@ -1,71 +1,117 @@
-from pyAutomation.DataObjects.Alarm import Alarm
+from pyAutomation.Supervisory.AlarmEvent import AlarmEvent
 from pyAutomation.Supervisory.AlarmNotifier import AlarmNotifier
 from email.mime.text import MIMEText
-import threading
 import smtplib
-import logging
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 
 
 class AlarmEmailer(AlarmNotifier):
+    """ E-mails alarm transitions. A batch of one event is sent as a message
+    about that alarm, larger batches as a single digest.
+
+    The SMTP connection is kept open between batches and opened again if
+    the server has closed it in the meantime.
+
+    """
 
     parameters = {
       'mailhost': 'localhost',
       'mailport': '587',
       'local_hostname': 'automation',
       'mail_sender': 'alarm_notifier',
-      'mail_receivers': 'alarm_reciever@email.com'
+      'mail_receivers': 'alarm_reciever@email.com',
+      'queue_size': '1000',
+      'digest_window': '5.0',
     }
 
     def __init__(self, name: str, logger: str) -> None:
-        self.logger = logging.getLogger(logger)
-        self.name = name
+        super().__init__(name=name, logger=logger)
         self.mailhost = ""
         self.mailport = ""
         self.local_hostname = ""
         self.mail_sender = ""
         self.mail_receivers = ""
 
-    def notify(self, alarm: Alarm, verb: 'str') -> None:
-        self.logger.info(f"notifying for {alarm.description} to {verb}")
-        message = MIMEText(
-          f"Alarm: {alarm.description} {verb} \n"
-          f"Consequences: {alarm.consequences} \n"
-          f"More info: {alarm.more_info}"
-        )
+        # only used by the worker thread.
+        self._smtp = None  # type: Optional[smtplib.SMTP]
+
+    def send(self, events: 'List[AlarmEvent]', dropped: 'int') -> 'None':
+        message = self.message(events, dropped)
+        try:
+            self.send_email(message)
+            self.logger.info(f"Successfully sent email: {message['Subject']}")
+
+        except (smtplib.SMTPException, OSError):
+            # logger.error(traceback.format_exc())
+            self.logger.error("Error: unable to send email: " + str(message))
 
-        message['Subject'] = alarm.description + " alarm"
+    def message(self, events: 'List[AlarmEvent]', dropped: 'int') -> MIMEText:
+        if len(events) == 1 and not dropped:
+            e = events[0]
+            subject = e.description + " alarm"
+            text = (
+              f"Alarm: {e.description} {e.verb} \n"
+              f"Consequences: {e.consequences} \n"
+              f"More info: {e.more_info}"
+            )
+            if e.transitions > 1:
+                text += f"\nTransitions: {e.transitions}"
+
+        else:
+            subject = f"{len(events)} alarms changed"
+            lines = []
+            for e in events:
+                line = f"{e.time:%Y-%m-%d %H:%M:%S} {e.description} {e.verb}"
+                if e.transitions > 1:
+                    line += f" ({e.transitions} transitions)"
+                lines.append(line)
+            if dropped:
+                lines.append(
+                  f"{dropped} further alarm events were dropped, see the "
+                  "alarm log.")
+            text = "\n".join(lines)
+
+        message = MIMEText(text)
+        message['Subject'] = subject
         message['From'] = self.mail_sender
         message['To'] = self.mail_receivers
+        return message
+
+    def send_email(self, message: MIMEText) -> None:
+        """ Sends message over the open connection. If that fails the
+        server may have dropped the connection, so it's sent once more over
+        a new one. """
+        if self._smtp is not None:
+            try:
+                self._smtp.sendmail(
+                  message['From'], message['To'], str(message))
+                return
+            except (smtplib.SMTPServerDisconnected, OSError):
+                self._disconnect()
 
-        # sending e-mail is slow. Do it in another thread.
-        t = threading.Thread(
-          target=self.send_email,
-          args=(
-            message,
-            self.mailhost,
-            self.mailport,
-            self.local_hostname,
-            self.logger,
-          )
+        self._smtp = smtplib.SMTP(
+          self.mailhost,
+          self.mailport,
+          self.local_hostname,
         )
-        t.start()
+        try:
+            self._smtp.sendmail(message['From'], message['To'], str(message))
+        except (smtplib.SMTPServerDisconnected, OSError):
+            self._disconnect()
+            raise
 
-    @staticmethod
-    def send_email(message, mailhost, mailport, local_hostname, logger) -> None:
+    def _disconnect(self) -> None:
+        smtp_obj, self._smtp = self._smtp, None
         try:
-            smtp_obj = smtplib.SMTP(
-              mailhost,
-              mailport,
-              local_hostname,
-            )
-            smtp_obj.sendmail(message['From'], message['To'], str(message))
             smtp_obj.quit()
-            logger.info("Successfully sent email")
+        except (smtplib.SMTPException, OSError):
+            smtp_obj.close()
 
-        except smtplib.SMTPException:
-            # logger.error(traceback.format_exc())
-            logger.error("Error: unable to send email: " + str(message))
+    def close(self, timeout: 'Optional[float]' = None) -> None:
+        super().close(timeout)
+        # left to the worker if it's still sending.
+        if self._smtp is not None and not self._worker.is_alive():
+            self._disconnect()
 
     # YAML representation for configuration storage.
     @property
@@ -79,6 +125,8 @@ class AlarmEmailer(AlarmNotifier):
             'local_hostname': self.local_hostname,
             'mail_sender': self.mail_sender,
             'mail_receivers': self.mail_receivers,
+            'queue_size': self.queue_size,
+            'digest_window': self.digest_window,
           },
         }
         return d
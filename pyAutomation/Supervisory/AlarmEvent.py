@@ -0,0 +1,48 @@
+import datetime
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pyAutomation.DataObjects.Alarm import Alarm
+
+
+class AlarmEvent(object):
+    """ An alarm transition queued for an AlarmNotifier. The details of the
+    alarm are copied when the event is queued, so the notifier's worker
+    never reads the alarm while the logic changes it.
+
+    Transitions of an alarm that arrive while its event is still queued are
+    merged into the event: verb is the latest transition, transitions the
+    number merged and time the time of the first.
+
+    """
+
+    __slots__ = (
+      'name',
+      'description',
+      'consequences',
+      'more_info',
+      'verb',
+      'time',
+      'transitions',
+    )
+
+    def __init__(
+      self,
+      alarm: 'Alarm',
+      verb: 'str',
+      time: 'datetime.datetime',
+    ) -> 'None':
+        self.name = alarm.name  # type: str
+        self.description = alarm.description  # type: str
+        self.consequences = alarm.consequences  # type: str
+        self.more_info = alarm.more_info  # type: str
+        self.verb = verb  # type: str
+        self.time = time  # type: datetime.datetime
+        self.transitions = 1  # type: int
+
+    def merge(self, verb: 'str') -> 'None':
+        self.verb = verb
+        self.transitions += 1
+
+    def __repr__(self) -> 'str':
+        return f"AlarmEvent({self.name}, {self.verb}, {self.transitions})"
@@ -1,36 +1,74 @@
+import collections
 import threading
-import time
 import typing
 from .SupervisedThread import SupervisedThread
+from .Clock import Clock
+from .TimerQueue import TimerQueue
+from pyAutomation.DataObjects.Alarm import Alarm
 
 if typing.TYPE_CHECKING:
-    from DataObjects.Alarm import Alarm
+    from typing import Deque, Dict, List, Optional, Tuple
 
 
 class AlarmHandler(SupervisedThread):
+    """ Times the on and off delays of the alarms, keeps the list of active
+    alarms and passes alarm transitions on to the alarm notifiers.
+
+    More than flood_threshold alarms activating within flood_window seconds
+    is an alarm flood (by default the ISA-18.2 rate of 10 in 10 minutes).
+    During a flood only the first transition of each group of related
+    alarms (see Alarm.group) is passed to the notifiers, the others are
+    counted. Alarms without a group are each a group of their own, so only
+    the first flood_group_limit groups are passed on at all, the
+    transitions of any further groups are all counted. The flood is over
+    once the rate falls to half the threshold, the notifiers are then sent
+    the number of transitions held back for each group, see
+    AlarmNotifier.notify_summary(). While flooded, HMI clients are sent the
+    active alarm list at most once every hmi_period seconds (see
+    RpcServer).
+
+    Every transition, whether passed on or not, is kept in events.
+
+    """
+
+    def __init__(
+      self,
+      logger,
+      name,
+      flood_threshold: 'int' = 10,
+      flood_window: 'float' = 600.0,
+      flood_group_limit: 'int' = 10,
+      hmi_period: 'float' = 5.0,
+      event_capacity: 'int' = 10000,
+    ):
+
+        # this condition controls access to the active alarms.
+        self.active_alarm_list_condition = threading.Condition()
 
-    def __init__(self, logger, name):
+        # wake times of the alarms in their on or off delay.
+        self.alarm_timers = TimerQueue()
 
-        # this condition controls access to the list of active alarms.
-        self.active_alarm_list_condition = threading.Condition()
+        # active alarms keyed by handle, in the order they became active.
+        self.active_alarms = {}  # type: Dict[int, Alarm]
+        self.next_alarm = None
+        self.active_alarm_timer_list_count = 0  # type: int
 
-        # alarm_cleanup condition is used to control access to active alarm_
-        # timer_remove_list.
-        self.alarm_timer_list_remove_condition = threading.Condition()
+        self.flood_threshold = flood_threshold  # type: int
+        self.flood_window = flood_window  # type: float
+        self.flood_group_limit = flood_group_limit  # type: int
+        self.hmi_period = hmi_period  # type: float
 
-        # alarm_cleanup condition is used to control access to active alarm_
-        # timer_remove_list.
-        self.alarm_timer_list_add_condition = threading.Condition()
+        # (monotonic ns, handle, verb) of the last event_capacity alarm
+        # transitions.
+        self.events = collections.deque(
+          maxlen=event_capacity)  # type: Deque[Tuple[int, int, str]]
 
-        # flag used to indicate that we need to restart the thread.
-        self.restart_flag_condition = threading.Condition()
+        # monotonic times of the activations within the flood window.
+        self._activations = collections.deque()  # type: Deque[float]
 
-        self.active_alarm_timer_list = []
-        self.active_alarm_timer_remove_list = []
-        self.active_alarm_timer_add_list = []
-        self.active_alarm_list = []
-        self.next_alarm = None
-        self.active_alarm_timer_list_count = 0  # type: int
+        # while flooded, [first alarm, transitions held back, whether the
+        # first was passed on] of each group that has had a transition.
+        self._flood_groups = None  # type: Optional[Dict[str, List]]
 
         super().__init__(
             name=name,
@@ -42,76 +80,163 @@ class AlarmHandler(SupervisedThread):
     def config():
         pass
 
+    @property
+    def flooded(self) -> 'bool':
+        return self._flood_groups is not None
+
+    @property
+    def active_alarm_list(self) -> 'List[Alarm]':
+        """ The active alarms, oldest first. """
+        with self.active_alarm_list_condition:
+            return list(self.active_alarms.values())
+
     def add_active_alarm(self, a: 'Alarm') -> None:
         # This method will be called by the program logic so it must block
         # as little as possible.
         with self.active_alarm_list_condition:
-            if a not in self.active_alarm_list:
+            if a.handle not in self.active_alarms:
                 self.logger.info("Adding " + a.name + " to active alarm list.")
-                self.active_alarm_list.append(a)
+                self.active_alarms[a.handle] = a
 
     def remove_active_alarm(self, a: 'Alarm') -> None:
         # This method will be called by the program logic so it must block
         # as little as possible.
         with self.active_alarm_list_condition:
+            if self.active_alarms.pop(a.handle, None) is None:
+                raise ValueError(f"{a.name} is not an active alarm")
             self.logger.info("Removing " + a.name + " from active alarm list.")
-            self.active_alarm_list.remove(a)
 
-        self.logger.info("Active alarm list contains:")
-        for a in self.active_alarm_list:
-            self.logger.info(a.name)
+        self.logger.info(
+          "Active alarm list contains %s alarms.", len(self.active_alarms))
 
-    def add_alarm_timer(self, a: 'Alarm') -> None:
+    def annunciate(self, a: 'Alarm', verb: 'str') -> None:
+        """ Records a transition of an alarm and passes it on to the alarm
+        notifiers, unless it's held back by an alarm flood. """
         # This method will be called by the program logic so it must block
         # as little as possible.
-        with self.alarm_timer_list_add_condition:
-            self.active_alarm_timer_list.append(a)
-
-        # queue a run of the loop.
-        self.interrupt(
-          name=self.name + ": add alarm timer.",
-          reason=self,
-        )
+        now = Clock.monotonic()
+        with self.active_alarm_list_condition:
+            self.events.append((Clock.monotonic_ns(), a.handle, verb))
+
+            if verb == "activated":
+                self._activations.append(now)
+            flooded = self.flooded
+            summary = self._check_flood(now)
+
+            groups = self._flood_groups
+            flood_started = groups is not None and not flooded
+            if groups is None:
+                send = True
+            else:
+                group = a.name if a.group is None else a.group
+                entry = groups.get(group)
+                if entry is None:
+                    send = len(groups) < self.flood_group_limit
+                    groups[group] = [a, 0 if send else 1, send]
+                else:
+                    send = False
+                    entry[1] += 1
+
+        if flood_started:
+            # the handler has to wake up to see the flood end.
+            self.interrupt(
+              name=self.name + ": alarm flood.",
+              reason=self,
+            )
+        self._send(summary)
+        if send:
+            for notifier in Alarm.alarm_notifiers:
+                notifier.notify(a, verb)
+
+    def _check_flood(self, now: 'float') -> 'List[Tuple[Alarm, str]]':
+        """ Starts or ends the alarm flood, returns the first alarm and a
+        summary of the transitions held back of each group when a flood
+        ends. Called with the lock held. """
+        activations = self._activations
+        start = now - self.flood_window
+        while activations and activations[0] <= start:
+            activations.popleft()
+
+        if self._flood_groups is None:
+            if len(activations) > self.flood_threshold:
+                self.logger.warning(
+                  "Alarm flood, %s alarms in %s seconds.",
+                  len(activations), self.flood_window)
+                self._flood_groups = {}
+            return []
+
+        if len(activations) > self.flood_threshold // 2:
+            return []
+
+        groups = self._flood_groups
+        self._flood_groups = None
+        held = sum(count for _, count, _ in groups.values())
+        self.logger.warning(
+          "Alarm flood over, %s alarm transitions held back from the "
+          "notifiers.", held)
+        summary = []
+        for a, count, sent in groups.values():
+            if not count:
+                continue
+            if sent:
+                text = f"and {count} related alarm transitions (alarm flood)"
+            else:
+                text = f"{count} alarm transitions held back (alarm flood)"
+            summary.append((a, text))
+        return summary
+
+    def _send(self, summary: 'List[Tuple[Alarm, str]]') -> None:
+        for a, text in summary:
+            for notifier in Alarm.alarm_notifiers:
+                notifier.notify_summary(a, text)
 
-    def remove_alarm_timer(self, a: 'Alarm') -> None:
+    def add_alarm_timer(self, a: 'Alarm') -> None:
         # This method will be called by the program logic so it must block
         # as little as possible.
-        with self.alarm_timer_list_remove_condition:
-            self.active_alarm_timer_remove_list.append(a)
+        if self.alarm_timers.arm(a, a.wake_time):
+            # the handler is sleeping past the new wake time, queue a run of
+            # the loop so it goes back to sleep for the right time. Alarms
+            # that expire later don't wake it.
+            self.interrupt(
+              name=self.name + ": add alarm timer.",
+              reason=self,
+            )
 
-        # queue a run of the loop.
-        self.interrupt(
-          name=self.name + ": remove alarm timer.",
-          reason=self,
-        )
+    def remove_alarm_timer(self, a: 'Alarm') -> None:
+        # This method will be called by the program logic so it must block
+        # as little as possible. The handler isn't woken, if it's sleeping
+        # until this alarm's wake time it finds nothing due and goes back to
+        # sleep.
+        self.alarm_timers.disarm(a)
 
     def count_alarm_timer_list(self) -> int:
-        with self.alarm_timer_list_add_condition:
-            return len(self.active_alarm_timer_list)
-
-    def loop(self) -> int:
-        # process the removal list.
-        with self.alarm_timer_list_remove_condition:
-            for a in self.active_alarm_timer_remove_list:
-                self.active_alarm_timer_list.remove(a)
-            self.active_alarm_timer_remove_list.clear()
-
-        # process the add list.
-        with self.alarm_timer_list_add_condition:
-            for a in self.active_alarm_timer_add_list:
-                self.active_alarm_timer_list.append(a)
-            self.active_alarm_timer_add_list.clear()
+        return len(self.alarm_timers)
+
+    def loop(self) -> 'Optional[float]':
+        for alarm in self.alarm_timers.pop_due(Clock.monotonic()):
+            alarm.evaluate()
+
+            # still waiting, e.g. the delay was lengthened after the timer
+            # was armed.
+            wake_time = alarm.wake_time
+            if wake_time != float('inf') and alarm not in self.alarm_timers:
+                self.alarm_timers.arm(alarm, wake_time)
 
         # count the alarm lists.
-        self.active_alarm_timer_list_count = len(self.active_alarm_timer_list)
-
-        sleep_time = None
-        for alarm in self.active_alarm_timer_list:
-            if alarm.wake_time is not None:
-                t = alarm.wake_time - time.monotonic()
-                if t <= 0:
-                    alarm.evaluate()
-                elif sleep_time is None or t < sleep_time:
-                    sleep_time = t
-
-        return sleep_time
+        self.active_alarm_timer_list_count = len(self.alarm_timers)
+
+        now = Clock.monotonic()
+        wake_time = self.alarm_timers.next_deadline()
+        if self.flooded:
+            with self.active_alarm_list_condition:
+                summary = self._check_flood(now)
+                if self._flood_groups is not None:
+                    # wake when the oldest activation leaves the window.
+                    flood_time = self._activations[0] + self.flood_window
+                    if wake_time is None or flood_time < wake_time:
+                        wake_time = flood_time
+            self._send(summary)
+
+        if wake_time is None:
+            return None
+        return max(wake_time - now, 0.0)
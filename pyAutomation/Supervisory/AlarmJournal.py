@@ -0,0 +1,407 @@
+import datetime
+import heapq
+import logging
+import math
+import mmap
+import os
+import struct
+import threading
+import traceback
+from typing import TYPE_CHECKING
+from pyAutomation.Supervisory.AlarmJournalEntry import AlarmJournalEntry
+from pyAutomation.Supervisory.Clock import Clock
+
+if TYPE_CHECKING:
+    from typing import (
+      Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Set, TextIO,
+      Tuple, Union,
+    )
+    from pyAutomation.DataObjects.Alarm import Alarm
+
+# states of Alarm.evaluate(), stored by index.
+STATES = ('OFF', 'ON_DELAY', 'NEW_ALARM', 'ALARM', 'OFF_DELAY', 'ALARM_RESET')
+_STATE_CODES = {state: code for code, state in enumerate(STATES)}
+
+# segment header: magic, format version, record size and the UTC time (ns)
+# the segment was started at.
+HEADER = struct.Struct('<4sHHq')
+MAGIC = b'ALMJ'
+VERSION = 1
+
+# record: handle, old state, new state, monotonic ns, UTC ns and value.
+RECORD = struct.Struct('<IBB2xqqd')
+
+# segments are named after the UTC time of their first record.
+SEGMENT_FORMAT = 'alarms-%Y%m%dT%H%M%S.%fZ.journal'
+SEGMENT_SUFFIX = '.journal'
+NAMES_SUFFIX = '.names'
+
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+_MICROSECOND = datetime.timedelta(microseconds=1)
+
+
+def _to_utc_ns(d: 'datetime.datetime') -> 'int':
+    # naive datetimes are local time, as returned by Clock.now().
+    return (d.astimezone(datetime.timezone.utc) - _EPOCH) \
+      // _MICROSECOND * 1000
+
+
+def _to_utc(ns: 'int') -> 'datetime.datetime':
+    return _EPOCH + datetime.timedelta(0, 0, ns // 1000)
+
+
+class AlarmJournal(object):
+    """ Binary, append only journal of alarm state transitions, for
+    queries over long periods of alarm history (e.g. shift reports) without
+    parsing the text logs.
+
+    Alarm.evaluate() hands each transition to record(), which only queues
+    it. A background thread writes the queued transitions to the current
+    segment, a file of fixed size records in time order. A new segment is
+    started each time the journal is opened and every segment_period
+    seconds (aligned to UTC midnight for periods that divide a day), so
+    old history can be archived or deleted a file at a time. The handles
+    and names of the alarms recorded in a segment are kept beside it in a
+    text file, as handles aren't kept between runs.
+
+    query() reads the segments with mmap. Only the last record of the
+    segments before the time range is read, and the start of the range is
+    found by bisection, so a query for a shift reads little more than the
+    shift's records over a week or years of history. It can be used by
+    another process while the journal is being written. Records are
+    timestamped with the UTC time, when it's set back a new segment is
+    started and query() merges it with the segments it overlaps.
+
+    """
+
+    def __init__(
+      self,
+      directory: 'str',
+      segment_period: 'float' = 86400.0,
+      logger: 'str' = 'supervisory',
+    ) -> 'None':
+        assert segment_period > 0.0, \
+          f"invalid segment period of {segment_period} supplied."
+        self.directory = directory
+        self.segment_period = segment_period
+        self.logger = logging.getLogger(logger)
+
+        # this condition controls access to the queued transitions.
+        self._condition = threading.Condition()
+
+        # (handle, name, old state, new state, monotonic ns, UTC ns, value).
+        self._queue = []  # type: List[Tuple]
+        self._closed = False  # type: bool
+        self._writer = None  # type: Optional[threading.Thread]
+
+        # the rest is only used by the writer thread.
+        self._segment = None  # type: Optional[BinaryIO]
+        self._names = None  # type: Optional[TextIO]
+        self._segment_end = 0  # type: int
+        self._named = set()  # type: Set[int]
+
+        # UTC time of the last record written.
+        self._last_ns = 0  # type: int
+
+    def start(self) -> 'None':
+        os.makedirs(self.directory, exist_ok=True)
+        self._writer = threading.Thread(
+          target=self._writer_loop,
+          name="alarm-journal",
+          daemon=True,
+        )
+        self._writer.start()
+
+    def record(
+      self,
+      alarm: 'Alarm',
+      old_state: 'str',
+      new_state: 'str',
+    ) -> 'None':
+        """ Queues a transition of alarm. Called from the logic, so it must
+        block as little as possible. """
+        value = alarm.transition_value
+        if value is None:
+            value = math.nan
+        with self._condition:
+            if self._closed:
+                return
+            # timestamped with the lock held so the queue is in time order.
+            self._queue.append((
+              alarm.handle,
+              alarm.name,
+              _STATE_CODES[old_state],
+              _STATE_CODES[new_state],
+              Clock.monotonic_ns(),
+              Clock.time_ns(),
+              value,
+            ))
+            self._condition.notify()
+
+    def close(self, timeout: 'Optional[float]' = None) -> 'None':
+        """ Writes the transitions still queued and stops the writer. """
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+
+        if self._writer is not None:
+            self._writer.join(timeout)
+
+    def _writer_loop(self) -> 'None':
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._queue or self._closed)
+                batch = self._queue
+                self._queue = []
+
+            if batch:
+                try:
+                    self._write(batch)
+                except Exception:
+                    self.logger.error(
+                      f"failed to journal {len(batch)} alarm transitions: "
+                      + traceback.format_exc())
+
+            elif self._closed:
+                self._close_segment()
+                return
+
+    def _write(self, batch: 'List[Tuple]') -> 'None':
+        records = []
+        for handle, name, old, new, monotonic_ns, utc_ns, value in batch:
+            # the records of a segment are kept in UTC order for query(), so
+            # a new segment is started if the time has been set back.
+            if self._segment is None or utc_ns >= self._segment_end \
+              or utc_ns < self._last_ns:
+                self._flush(records)
+                records = []
+                self._open_segment(utc_ns)
+            self._last_ns = utc_ns
+
+            if handle not in self._named:
+                self._named.add(handle)
+                self._names.write(f"{handle}\t{name}\n")
+
+            records.append(
+              RECORD.pack(handle, old, new, monotonic_ns, utc_ns, value))
+        self._flush(records)
+
+    def _flush(self, records: 'List[bytes]') -> 'None':
+        if records:
+            # names first, so a reader knows the alarm of each record.
+            self._names.flush()
+            self._segment.write(b"".join(records))
+            self._segment.flush()
+
+    def _open_segment(self, utc_ns: 'int') -> 'None':
+        self._close_segment()
+
+        # The segment is named after utc_ns, moved on a microsecond at a time
+        # if there's already a segment of that name (e.g. the time was set
+        # back).
+        name_ns = utc_ns
+        while True:
+            path = os.path.join(
+              self.directory, _to_utc(name_ns).strftime(SEGMENT_FORMAT))
+            try:
+                segment = open(path, 'xb')
+            except FileExistsError:
+                name_ns += 1000
+                continue
+            try:
+                names = open(path[:-len(SEGMENT_SUFFIX)] + NAMES_SUFFIX, 'x')
+            except BaseException as e:
+                segment.close()
+                os.remove(path)
+                if not isinstance(e, FileExistsError):
+                    raise
+                name_ns += 1000
+                continue
+            break
+
+        segment.write(HEADER.pack(MAGIC, VERSION, RECORD.size, utc_ns))
+
+        # only set up once both files are open, if either fails the next
+        # batch tries again.
+        period = int(self.segment_period * 1e9)
+        self._segment = segment
+        self._names = names
+        self._segment_end = (utc_ns // period + 1) * period
+        self._named = set()
+        self.logger.info(f"started alarm journal segment {path}")
+
+    def _close_segment(self) -> 'None':
+        if self._segment is not None:
+            self._segment.close()
+            self._names.close()
+            self._segment = None
+            self._names = None
+
+    @staticmethod
+    def segments(directory: 'str') -> 'List[Tuple[datetime.datetime, str]]':
+        """ The start time (UTC) and path of each segment in directory,
+        oldest first. """
+        segments = []
+        for file_name in os.listdir(directory):
+            if not file_name.endswith(SEGMENT_SUFFIX):
+                continue
+            try:
+                start = datetime.datetime.strptime(file_name, SEGMENT_FORMAT)
+            except ValueError:
+                continue
+            segments.append((
+              start.replace(tzinfo=datetime.timezone.utc),
+              os.path.join(directory, file_name),
+            ))
+        segments.sort()
+        return segments
+
+    @staticmethod
+    def query(
+      directory: 'str',
+      start: 'Optional[datetime.datetime]' = None,
+      end: 'Optional[datetime.datetime]' = None,
+      alarms: 'Optional[Iterable[Union[str, int]]]' = None,
+    ) -> 'Iterator[AlarmJournalEntry]':
+        """ Yields the transitions from start up to (not including) end,
+        oldest first. Naive datetimes are taken as local time. alarms limits
+        the transitions to the alarms with the supplied names, or handles
+        for the current run.
+
+        """
+        start_ns = None if start is None else _to_utc_ns(start)
+        end_ns = None if end is None else _to_utc_ns(end)
+        names = handles = None  # type: Optional[Set[Any]]
+        if alarms is not None:
+            alarms = set(alarms)
+            names = {a for a in alarms if isinstance(a, str)}
+            handles = alarms - names
+
+        # Segments normally run until the next one starts, but the one
+        # started when the time was set back overlaps those before it. The
+        # segments in each run of overlapping ones are merged.
+        overlapping = []  # type: List[str]
+        overlapping_end = 0
+        for segment_start, path in AlarmJournal.segments(directory):
+            first_ns = _to_utc_ns(segment_start)
+            if end_ns is not None and first_ns >= end_ns:
+                break
+            last_ns = AlarmJournal._segment_last_ns(path)
+            if last_ns is None or start_ns is not None and last_ns < start_ns:
+                continue
+
+            if overlapping and first_ns > overlapping_end:
+                yield from AlarmJournal._query_segments(
+                  overlapping, start_ns, end_ns, names, handles)
+                overlapping = []
+            if not overlapping or last_ns > overlapping_end:
+                overlapping_end = last_ns
+            overlapping.append(path)
+
+        if overlapping:
+            yield from AlarmJournal._query_segments(
+              overlapping, start_ns, end_ns, names, handles)
+
+    @staticmethod
+    def _segment_last_ns(path: 'str') -> 'Optional[int]':
+        """ The UTC time of the last whole record of a segment, None if it
+        doesn't have one. """
+        with open(path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            count = (size - HEADER.size) // RECORD.size
+            if count <= 0:
+                return None
+            f.seek(HEADER.size + (count - 1) * RECORD.size)
+            return RECORD.unpack(f.read(RECORD.size))[4]
+
+    @staticmethod
+    def _query_segments(
+      paths: 'List[str]',
+      start_ns: 'Optional[int]',
+      end_ns: 'Optional[int]',
+      names: 'Optional[Set[str]]',
+      handles: 'Optional[Set[int]]',
+    ) -> 'Iterator[AlarmJournalEntry]':
+        if len(paths) == 1:
+            return AlarmJournal._query_segment(
+              paths[0], start_ns, end_ns, names, handles)
+        return heapq.merge(
+          *(
+            AlarmJournal._query_segment(path, start_ns, end_ns, names, handles)
+            for path in paths
+          ),
+          key=lambda e: e.time,
+        )
+
+    @staticmethod
+    def _query_segment(
+      path: 'str',
+      start_ns: 'Optional[int]',
+      end_ns: 'Optional[int]',
+      names: 'Optional[Set[str]]',
+      handles: 'Optional[Set[int]]',
+    ) -> 'Iterator[AlarmJournalEntry]':
+        # alarm name of each handle.
+        alarm_names = {}  # type: Dict[int, str]
+        names_path = path[:-len(SEGMENT_SUFFIX)] + NAMES_SUFFIX
+        if os.path.exists(names_path):
+            with open(names_path) as f:
+                for line in f:
+                    handle, _, name = line.rstrip("\n").partition("\t")
+                    if handle:
+                        alarm_names[int(handle)] = name
+
+        wanted = None  # type: Optional[Set[int]]
+        if names is not None:
+            wanted = set(handles)
+            wanted.update(
+              h for h, name in alarm_names.items() if name in names)
+            if not wanted:
+                return
+
+        with open(path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < HEADER.size:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                magic, version, record_size, _ = HEADER.unpack_from(m, 0)
+                assert magic == MAGIC and version == VERSION \
+                  and record_size == RECORD.size, \
+                  f"{path} isn't an alarm journal segment."
+
+                # a record still being written is left out.
+                count = (size - HEADER.size) // RECORD.size
+                unpack_from = RECORD.unpack_from
+
+                def utc_ns(i):
+                    return unpack_from(m, HEADER.size + i * RECORD.size)[4]
+
+                # the first record at or after start.
+                low = 0
+                if start_ns is not None:
+                    high = count
+                    while low < high:
+                        middle = (low + high) // 2
+                        if utc_ns(middle) < start_ns:
+                            low = middle + 1
+                        else:
+                            high = middle
+
+                offset = HEADER.size + low * RECORD.size
+                for _ in range(low, count):
+                    handle, old, new, monotonic_ns, record_ns, value = \
+                      unpack_from(m, offset)
+                    offset += RECORD.size
+                    if end_ns is not None and record_ns >= end_ns:
+                        break
+                    if wanted is not None and handle not in wanted:
+                        continue
+                    yield AlarmJournalEntry(
+                      handle=handle,
+                      name=alarm_names.get(handle),
+                      old_state=STATES[old],
+                      new_state=STATES[new],
+                      monotonic_ns=monotonic_ns,
+                      time=_to_utc(record_ns),
+                      value=value,
+                    )
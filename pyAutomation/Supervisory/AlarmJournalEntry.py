@@ -0,0 +1,27 @@
+import datetime
+from typing import NamedTuple, Optional
+
+
+class AlarmJournalEntry(NamedTuple):
+    """ A state transition of an alarm read back from the AlarmJournal. """
+
+    # handle of the alarm when it was recorded, handles are only unique
+    # within one run of the Supervisor, so use the name across runs.
+    handle: int
+
+    # name of the alarm, None if it wasn't recorded.
+    name: 'Optional[str]'
+
+    # states of the alarm before and after the transition, see
+    # Alarm.evaluate().
+    old_state: str
+    new_state: str
+
+    # monotonic time of the transition, as Clock.monotonic_ns().
+    monotonic_ns: int
+
+    # time of the transition in UTC.
+    time: datetime.datetime
+
+    # value of the alarm input, see Alarm.transition_value.
+    value: float
@@ -1,9 +1,159 @@
+import datetime
+import logging
+import threading
+import traceback
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
 from pyAutomation.DataObjects.Alarm import Alarm
+from pyAutomation.Supervisory.AlarmEvent import AlarmEvent
+from pyAutomation.Supervisory.Clock import Clock
+
+if TYPE_CHECKING:
+    from typing import Dict, List, Optional
 
 
 class AlarmNotifier(ABC):
+    """ Routes alarm transitions to an output (e-mail, a database, ...).
+
+    Alarm.evaluate() calls notify() on the logic thread, so notify() only
+    queues an event and returns. A single worker thread per notifier hands
+    the queued events to send(), which does the slow part. The worker waits
+    digest_window seconds after the first event of a batch, events queued
+    in that time are sent together as a digest.
+
+    The queue is bounded by queue_size alarms and never blocks the caller:
+        - a transition of an alarm that is already queued is merged into
+          its event, see AlarmEvent.
+        - an event for any other alarm is dropped while the queue is full,
+          the number dropped is passed with the next batch.
+
+    notify_summary() queues an event carrying a summary (e.g. of the
+    transitions held back by an alarm flood) in place of a transition.
+    Summaries are never merged, so they don't overwrite a queued transition
+    of the same alarm.
+
+    """
+
+    parameters = {
+      'queue_size': '1000',
+      'digest_window': '5.0',
+    }
+
+    def __init__(self, name: 'str', logger: 'str') -> 'None':
+        self.logger = logging.getLogger(logger)
+        self.name = name
+        self.queue_size = AlarmNotifier.parameters['queue_size']
+        self.digest_window = AlarmNotifier.parameters['digest_window']
+
+        # this condition controls access to the queued events.
+        self._condition = threading.Condition()
+
+        # queued events keyed by alarm handle, in the order they arrived.
+        self._pending = {}  # type: Dict[int, AlarmEvent]
+        # queued summaries, sent after the events of the same batch.
+        self._summaries = []  # type: List[AlarmEvent]
+        self._dropped = 0  # type: int
+        self._closed = False  # type: bool
+        self._worker = None  # type: Optional[threading.Thread]
+
+    def notify(self, alarm: 'Alarm', verb: 'str') -> 'None':
+        """ Queues a transition of alarm. Called from the logic, so it must
+        block as little as possible. """
+        with self._condition:
+            if self._closed:
+                return
+
+            event = self._pending.get(alarm.handle)
+            if event is not None:
+                event.merge(verb)
+                return
+
+            if self._worker is None:
+                self._start()
+
+            if len(self._pending) + len(self._summaries) >= self._queue_size:
+                self._dropped += 1
+                return
+
+            self._pending[alarm.handle] = AlarmEvent(
+              alarm=alarm,
+              verb=verb,
+              time=Clock.now(datetime.timezone.utc),
+            )
+            self._condition.notify()
+
+    def notify_summary(self, alarm: 'Alarm', text: 'str') -> 'None':
+        """ Queues a summary about alarm, sent with text as the verb of its
+        event. Called from the logic, so it must block as little as
+        possible. """
+        with self._condition:
+            if self._closed:
+                return
+
+            if self._worker is None:
+                self._start()
+
+            if len(self._pending) + len(self._summaries) >= self._queue_size:
+                self._dropped += 1
+                return
+
+            self._summaries.append(AlarmEvent(
+              alarm=alarm,
+              verb=text,
+              time=Clock.now(datetime.timezone.utc),
+            ))
+            self._condition.notify()
+
+    def _start(self) -> 'None':
+        # the parameters are assigned from the configuration as given.
+        self._queue_size = int(self.queue_size)
+        self._digest_window = float(self.digest_window)
+        self._worker = threading.Thread(
+          target=self._worker_loop,
+          name=f"notifier-{self.name}",
+          daemon=True,
+        )
+        self._worker.start()
+
+    def _worker_loop(self) -> 'None':
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                  lambda: self._pending or self._summaries or self._dropped
+                  or self._closed)
+                if not self._closed and self._digest_window > 0.0:
+                    self._condition.wait_for(
+                      lambda: self._closed, self._digest_window)
+
+                events = list(self._pending.values()) + self._summaries
+                dropped = self._dropped
+                self._pending = {}
+                self._summaries = []
+                self._dropped = 0
+
+                if not events and not dropped:
+                    return
+
+            try:
+                self.send(events, dropped)
+            except Exception:
+                self.logger.error(
+                  f"{self.name} failed to send {len(events)} alarm events: "
+                  + traceback.format_exc())
+
+    def close(self, timeout: 'Optional[float]' = None) -> 'None':
+        """ Sends the events still queued and stops the worker. """
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+            worker = self._worker
+
+        if worker is not None:
+            worker.join(timeout)
 
     @abstractmethod
-    def notify(self, alarm: Alarm, verb: str) -> None:
+    def send(self, events: 'List[AlarmEvent]', dropped: 'int') -> 'None':
+        """ Delivers a batch of events, oldest first. dropped is the number
+        of events left out since the last batch because the queue was full.
+        Runs on the worker thread. """
         pass
@@ -0,0 +1,76 @@
+import asyncio
+import concurrent.futures
+import logging
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Callable, Any
+    from pyAutomation.Supervisory.AsyncSupervisedTask import \
+      AsyncSupervisedTask
+
+
+class AsyncEventLoop(object):
+    """ A single asyncio event loop, run on its own thread, that all of the
+    AsyncSupervisedTasks of the Supervisor share. Other threads hand work to
+    the loop with call_soon_threadsafe()."""
+
+    def __init__(self, logger: 'str') -> 'None':
+        self.logger = logging.getLogger(logger)
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(
+          target=self._run,
+          name="async event loop",
+          daemon=True,
+        )  # type: threading.Thread
+
+    def _run(self) -> 'None':
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def start(self) -> 'None':
+        self.thread.start()
+
+    @property
+    def in_loop_thread(self) -> 'bool':
+        """ True when called from the thread running the event loop. """
+        return threading.current_thread() is self.thread
+
+    def call_soon_threadsafe(
+      self,
+      callback: 'Callable',
+      *args: 'Any',
+    ) -> 'None':
+        self.loop.call_soon_threadsafe(callback, *args)
+
+    def submit(
+      self,
+      task: 'AsyncSupervisedTask',
+    ) -> 'concurrent.futures.Future':
+        """ Runs a task on the loop. """
+        return asyncio.run_coroutine_threadsafe(task.run(), self.loop)
+
+    def shutdown(self, timeout: 'float' = 5.0) -> 'None':
+        """ Cancels whatever is still running on the loop and stops it. """
+
+        async def cancel_tasks():
+            tasks = [
+              t for t in asyncio.all_tasks() if t is not asyncio.current_task()
+            ]
+            for t in tasks:
+                t.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        if not self.thread.is_alive():
+            return
+
+        future = asyncio.run_coroutine_threadsafe(cancel_tasks(), self.loop)
+        try:
+            future.result(timeout)
+        except (concurrent.futures.TimeoutError, Exception):
+            self.logger.warning("Not all async tasks stopped cleanly.")
+
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(timeout)
+        if not self.thread.is_alive():
+            self.loop.close()
@@ -0,0 +1,109 @@
+import asyncio
+import traceback
+from abc import abstractmethod
+from typing import TYPE_CHECKING
+from pyAutomation.Supervisory.SupervisedThread import SupervisedThread
+
+if TYPE_CHECKING:
+    from typing import Optional
+    from pyAutomation.Supervisory.AsyncEventLoop import AsyncEventLoop
+
+
+class AsyncSupervisedTask(SupervisedThread):
+    """ A SupervisedThread whose loop is a coroutine. Rather than getting an
+    OS thread of its own, the task runs on the event loop shared by all of
+    the async tasks of the Supervisor, so network drivers can await I/O
+    without tying up a thread each.
+
+    The loop()/sleep time contract is the same as a SupervisedThread.
+    Interrupts can come from any thread, they are handed to the event loop
+    with call_soon_threadsafe.
+
+    """
+
+    # the shared event loop, set by the Supervisor before start().
+    event_loop = None  # type: 'AsyncEventLoop'
+
+    def __init__(self, name: str, loop, period, logger: str) -> None:
+        self._event = None  # type: asyncio.Event
+        self.future = None
+        super().__init__(
+          name=name,
+          loop=loop,
+          period=period,
+          logger=logger,
+        )
+
+    @abstractmethod
+    async def loop(self) -> 'Optional[float]':
+        """ Coroutine where the designer inserts logic for this module. Must
+        not block, anything slow needs to be awaited."""
+
+    async def open(self) -> 'None':
+        """ Called on the event loop before the first cycle, e.g. to open
+        connections or start servers."""
+
+    async def close(self) -> 'None':
+        """ Called on the event loop once the task has stopped. """
+
+    def start(self) -> 'None':
+        assert self.event_loop is not None, \
+          f"{self.name} has no event loop to run on."
+        self.future = self.event_loop.submit(self)
+
+    def _wake(self, first: 'bool') -> 'None':
+        # only the first interrupt of a cycle needs to reach the loop, the
+        # rest are picked up by the same cycle.
+        if not first or self._event is None:
+            return
+
+        if self.event_loop.in_loop_thread:
+            self._event.set()
+        else:
+            self.event_loop.call_soon_threadsafe(self._event.set)
+
+    async def run_cycle_async(self) -> 'Optional[float]':
+        """ The coroutine version of run_cycle. """
+        self._start_cycle()
+        self.sleep_time = await self.loop()
+        return self._finish_cycle()
+
+    async def run(self) -> 'None':
+        """ Runs the task on the event loop until it quits. """
+        self._event = asyncio.Event()
+        try:
+            self.prepare()
+            await self.open()
+
+            while not self._quit:
+                # cleared before looking for interrupts, see
+                # SupervisedThread.thread_loop
+                self._event.clear()
+                sleep_time = await self.run_cycle_async()
+
+                if sleep_time is None:
+                    await self._event.wait()
+
+                elif sleep_time > 0.0:
+                    try:
+                        await asyncio.wait_for(self._event.wait(), sleep_time)
+                    except asyncio.TimeoutError:
+                        pass
+
+                else:
+                    # let the other tasks run.
+                    await asyncio.sleep(0)
+
+        except asyncio.CancelledError:
+            self._quit = True
+
+        except Exception:
+            self.logger.error(traceback.format_exc())
+            self._quit = True
+
+        finally:
+            try:
+                await self.close()
+            except Exception:
+                self.logger.error(traceback.format_exc())
+            self.stopped()
@@ -0,0 +1,99 @@
+import itertools
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import List, Optional, Tuple
+    from pyAutomation.DataObjects.PointAbstract import PointAbstract
+
+
+class ChangeLog(object):
+    """ Numbers every change made to the points of the process from a single
+    counter and keeps the most recent changes in a ring buffer, so a
+    consumer (e.g. the HMI) that remembers the sequence number of its last
+    read can get the points changed since then in time proportional to the
+    number of changes rather than the size of the database.
+
+    The sequence numbers are only kept here, not on the points, which find
+    their last one in the ring, see seq_of().
+
+    """
+
+    def __init__(self, capacity: 'int' = 4096) -> 'None':
+        assert capacity > 0, \
+          f"invalid change log capacity of {capacity} supplied."
+        self.capacity = capacity
+
+        # hands out the sequence numbers, next() on it is atomic so record()
+        # doesn't need a lock.
+        self._counter = itertools.count(1)
+
+        # sequence number of the latest change, 0 before the first. Writers
+        # racing each other can leave it a little behind.
+        self._last = 0  # type: int
+
+        # (sequence number, point) of each of the last capacity changes,
+        # indexed by sequence number modulo capacity. The sequence number
+        # tells a reader whether the entry has been written yet, or has
+        # already been overwritten.
+        self._entries = [(0, None)] * capacity  # type: List[Tuple]
+
+    @property
+    def seq(self) -> 'int':
+        return self._last
+
+    def record(self, point: 'PointAbstract') -> 'int':
+        """ Logs a change to point and returns its sequence number. """
+        seq = next(self._counter)
+        self._entries[seq % self.capacity] = (seq, point)
+        self._last = seq
+        return seq
+
+    def seq_of(self, point: 'PointAbstract') -> 'int':
+        """ Sequence number of the last change to point, or 0 if it hasn't
+        changed within the last capacity changes. Walks the ring back from
+        the latest change, so it's meant for diagnostics and tests rather
+        than for every point on every poll. """
+        entries = self._entries
+        capacity = self.capacity
+        seq = self._last
+        oldest = max(seq - capacity, 0)
+        while seq > oldest:
+            entry_seq, p = entries[seq % capacity]
+            if entry_seq != seq:
+                # overwritten by a later change.
+                break
+            if p is point:
+                return seq
+            seq -= 1
+        return 0
+
+    def changed_since(
+      self,
+      seq: 'int',
+    ) -> 'Tuple[int, Optional[List[PointAbstract]]]':
+        """ Returns the current sequence number and the points changed after
+        seq, each listed once in the order of their first change. The points
+        are None if the changes after seq have already been overwritten (or
+        seq wasn't handed out by this log), in which case the consumer has
+        to read every point it's interested in.
+
+        """
+        if seq > self._last:
+            return self._last, None
+
+        # points aren't hashable, see PointReadOnlyAbstract.__eq__.
+        points = {}
+        entries = self._entries
+        capacity = self.capacity
+        seq += 1
+        while True:
+            entry_seq, point = entries[seq % capacity]
+            if entry_seq != seq:
+                if entry_seq > seq:
+                    # lapped by the writers.
+                    return self._last, None
+                # not written yet.
+                break
+            points.setdefault(id(point), point)
+            seq += 1
+        return seq - 1, list(points.values())
@@ -0,0 +1,116 @@
+import datetime
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Optional, Tuple
+    from pyAutomation.Supervisory.VirtualClock import VirtualClock
+
+EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+# how far the UTC clock can move against the monotonic clock (an NTP step,
+# the time being set on a board without an RTC) before the conversions
+# between them are anchored again.
+ANCHOR_TOLERANCE_NS = 1000000
+
+
+class Clock(object):
+    """ The clock read by the framework and by logic. Everything that needs
+    the time of day or a monotonic timer should read it from here rather than
+    from datetime.now() or time.monotonic() so that a VirtualClock can be
+    installed in its place, e.g. by the SimulationRunner of a test bench.
+
+    With no VirtualClock installed the system clocks are read directly.
+
+    """
+
+    # the virtual clock in use, None for real time.
+    _virtual = None  # type: Optional[VirtualClock]
+
+    # (monotonic time, UTC time as ns since the epoch) read together, used
+    # to convert between them, see _get_anchor().
+    _anchor = None  # type: Optional[Tuple[int, int]]
+
+    @classmethod
+    def install(cls, clock: 'Optional[VirtualClock]') -> 'None':
+        """ Replaces the clock read by the framework, None goes back to real
+        time. """
+        cls._virtual = clock
+        cls._anchor = None
+
+    @classmethod
+    def is_virtual(cls) -> 'bool':
+        return cls._virtual is not None
+
+    @classmethod
+    def monotonic_ns(cls) -> 'int':
+        virtual = cls._virtual
+        if virtual is None:
+            return time.monotonic_ns()
+        return virtual.monotonic_ns()
+
+    @classmethod
+    def monotonic(cls) -> 'float':
+        virtual = cls._virtual
+        if virtual is None:
+            return time.monotonic()
+        return virtual.monotonic()
+
+    @classmethod
+    def time_ns(cls) -> 'int':
+        """ UTC time as ns since the epoch, same as time.time_ns(). """
+        virtual = cls._virtual
+        if virtual is None:
+            return time.time_ns()
+        return virtual.time_ns()
+
+    @classmethod
+    def now(
+      cls,
+      tz: 'Optional[datetime.tzinfo]' = None,
+    ) -> 'datetime.datetime':
+        """ The time of day, same as datetime.datetime.now(tz). """
+        virtual = cls._virtual
+        if virtual is None:
+            return datetime.datetime.now(tz)
+        return virtual.now(tz)
+
+    @classmethod
+    def _get_anchor(cls) -> 'Tuple[int, int]':
+        """ The (monotonic, UTC) pair the conversions are made from. It's
+        kept between calls so conversions in both directions agree, and
+        taken again once the UTC clock has been stepped (or has slewed) by
+        more than ANCHOR_TOLERANCE_NS against the monotonic clock. """
+        mono = cls.monotonic_ns()
+        utc = cls.time_ns()
+        anchor = cls._anchor
+        if anchor is None \
+          or abs((utc - mono) - (anchor[1] - anchor[0])) \
+          > ANCHOR_TOLERANCE_NS:
+            anchor = cls._anchor = (mono, utc)
+        return anchor
+
+    @classmethod
+    def to_datetime(cls, ns: 'int') -> 'datetime.datetime':
+        """ The time of day (as returned by now()) at the monotonic time ns,
+        to the microsecond. It goes through UTC, so the local time follows
+        changes of UTC offset (e.g. daylight saving) and steps of the system
+        time. """
+        # positional arguments are much quicker than microseconds=.
+        utc = EPOCH + datetime.timedelta(0, 0, cls.to_utc_ns(ns) // 1000)
+        return utc.astimezone().replace(tzinfo=None)
+
+    @classmethod
+    def to_monotonic_ns(cls, d: 'datetime.datetime') -> 'int':
+        """ The monotonic time of the time of day d, see to_datetime(). A
+        naive d is local time. """
+        mono, utc = cls._get_anchor()
+        delta = d.astimezone() - EPOCH
+        return mono - utc + ((delta.days * 86400 + delta.seconds) * 1000000
+                             + delta.microseconds) * 1000
+
+    @classmethod
+    def to_utc_ns(cls, ns: 'int') -> 'int':
+        """ The UTC time (ns since the epoch) at the monotonic time ns. """
+        mono, utc = cls._get_anchor()
+        return utc + ns - mono
@@ -0,0 +1,126 @@
+from pyAutomation.Supervisory.ConfigurationException import \
+  ConfigurationException
+
+
+class DeadlineScheduler(object):
+    """ Keeps the periodic deadline of a SupervisedThread on the monotonic
+    nanosecond clock, so wall clock jumps (NTP, DST) cannot skew the period.
+
+    The deadline only advances when a periodic cycle is due, interrupt driven
+    runs between deadlines do not shift the phase of the period. A cycle that
+    finishes after the following deadline has overrun, and the overrun policy
+    decides what happens to the deadlines that were missed:
+
+      skip        - drop the missed cycles and stay in phase with the period.
+      catch_up    - run the missed cycles back to back until back in phase.
+      fixed_delay - the next period starts when the previous cycle finished.
+
+    """
+
+    policies = ('skip', 'catch_up', 'fixed_delay')
+
+    def __init__(self, period: 'float', policy: 'str' = 'skip') -> 'None':
+        if policy not in self.policies:
+            raise ConfigurationException(
+              f"Invalid overrun policy of '{policy}', valid policies are: "
+              f"{', '.join(self.policies)}"
+            )
+
+        if period is None or period <= 0.0:
+            raise ConfigurationException(
+              f"Invalid period of {period} supplied to DeadlineScheduler."
+            )
+
+        self.period_ns = int(period * 1e9)  # type: int
+        self.policy = policy  # type: str
+
+        # the deadline of the next periodic cycle.
+        self.deadline_ns = None  # type: int
+
+        # the deadline and start time of the periodic cycle currently running.
+        # The deadline is None if the current cycle was started by an
+        # interrupt.
+        self._cycle_deadline_ns = None  # type: int
+        self._cycle_start_ns = None  # type: int
+
+        # number of periodic cycles that finished after the next deadline.
+        self.overruns = 0  # type: int
+
+        # number of deadlines dropped by the 'skip' policy.
+        self.skipped = 0  # type: int
+
+        # the amount of time the last overrun went past its deadline.
+        self.last_overrun_ns = 0  # type: int
+
+        # jitter is the delay between a deadline and the start of its cycle.
+        self.periodic_cycles = 0  # type: int
+        self.last_jitter_ns = 0  # type: int
+        self.max_jitter_ns = 0  # type: int
+        self.total_jitter_ns = 0  # type: int
+
+    def start(self, now_ns: 'int') -> 'None':
+        """ Anchors the schedule, the first periodic cycle is due at now_ns."""
+        self.deadline_ns = now_ns
+
+    def cycle_started(self, now_ns: 'int') -> 'bool':
+        """ Called at the start of every cycle. Returns True if the cycle is a
+        periodic one (i.e. its deadline has arrived) and records the jitter of
+        that cycle.
+
+        """
+        if now_ns < self.deadline_ns:
+            self._cycle_deadline_ns = None
+            return False
+
+        jitter = now_ns - self.deadline_ns
+        self._cycle_deadline_ns = self.deadline_ns
+        self._cycle_start_ns = now_ns
+        self.periodic_cycles += 1
+        self.last_jitter_ns = jitter
+        self.total_jitter_ns += jitter
+        if jitter > self.max_jitter_ns:
+            self.max_jitter_ns = jitter
+        return True
+
+    def cycle_finished(self, now_ns: 'int') -> 'None':
+        """ Called at the end of every cycle. Advances the deadline according
+        to the overrun policy if the cycle was a periodic one.
+
+        """
+        deadline = self._cycle_deadline_ns
+        if deadline is None:
+            return
+        self._cycle_deadline_ns = None
+
+        next_deadline = deadline + self.period_ns
+        late = now_ns >= next_deadline
+
+        # Only count cycles that ran past a deadline that was still ahead of
+        # them when they started. Backlog cycles run by the 'catch_up' policy
+        # start late and aren't overruns in their own right.
+        if late and self._cycle_start_ns < next_deadline:
+            self.overruns += 1
+            self.last_overrun_ns = now_ns - next_deadline
+
+        if self.policy == 'fixed_delay':
+            self.deadline_ns = now_ns + self.period_ns
+
+        elif late and self.policy == 'skip':
+            missed = (now_ns - deadline) // self.period_ns
+            self.skipped += missed
+            self.deadline_ns = deadline + (missed + 1) * self.period_ns
+
+        else:
+            # on time, or catching up one period at a time.
+            self.deadline_ns = next_deadline
+
+    def time_until_deadline(self, now_ns: 'int') -> 'float':
+        """ Returns the number of seconds until the next periodic cycle is
+        due. Zero or negative values mean the cycle is already due."""
+        return (self.deadline_ns - now_ns) / 1e9
+
+    @property
+    def mean_jitter_ns(self) -> 'float':
+        if self.periodic_cycles == 0:
+            return 0.0
+        return self.total_jitter_ns / self.periodic_cycles
@@ -0,0 +1,196 @@
+import gc
+import logging
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING
+from pyAutomation.Supervisory.ConfigurationException import \
+  ConfigurationException
+
+if TYPE_CHECKING:
+    from typing import Any, Dict, List, Optional, Tuple
+    from pyAutomation.Supervisory.SupervisedThread import SupervisedThread
+
+
+class GcManager(object):
+    """ Keeps the cyclic garbage collector out of the middle of scans.
+
+    Once the Supervisor has built the point database and the threads, the
+    objects it created live until shutdown. freeze moves them into the
+    permanent generation so collections no longer traverse them. With
+    automatic collection turned off, the collector is instead run by the
+    threads themselves at the end of a cycle, when they are about to sleep
+    for at least min_idle seconds (or until interrupted). The thresholds
+    decide which generation is due the same way they do for automatic
+    collection. If no thread goes idle for long enough, a collection is
+    forced once the allocations reach force_factor times the first
+    threshold so garbage cannot pile up without bound.
+
+    Every collection, automatic or not, is timed and recorded as a pause in
+    the statistics of the thread that ran it.
+
+    """
+
+    # keywords accepted in the 'gc' entry of the Supervisor section.
+    keywords = ('freeze', 'automatic', 'thresholds', 'min_idle')
+
+    force_factor = 10  # type: int
+
+    def __init__(
+      self,
+      freeze: 'bool' = True,
+      automatic: 'bool' = False,
+      thresholds: 'Optional[Tuple[int, int, int]]' = None,
+      min_idle: 'float' = 0.005,
+      logger: 'str' = 'supervisory',
+    ) -> 'None':
+        if thresholds is None:
+            thresholds = gc.get_threshold()
+        thresholds = tuple(int(t) for t in thresholds)
+        if len(thresholds) != 3 or thresholds[0] <= 0:
+            raise ConfigurationException(
+              f"Invalid gc thresholds of {thresholds}, three counts are "
+              "needed and the first must be positive."
+            )
+
+        if min_idle < 0.0:
+            raise ConfigurationException(
+              f"Invalid gc min_idle of {min_idle}, must not be negative."
+            )
+
+        self.logger = logging.getLogger(logger)
+        self.freeze = bool(freeze)  # type: bool
+        self.automatic = bool(automatic)  # type: bool
+        self.thresholds = thresholds  # type: Tuple[int, int, int]
+        self.min_idle = min_idle  # type: float
+
+        # only one thread collects at a time, the others carry on.
+        self._collect_lock = threading.Lock()
+
+        # pauses seen on each OS thread and not yet recorded against a
+        # SupervisedThread. Bounded as threads that never run a cycle (e.g.
+        # the RPC server) never drain theirs.
+        self._local = threading.local()
+
+        self.collections = 0  # type: int
+        self._started = False
+
+    @classmethod
+    def from_config(
+      cls,
+      data: 'Optional[Dict[str, Any]]',
+    ) -> 'Optional[GcManager]':
+        """ Builds a GcManager from the 'gc' entry of the Supervisor section
+        of logic.yaml, returns None if there is no such entry."""
+        if data is None:
+            return None
+
+        if data is True:
+            data = {}
+
+        for kw in data:
+            if kw not in cls.keywords:
+                raise ConfigurationException(
+                  f"Unknown gc setting '{kw}', valid settings are: "
+                  f"{', '.join(cls.keywords)}"
+                )
+
+        return cls(
+          freeze=data.get('freeze', True),
+          automatic=data.get('automatic', False),
+          thresholds=data.get('thresholds'),
+          min_idle=float(data.get('min_idle', 0.005)),
+        )
+
+    def start(self) -> 'None':
+        """ Called once the startup heap is built and before any threads are
+        started or processes forked. """
+        gc.callbacks.append(self._callback)
+        gc.set_threshold(*self.thresholds)
+
+        if self.freeze:
+            gc.collect()
+            gc.freeze()
+            self.logger.info(
+              f"froze {gc.get_freeze_count()} objects after startup")
+
+        if not self.automatic:
+            gc.disable()
+
+        self._started = True
+
+    def stop(self) -> 'None':
+        """ Goes back to automatic collection. """
+        if not self._started:
+            return
+        self._started = False
+        gc.enable()
+        gc.callbacks.remove(self._callback)
+
+    def _pauses(self) -> 'deque':
+        pauses = getattr(self._local, 'pauses', None)
+        if pauses is None:
+            pauses = self._local.pauses = deque(maxlen=64)
+        return pauses
+
+    def _callback(self, phase: 'str', info: 'Dict[str, Any]') -> 'None':
+        # runs on the thread that triggered the collection, with the GIL
+        # held throughout.
+        if phase == 'start':
+            self._local.start_ns = time.perf_counter_ns()
+        else:
+            start_ns = getattr(self._local, 'start_ns', None)
+            if start_ns is not None:
+                self._pauses().append(time.perf_counter_ns() - start_ns)
+                self._local.start_ns = None
+
+    def take_pauses(self) -> 'List[int]':
+        """ Returns and forgets the pauses, in nanoseconds, seen on the
+        calling thread. """
+        pauses = self._pauses()
+        taken = list(pauses)
+        pauses.clear()
+        return taken
+
+    def due_generation(self) -> 'Optional[int]':
+        """ The generation a collection should run on, None if no collection
+        is due. Follows the rules of automatic collection. """
+        counts = gc.get_count()
+        if counts[0] <= self.thresholds[0]:
+            return None
+        if counts[1] > self.thresholds[1]:
+            if counts[2] > self.thresholds[2]:
+                return 2
+            return 1
+        return 0
+
+    def cycle_finished(self, thread: 'SupervisedThread') -> 'None':
+        """ Called by a thread at the end of each cycle, once its sleep time
+        is known. Records the pauses of the cycle and collects if the thread
+        is going idle. """
+        for pause in self.take_pauses():
+            thread.statistics.record_gc_pause(pause)
+
+        if self.automatic:
+            return
+
+        generation = self.due_generation()
+        if generation is None:
+            return
+
+        sleep_time = thread.sleep_time
+        idle = sleep_time is None or sleep_time >= self.min_idle
+        forced = gc.get_count()[0] > self.thresholds[0] * self.force_factor
+        if not idle and not forced:
+            return
+
+        if not self._collect_lock.acquire(blocking=False):
+            return
+        try:
+            gc.collect(generation)
+            self.collections += 1
+        finally:
+            self._collect_lock.release()
+
+        for pause in self.take_pauses():
+            thread.statistics.record_gc_pause(pause)
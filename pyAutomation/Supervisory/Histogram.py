@@ -0,0 +1,73 @@
+from array import array
+from bisect import bisect_left
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Dict, Any, Sequence
+
+# 1-2-5 series of bucket bounds from 10us to 10s, in nanoseconds.
+DURATION_BOUNDS_NS = tuple(
+  m * 10 ** e for e in range(4, 10) for m in (1, 2, 5)
+) + (10 ** 10,)
+
+# bucket bounds for event rates, in events per second.
+RATE_BOUNDS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+
+
+class Histogram(object):
+    """ Fixed bucket histogram of integer samples. The bucket bounds and
+    counts are preallocated arrays so recording a sample is a bisect and two
+    additions, with no allocation.
+
+    Bucket i counts samples <= bounds[i] (and > bounds[i - 1]), the final
+    bucket counts everything above the last bound. Samples are recorded by
+    a single thread, readers may see a snapshot that is one sample stale.
+
+    """
+
+    def __init__(self, bounds: 'Sequence[int]') -> 'None':
+        assert list(bounds) == sorted(bounds), \
+          "Histogram bounds must be in ascending order."
+        self.bounds = array('q', bounds)  # type: array
+        self.counts = array('Q', bytes(8 * (len(bounds) + 1)))  # type: array
+        self.count = 0  # type: int
+        self.total = 0  # type: int
+        self.max = 0  # type: int
+
+    def record(self, value: 'int') -> 'None':
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, p: 'float') -> 'int':
+        """ Returns the upper bound of the bucket holding the p'th percentile,
+        or the largest sample if it falls in the overflow bucket."""
+        if self.count == 0:
+            return 0
+        rank = self.count * p / 100.0
+        seen = 0
+        for i, c in enumerate(self.counts):
+            seen += c
+            if seen >= rank and c > 0:
+                if i < len(self.bounds):
+                    return self.bounds[i]
+                break
+        return self.max
+
+    @property
+    def mean(self) -> 'float':
+        if self.count == 0:
+            return 0.0
+        return self.total / self.count
+
+    @property
+    def snapshot(self) -> 'Dict[str, Any]':
+        return {
+          'bounds': self.bounds.tolist(),
+          'counts': self.counts.tolist(),
+          'count': self.count,
+          'sum': self.total,
+          'max': self.max,
+        }
@@ -0,0 +1,64 @@
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING
+from pyAutomation.Supervisory.ScanStatistics import ScanStatistics
+
+if TYPE_CHECKING:
+    from typing import List
+    from pyAutomation.Supervisory.SupervisedThread import SupervisedThread
+
+logger = logging.getLogger('supervisory')
+
+
+class MetricsServer(object):
+    """ Serves the ScanStatistics of the supervised threads as plain text on
+    http://<address>:<port>/metrics for a local scraper to poll. Binds to
+    the loopback interface unless told otherwise."""
+
+    def __init__(
+      self,
+      thread_list: 'List[SupervisedThread]',
+      port: 'int',
+      address: 'str' = '127.0.0.1',
+    ) -> 'None':
+        self.thread_list = thread_list
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> 'None':
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = ScanStatistics.metrics_text(
+                  server.thread_list).encode('utf-8')
+                self.send_response(200)
+                self.send_header(
+                  'Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args) -> 'None':
+                logger.debug("metrics: " + format, *args)
+
+        self.http_server = ThreadingHTTPServer((address, port), Handler)
+        self.http_server.daemon_threads = True
+        self.thread = threading.Thread(
+          target=self.http_server.serve_forever,
+          name="metrics server",
+          daemon=True,
+        )
+
+    @property
+    def port(self) -> 'int':
+        return self.http_server.server_address[1]
+
+    def start(self) -> 'None':
+        logger.info("Serving metrics on port %s", self.port)
+        self.thread.start()
+
+    def close(self) -> 'None':
+        self.http_server.shutdown()
+        self.http_server.server_close()
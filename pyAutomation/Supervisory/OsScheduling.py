@@ -0,0 +1,110 @@
+import logging
+import os
+import threading
+from typing import TYPE_CHECKING
+from pyAutomation.Supervisory.ConfigurationException import \
+  ConfigurationException
+
+if TYPE_CHECKING:
+    from typing import Dict, Any, List
+
+
+class OsScheduling(object):
+    """ Operating system scheduling settings for a single thread: the CPUs it
+    may run on, its nice value and an optional SCHED_FIFO real-time
+    priority. Linux applies all of these per thread, so apply() must be
+    called by the thread being configured. Threads it creates afterwards
+    inherit the settings.
+
+    Settings the platform or the process privileges don't allow are logged
+    and skipped, the thread always keeps running.
+
+    """
+
+    keys = ('cpu_affinity', 'nice', 'sched_priority')
+
+    def __init__(
+      self,
+      cpu_affinity: 'List[int]' = None,
+      nice: 'int' = None,
+      sched_priority: 'int' = None,
+    ) -> 'None':
+        if cpu_affinity is not None:
+            if isinstance(cpu_affinity, int):
+                cpu_affinity = [cpu_affinity]
+            try:
+                cpu_affinity = [int(c) for c in cpu_affinity]
+            except (TypeError, ValueError):
+                raise ConfigurationException(
+                  f"Invalid cpu_affinity of {cpu_affinity}, expected a list "
+                  "of CPU numbers."
+                )
+            if not cpu_affinity or min(cpu_affinity) < 0:
+                raise ConfigurationException(
+                  f"Invalid cpu_affinity of {cpu_affinity}, expected a list "
+                  "of CPU numbers."
+                )
+
+        if nice is not None and not -20 <= int(nice) <= 19:
+            raise ConfigurationException(
+              f"Invalid nice value of {nice}, must be between -20 and 19."
+            )
+
+        if sched_priority is not None and not 1 <= int(sched_priority) <= 99:
+            raise ConfigurationException(
+              f"Invalid sched_priority of {sched_priority}, must be between "
+              "1 and 99."
+            )
+
+        self.cpu_affinity = cpu_affinity  # type: List[int]
+        if nice is not None:
+            nice = int(nice)
+        if sched_priority is not None:
+            sched_priority = int(sched_priority)
+        self.nice = nice  # type: int
+        self.sched_priority = sched_priority  # type: int
+
+    @classmethod
+    def from_config(cls, data: 'Dict[str, Any]') -> 'OsScheduling':
+        """ Builds the settings from a yaml section, returns None if the
+        section doesn't contain any of them."""
+        if data is None or not any(k in data for k in cls.keys):
+            return None
+        return cls(**{k: data[k] for k in cls.keys if k in data})
+
+    def apply(self, logger: 'logging.Logger') -> 'None':
+        """ Applies the settings to the calling thread. """
+        tid = threading.get_native_id()
+        name = threading.current_thread().name
+
+        if self.cpu_affinity is not None:
+            try:
+                os.sched_setaffinity(tid, self.cpu_affinity)
+                logger.info(
+                  "%s pinned to CPU(s) %s", name, self.cpu_affinity)
+            except (AttributeError, OSError) as e:
+                logger.warning(
+                  "Unable to set the CPU affinity of %s: %s", name, e)
+
+        if self.nice is not None:
+            try:
+                os.setpriority(os.PRIO_PROCESS, tid, self.nice)
+                logger.info("%s nice value set to %s", name, self.nice)
+            except (AttributeError, OSError) as e:
+                logger.warning(
+                  "Unable to set the nice value of %s: %s", name, e)
+
+        if self.sched_priority is not None:
+            try:
+                os.sched_setscheduler(
+                  tid,
+                  os.SCHED_FIFO,
+                  os.sched_param(self.sched_priority),
+                )
+                logger.info(
+                  "%s running SCHED_FIFO at priority %s",
+                  name, self.sched_priority)
+            except (AttributeError, OSError) as e:
+                logger.warning(
+                  "Unable to set SCHED_FIFO priority of %s, it needs "
+                  "CAP_SYS_NICE or an RLIMIT_RTPRIO allowance: %s", name, e)
@@ -0,0 +1,47 @@
+import threading
+from typing import TYPE_CHECKING
+from pyAutomation.DataObjects.ChangeSet import ChangeSet
+
+if TYPE_CHECKING:
+    from typing import Optional
+
+
+class PointBatch(object):
+    """ Context manager returned by PointManager.batch(). Points changed on
+    this thread while it's open hold back their observer callbacks, which
+    are then made once per observer when the outermost batch closes, see
+    ChangeSet. Batches can be nested.
+
+    Batches belong to the thread that opened them, writes made by other
+    threads notify straight away. For the same reason an async routine
+    must not await while it holds a batch open.
+
+    """
+
+    # the ChangeSet of the batch open on each thread.
+    _local = threading.local()
+
+    @classmethod
+    def current(cls) -> 'Optional[ChangeSet]':
+        """ The ChangeSet collecting the changes made by this thread, None
+        when no batch is open. """
+        return getattr(cls._local, 'change_set', None)
+
+    def __init__(self) -> 'None':
+        self._outermost = False
+
+    def __enter__(self) -> 'ChangeSet':
+        change_set = PointBatch.current()
+        if change_set is None:
+            self._outermost = True
+            change_set = self._local.change_set = ChangeSet()
+        return change_set
+
+    def __exit__(self, *args) -> 'None':
+        # the points have changed whether or not the batch was completed, so
+        # the observers are always told.
+        if self._outermost:
+            self._outermost = False
+            change_set = self._local.change_set
+            self._local.change_set = None
+            change_set.notify_observers()
@@ -9,18 +9,23 @@ from pyAutomation.DataObjects.ProcessValue import ProcessValue
 from pyAutomation.DataObjects.PointAnalog import PointAnalog
 from pyAutomation.DataObjects.PointAnalogReadOnly import PointAnalogReadOnly
 from pyAutomation.DataObjects.PointReadOnly import PointReadOnly
+from pyAutomation.DataObjects.PointAnalogAggregate import \
+  PointAnalogAggregate
 from pyAutomation.DataObjects.PointAnalogDual import PointAnalogDual
 from pyAutomation.DataObjects.PointAnalogScaled import PointAnalogScaled
 from pyAutomation.DataObjects.PointDiscrete import PointDiscrete
 from pyAutomation.DataObjects.PointEnumeration import PointEnumeration
 from pyAutomation.DataObjects.Alarm import Alarm
 from pyAutomation.DataObjects.AlarmAnalog import AlarmAnalog
+from pyAutomation.Supervisory.ChangeLog import ChangeLog
 from pyAutomation.Supervisory.Interruptable import Interruptable
+from pyAutomation.Supervisory.PointBatch import PointBatch
+from pyAutomation.Supervisory.PointStore import PointStore
 from pyAutomation.Supervisory.ConfigurationException import \
   ConfigurationException
 
 if TYPE_CHECKING:
-    from typing import Dict, Any
+    from typing import Dict, Any, Iterator, List, Optional, Tuple
     from pyAutomation.DataObjects.PointReadOnlyAbstract \
       import PointReadOnlyAbstract
 
@@ -40,6 +45,7 @@ yml.indent(sequence=4, offset=2)
 
 # Register all the requried classes.
 yml.register_class(PointAnalog)
+yml.register_class(PointAnalogAggregate)
 yml.register_class(PointAnalogDual)
 yml.register_class(PointAnalogScaled)
 yml.register_class(PointDiscrete)
@@ -54,6 +60,9 @@ yml.register_class(PointReadOnly)
 class PointManager:
     ''' Singleton for managing the point database for a system. '''
 
+    # Columnar store holding the state of every point, if one is in use.
+    point_store = None  # type: PointStore
+
     @staticmethod
     def load_points_from_yaml_file(file: 'str') -> 'None':
         """ Loads points from a yaml file.
@@ -100,9 +109,59 @@ class PointManager:
 
     @staticmethod
     def clear_database() -> 'None':
+        PointManager.use_point_store(None)
         GLOBAL_ALARMS.clear()
         GLOBAL_POINTS.clear()
 
+    @staticmethod
+    def batch() -> 'PointBatch':
+        """ Groups the point writes made by this thread into one update,
+        e.g. all the inputs read from a device:
+
+            with PointManager.batch():
+                point_1.value = 1.0
+                point_2.quality = False
+
+        Each observer of the changed points is interrupted once when the
+        batch closes, with a ChangeSet of the points it observes as the
+        reason, rather than once per write. """
+        return PointBatch()
+
+    @staticmethod
+    def create_point_store() -> 'PointStore':
+        """ Moves the value, quality, last update and forced state of every
+        point in the database into a PointStore. Points must not be added
+        to the database afterwards. """
+        PointManager.use_point_store(None)
+        PointManager.point_store = PointStore(PointManager.all_points())
+        return PointManager.point_store
+
+    @staticmethod
+    def use_point_store(store: 'PointStore') -> 'None':
+        """ Makes store the point store of the database (e.g. the store of a
+        SharedPointTable), closing the one in use. """
+        old = PointManager.point_store
+        PointManager.point_store = store
+        if old is not None and old is not store:
+            old.close()
+
+    @staticmethod
+    def use_change_log(capacity: 'int') -> 'ChangeLog':
+        """ Replaces the log of point changes with one holding the last
+        capacity changes. Consumers holding sequence numbers of the old log
+        get every point on their next changed_since. """
+        PointAbstract.change_log = ChangeLog(capacity)
+        return PointAbstract.change_log
+
+    @staticmethod
+    def changed_since(
+      seq: 'int',
+    ) -> 'Tuple[int, Optional[List[PointAbstract]]]':
+        """ Returns the latest change sequence number and the points
+        changed after seq, see ChangeLog.changed_since. Pass 0 the first
+        time. """
+        return PointAbstract.change_log.changed_since(seq)
+
     @staticmethod
     def add_to_database(
       name: 'str',
@@ -114,7 +173,7 @@ class PointManager:
           obj, (
             PointAbstract,
             PointAnalogScaled,
-            PointAnalogDual,
+            PointAnalogAggregate,
             ProcessValue,
         )):
             if name in GLOBAL_POINTS:
@@ -132,6 +191,8 @@ class PointManager:
         )):
             GLOBAL_ALARMS[name] = obj
             obj.name = name
+            # hand out the handle now so handles follow the database order.
+            obj.handle
 
     @staticmethod
     def assign_points(
@@ -226,6 +287,7 @@ class PointManager:
           'PointAnalogScaled',
           'PointDiscrete',
           'PointEnumeration',
+          'PointAnalogAggregate',
           'PointAnalogDual',
           'ProcessValue',
         ):
@@ -335,6 +397,22 @@ class PointManager:
     def global_alarms():
         return GLOBAL_ALARMS
 
+    @staticmethod
+    def all_points() -> 'Iterator[PointAbstract]':
+        """ Yields every read/write point in the database, including the
+        points wrapped by ProcessValues. """
+        for p in GLOBAL_POINTS.values():
+            if isinstance(p, ProcessValue):
+                points = [p.readwrite_object] \
+                  + list(p.control_points.values()) \
+                  + list(p.related_points.values())
+            else:
+                points = [p.readwrite_object]
+
+            for point in points:
+                if isinstance(point, PointAbstract):
+                    yield point
+
     @staticmethod
     def get_hmi_point(s: 'str') -> 'PointReadOnlyAbstract':
         return PointManager().find_point(s)
@@ -0,0 +1,238 @@
+import math
+from typing import TYPE_CHECKING
+from pyAutomation.DataObjects.PointAbstract import READ_SPINS, _yield
+from pyAutomation.DataObjects.PointDiscrete import PointDiscrete
+from pyAutomation.DataObjects.PointEnumeration import PointEnumeration
+
+if TYPE_CHECKING:
+    from typing import Dict, List, Iterable, Any, Optional, Tuple, Union
+    from pyAutomation.DataObjects.PointAbstract import PointAbstract
+    from pyAutomation.Supervisory.SharedPointTable import SharedPointTable
+
+# value kinds, used to turn the stored double back into the point's type.
+KIND_FLOAT = 0
+KIND_BOOL = 1
+KIND_INT = 2
+
+# (column, array typecode, item size in bytes), 8 byte columns first to
+# keep them aligned.
+COLUMNS = (
+  ('value', 'd', 8),
+  ('timestamp', 'q', 8),
+  ('seq', 'Q', 8),
+  ('quality', 'B', 1),
+  ('forced', 'B', 1),
+  ('kind', 'B', 1),
+)
+
+
+class PointStore(object):
+    """ Columnar storage for the value, quality, timestamp (a
+    Clock.monotonic_ns() value), forced flag and change sequence number of
+    a set of points. Each point is given a row (its handle) and from then
+    on acts as a view of that row, so bulk operations (staleness checks,
+    HMI deltas, historian sampling, alarm scans) can work over the columns
+    rather than walking the point objects.
+
+    The columns are typed memoryviews over a single buffer, which is a
+    bytearray unless one is supplied (e.g. a shared memory block, see
+    SharedPointTable). column() hands out read only views of them that can
+    be wrapped without copying, e.g. by numpy.frombuffer.
+
+    Each write of a row increments its sequence number before and after the
+    write (it's odd while a write is in progress) so read() never returns a
+    half written row, and so comparing sequence numbers tells which rows
+    changed.
+
+    """
+
+    @staticmethod
+    def buffer_size(rows: 'int') -> 'int':
+        """ Bytes needed to store rows points, rounded up to a multiple of 8
+        so further data can follow it in the same buffer. """
+        size = sum(item * rows for _, _, item in COLUMNS)
+        return (size + 7) & ~7
+
+    def __init__(
+      self,
+      points: 'Iterable[PointAbstract]',
+      buffer: 'Union[memoryview, bytearray, None]' = None,
+    ) -> 'None':
+        # points are only stored once, even if they are listed more than
+        # once (e.g. as a point and as the point of a ProcessValue).
+        self.points = []  # type: List[PointAbstract]
+        seen = set()
+        for p in points:
+            if id(p) not in seen:
+                seen.add(id(p))
+                self.points.append(p)
+
+        # handle of each named point.
+        self.handles = {}  # type: Dict[str, int]
+
+        # set when the store is shared between processes, the points owned
+        # by this process publish their changes through it.
+        self.shared_table = None  # type: Optional[SharedPointTable]
+
+        self.size = len(self.points)
+        if buffer is None:
+            buffer = bytearray(max(PointStore.buffer_size(self.size), 1))
+        assert len(buffer) >= PointStore.buffer_size(self.size), \
+            "The buffer supplied to the PointStore is too small"
+
+        offset = 0
+        self._views = []  # type: List[memoryview]
+        for column, typecode, item in COLUMNS:
+            raw = memoryview(buffer)[offset:offset + item * self.size]
+            view = raw.cast(typecode)
+            setattr(self, '_' + column, view)
+            self._views += [view, raw]
+            offset += item * self.size
+
+        for h, p in enumerate(self.points):
+            if p.name is not None:
+                self.handles[p.name] = h
+            self._seq[h] = 0
+            if isinstance(p, PointDiscrete):
+                self._kind[h] = KIND_BOOL
+            elif isinstance(p, PointEnumeration):
+                self._kind[h] = KIND_INT
+            else:
+                self._kind[h] = KIND_FLOAT
+            p.bind(self, h)
+
+    def __len__(self) -> 'int':
+        return self.size
+
+    def close(self) -> 'None':
+        """ Moves the state of the points back into the point objects and
+        releases the buffer. Points that have since been bound to another
+        store are left alone. """
+        for p in self.points:
+            if p._store is self:
+                p.unbind()
+        for view in self._views:
+            view.release()
+        self._views = []
+
+    def _to_point_value(self, h: 'int', value: 'float') -> 'Any':
+        # NaN is the only value not equal to itself.
+        if value != value:
+            return None
+        kind = self._kind[h]
+        if kind == KIND_FLOAT:
+            return value
+        elif kind == KIND_BOOL:
+            return bool(value)
+        return int(value)
+
+    # Writers, a row is only written by one thread (or process) at a time,
+    # the sequence number is set rather than incremented so that it always
+    # ends up even if that doesn't hold.
+    def _begin(self, h: 'int') -> 'int':
+        seq = self._seq[h] | 1
+        self._seq[h] = seq
+        return seq
+
+    def write(
+      self,
+      h: 'int',
+      value: 'Any',
+      quality: 'bool',
+      timestamp: 'int',
+    ) -> 'None':
+        seq = self._begin(h)
+        self._value[h] = math.nan if value is None else float(value)
+        self._quality[h] = 1 if quality else 0
+        self._timestamp[h] = timestamp
+        self._seq[h] = seq + 1
+
+    def set_value(self, h: 'int', value: 'Any') -> 'None':
+        seq = self._begin(h)
+        self._value[h] = math.nan if value is None else float(value)
+        self._seq[h] = seq + 1
+
+    def set_quality(self, h: 'int', quality: 'bool') -> 'None':
+        seq = self._begin(h)
+        self._quality[h] = 1 if quality else 0
+        self._seq[h] = seq + 1
+
+    def set_timestamp(self, h: 'int', timestamp: 'int') -> 'None':
+        seq = self._begin(h)
+        self._timestamp[h] = timestamp
+        self._seq[h] = seq + 1
+
+    def set_forced(self, h: 'int', forced: 'bool') -> 'None':
+        seq = self._begin(h)
+        self._forced[h] = 1 if forced else 0
+        self._seq[h] = seq + 1
+
+    # Readers of single columns.
+    def value(self, h: 'int') -> 'Any':
+        return self._to_point_value(h, self._value[h])
+
+    def quality(self, h: 'int') -> 'bool':
+        return self._quality[h] == 1
+
+    def timestamp(self, h: 'int') -> 'int':
+        return self._timestamp[h]
+
+    def forced(self, h: 'int') -> 'bool':
+        return self._forced[h] == 1
+
+    def seq(self, h: 'int') -> 'int':
+        return self._seq[h]
+
+    def read(self, h: 'int') -> 'Tuple[Any, bool, int]':
+        """ Returns a consistent (value, quality, timestamp) of a row. """
+        spins = 0
+        while True:
+            seq = self._seq[h]
+            if not seq & 1:
+                value = self._value[h]
+                quality = self._quality[h]
+                timestamp = self._timestamp[h]
+                if self._seq[h] == seq:
+                    break
+
+            # the writer may have been preempted mid write, let it finish
+            # rather than spinning on the row.
+            spins += 1
+            if spins >= READ_SPINS:
+                _yield()
+        return self._to_point_value(h, value), quality == 1, timestamp
+
+    # Bulk operations over the columns.
+    def column(self, name: 'str') -> 'memoryview':
+        """ A read only view of one of the COLUMNS. """
+        return getattr(self, '_' + name).toreadonly()
+
+    def seqs(self) -> 'List[int]':
+        """ The sequence number of every row, to be passed to changed()
+        later on. """
+        return self._seq.tolist()
+
+    def changed(self, seqs: 'List[int]') -> 'List[int]':
+        """ Handles of the rows written since seqs() was called. """
+        return [
+          h for h, (old, new) in enumerate(zip(seqs, self._seq.tolist()))
+          if old != new
+        ]
+
+    def stale(self, older_than: 'int') -> 'List[int]':
+        """ Handles of the points last updated before older_than, a
+        Clock.monotonic_ns() value. """
+        return [
+          h for h, t in enumerate(self._timestamp.tolist()) if t < older_than
+        ]
+
+    def bad_quality(self) -> 'List[int]':
+        """ Handles of the points with bad quality. """
+        return [h for h, q in enumerate(self._quality.tolist()) if q == 0]
+
+    def values(self, handles: 'Iterable[int]' = None) -> 'List[Any]':
+        """ The values of the supplied rows, or of every row. """
+        values = self._value.tolist()
+        if handles is None:
+            handles = range(self.size)
+        return [self._to_point_value(h, values[h]) for h in handles]
@@ -0,0 +1,30 @@
+from typing import TYPE_CHECKING
+from pyAutomation.Supervisory.ScanStatistics import ScanStatistics
+
+if TYPE_CHECKING:
+    from typing import Any, Dict
+    from pyAutomation.Supervisory.SupervisedThread import SupervisedThread
+
+
+class RemoteThread(object):
+    """ Stands in for a SupervisedThread that runs in a worker process, so
+    the HMI thread list and the metrics of the Supervisor cover it. Holds
+    the status and statistics last reported by the worker, see
+    SharedPointTable.report_threads()."""
+
+    def __init__(self, thread: 'SupervisedThread') -> 'None':
+        self._name = thread.name
+        self.pickle_dict = thread.pickle_dict  # type: Dict[str, Any]
+        self.statistics = ScanStatistics()  # type: ScanStatistics
+
+    @property
+    def name(self) -> 'str':
+        return self._name
+
+    def update(
+      self,
+      pickle_dict: 'Dict[str, Any]',
+      statistics: 'ScanStatistics',
+    ) -> 'None':
+        self.pickle_dict = pickle_dict
+        self.statistics = statistics
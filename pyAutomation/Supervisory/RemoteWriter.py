@@ -0,0 +1,40 @@
+from typing import TYPE_CHECKING
+from pyAutomation.Supervisory.Interruptable import Interruptable
+
+if TYPE_CHECKING:
+    from typing import Any
+    from pyAutomation.Supervisory.SharedPointTable import SharedPointTable
+
+
+class RemoteWriter(Interruptable):
+    """ Stands in for the writer of a point that runs in another process.
+    Interrupts, such as a request being written to the point, are forwarded
+    to the owning process where the real writer is interrupted."""
+
+    def __init__(
+      self,
+      name: 'str',
+      table: 'SharedPointTable',
+      process: 'int',
+    ) -> 'None':
+        self._name = name
+        self.table = table
+        self.process = process
+
+    @property
+    def name(self) -> 'str':
+        return self._name
+
+    @name.setter
+    def name(self, name) -> 'None':
+        self._name = name
+
+    def interrupt(self, name: 'str', reason: 'Any') -> 'None':
+        value = None
+        if getattr(reason, 'requestable', False):
+            value = reason._request_value
+        self.table.send_request(
+          process=self.process,
+          point_name=reason.name,
+          value=value,
+        )
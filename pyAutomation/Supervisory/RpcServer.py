@@ -1,45 +1,89 @@
 from typing import TYPE_CHECKING
-from datetime import datetime, timedelta
 import logging
 import jsonpickle
 import rpyc
 import pyAutomation.Supervisory.PointManager
+from pyAutomation.DataObjects.PointAbstract import PointAbstract
+from pyAutomation.DataObjects.PointAnalogAggregate import \
+  PointAnalogAggregate
+from pyAutomation.DataObjects.PointAnalogReadOnly import PointAnalogReadOnly
+from pyAutomation.DataObjects.PointAnalogScaled import PointAnalogScaled
+from pyAutomation.DataObjects.PointReadOnly import PointReadOnly
+from pyAutomation.DataObjects.ProcessValue import ProcessValue
+from pyAutomation.Supervisory.Clock import Clock
+from pyAutomation.Supervisory.PointManager import PointManager
 
 if TYPE_CHECKING:
-    from typing import List, Dict, Callable
+    from typing import Any, List, Dict, Callable, Optional, Set, Tuple
     from pyAutomation.DataObjects.Alarm import Alarm
-    from pyAutomation.DataObjects.PointAbstract import PointAbstract
     from pyAutomation.DataObjects.PointReadOnlyAbstract \
         import PointReadOnlyAbstract
     from pyAutomation.Supervisory import SupervisedThread
+    from pyAutomation.Supervisory.AlarmHandler import AlarmHandler
 
 logger = logging.getLogger('supervisory')
 
 
 # define the rpyc server
 class RpcServer(rpyc.Service):
-    active_alarm_list = None  # type: 'List[Alarm]'
+    alarm_handler = None      # type: 'AlarmHandler'
     point_dict = {}           # type: 'Dict[str, PointAbstract]'
     thread_list = []          # type: 'List[SupervisedThread]'
-    last_read_time = None     # type: 'datetime'
     global_alarm_list = {}    # type: 'Dict[str, Alarm]'
     get_hmi_point = None      # type: 'Callable'
 
     def __init__(self):
         self.point_list = {}  # type: 'Dict[PointReadOnlyAbstract]'
+
+        # Changes are found with the change log of the point database (see
+        # PointManager.changed_since) rather than by checking every point.
+        # Monitored points are keyed by the id of each point whose changes
+        # change them, points that can't be worked out are sent every time.
+        self.watched = {}  # type: 'Dict[int, Set[str]]'
+        self.unwatched = set()  # type: 'Set[str]'
+
+        # points to send on the next request whether they changed or not.
+        self.pending = set()  # type: 'Set[str]'
+
+        # change sequence number of the last request.
+        self.last_seq = 0  # type: int
+
+        # monotonic time and encoding of the active alarm list last sent.
+        self.alarm_list = None  # type: 'Optional[Tuple[float, str]]'
         super().__init__()
 
+    @staticmethod
+    def change_sources(point: 'Any') -> 'Optional[List[PointAbstract]]':
+        """ The points whose changes change the supplied HMI point, or None
+        if they can't be worked out. """
+        if isinstance(
+          point, (PointReadOnly, PointAnalogReadOnly, PointAnalogScaled)):
+            return RpcServer.change_sources(point._point)
+        if isinstance(point, ProcessValue):
+            return RpcServer.change_sources(point._source)
+        if isinstance(point, PointAnalogAggregate):
+            sources = []
+            for p in point.points:
+                s = RpcServer.change_sources(p)
+                if s is None:
+                    return None
+                sources += s
+            return sources
+        if isinstance(point, PointAbstract):
+            return [point]
+        return None
+
     def on_connect(self, conn) -> 'None':
         # code that runs when a connection is created
         # (to init the serivce, if needed)
-        self.point_list.clear()
+        self.exposed_clear_monitored_points()
         logger.info("GUI Connection Established")
 
     def on_disconnect(self, conn) -> 'None':
         # code that runs when the connection has already closed
         # (to finalize the service, if needed)
         logger.info("GUI Connection Destroyed")
-        self.point_list.clear()
+        self.exposed_clear_monitored_points()
 
     def exposed_add_monitored_points(self, points: 'List[str]') -> 'None':
         assert self.point_dict is not None
@@ -49,29 +93,46 @@ class RpcServer(rpyc.Service):
             point = self.get_hmi_point(p)
             assert point is not None
             self.point_list.update({p: point})
-        self.last_read_time = datetime.now()
+            self.pending.add(p)
+
+            sources = RpcServer.change_sources(point)
+            if sources is None:
+                self.unwatched.add(p)
+            else:
+                for source in sources:
+                    self.watched.setdefault(id(source), set()).add(p)
 
-    def exposed_remove_monitored_points(self, points: List[str]) -> 'None':
+    def exposed_remove_monitored_points(self, points: 'List[str]') -> 'None':
         for p in points:
-            self.point_list.pop(self.point_dict[p], None)
+            self.point_list.pop(p, None)
+            self.pending.discard(p)
+            self.unwatched.discard(p)
+            for names in self.watched.values():
+                names.discard(p)
 
     def exposed_clear_monitored_points(self) -> 'None':
         logger.info("Clearning monitored points")
         self.point_list.clear()
+        self.watched.clear()
+        self.unwatched.clear()
+        self.pending.clear()
 
     def exposed_get_hmi_points_list(self) -> 'str':
-        if 0 == self.last_read_time:
-            logger.debug("First request, transmitting all points.")
-            p = self.point_list
+        seq, changed = PointManager.changed_since(self.last_seq)
+        self.last_seq = seq
+        if changed is None:
+            logger.debug("Change log overrun, transmitting all points.")
+            names = set(self.point_list)
         else:
-            # logger.debug("Processing request with last_read_time of: %s",
-            # str(self.last_read_time))
-            p = {}
-            for key, point in self.point_list.items():
-                if (point.last_update - self.last_read_time)\
-                  > timedelta(seconds=0):
-                    p.update({key: point})
-        self.last_read_time = datetime.now()
+            names = self.pending | self.unwatched
+            for point in changed:
+                names.update(self.watched.get(id(point), ()))
+        self.pending = set()
+
+        p = {}
+        for name in names:
+            if name in self.point_list:
+                p[name] = self.point_list[name]
         pickle_text = jsonpickle.encode(p)
         # logger.debug("transmitting: " + pickle_text)
         return pickle_text
@@ -84,8 +145,27 @@ class RpcServer(rpyc.Service):
         logger.debug("sending: %s", str(d))
         return jsonpickle.encode(d)
 
-    def exposed_get_active_alarm_list(self) -> 'None':
-        return jsonpickle.encode(self.active_alarm_list)
+    def exposed_get_thread_statistics(self) -> 'str':
+        """ Returns the scan time, interrupt latency, wakeup rate and overrun
+        histograms of each thread, keyed by thread name. """
+        d = {}
+        for t in self.thread_list:
+            d[t.name] = t.statistics.snapshot
+
+        return jsonpickle.encode(d)
+
+    def exposed_get_active_alarm_list(self) -> 'str':
+        # during an alarm flood the list is encoded at most once every
+        # hmi_period seconds, however often the HMIs ask.
+        now = Clock.monotonic()
+        handler = self.alarm_handler
+        if handler.flooded and self.alarm_list is not None \
+          and now - self.alarm_list[0] < handler.hmi_period:
+            return self.alarm_list[1]
+
+        encoded = jsonpickle.encode(handler.active_alarm_list)
+        self.alarm_list = (now, encoded)
+        return encoded
 
     def exposed_acknowledge_alarm(self, alarm: str) -> 'None':
         logger.info("RPC acknowledge received for %s", alarm)
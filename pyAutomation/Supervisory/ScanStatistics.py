@@ -0,0 +1,127 @@
+from typing import TYPE_CHECKING
+from pyAutomation.Supervisory.Histogram import Histogram, \
+  DURATION_BOUNDS_NS, RATE_BOUNDS
+
+if TYPE_CHECKING:
+    from typing import Dict, Any, List, Iterable
+    from pyAutomation.Supervisory.SupervisedThread import SupervisedThread
+
+
+class ScanStatistics(object):
+    """ Execution statistics of a SupervisedThread, recorded by the thread
+    itself at the end of every cycle.
+
+      sweep          - how long loop() took to run.
+      latency        - time from the first interrupt of a cycle arriving to
+                       the start of that cycle.
+      wakeup_rate    - cycles run per second, recorded once a second.
+      overrun        - how far past the next periodic deadline a cycle ran.
+      gc_pause       - garbage collections run on the thread, only recorded
+                       when the Supervisor has a GcManager.
+
+    """
+
+    # (attribute, metric name, help text, recorded in nanoseconds)
+    histograms = (
+      ('sweep', 'pyautomation_sweep_seconds',
+       'Time taken by each cycle of loop().', True),
+      ('latency', 'pyautomation_interrupt_latency_seconds',
+       'Time from an interrupt to the start of the cycle it triggered.',
+       True),
+      ('wakeup_rate', 'pyautomation_wakeups_per_second',
+       'Number of cycles run in each second.', False),
+      ('overrun', 'pyautomation_overrun_seconds',
+       'How far periodic cycles ran past the next deadline.', True),
+      ('gc_pause', 'pyautomation_gc_pause_seconds',
+       'Garbage collector pauses on the thread.', True),
+    )
+
+    def __init__(self) -> 'None':
+        self.sweep = Histogram(DURATION_BOUNDS_NS)  # type: Histogram
+        self.latency = Histogram(DURATION_BOUNDS_NS)  # type: Histogram
+        self.wakeup_rate = Histogram(RATE_BOUNDS)  # type: Histogram
+        self.overrun = Histogram(DURATION_BOUNDS_NS)  # type: Histogram
+        self.gc_pause = Histogram(DURATION_BOUNDS_NS)  # type: Histogram
+
+        self.cycles = 0  # type: int
+        self._window_start_ns = None  # type: int
+        self._window_cycles = 0  # type: int
+
+    def record_cycle(
+      self,
+      start_ns: 'int',
+      end_ns: 'int',
+      interrupted_ns: 'int' = None,
+      overrun_ns: 'int' = None,
+    ) -> 'None':
+        """ Records a cycle of the thread. interrupted_ns is the time the first
+        interrupt handled by the cycle arrived and overrun_ns is set if the
+        cycle overran its deadline."""
+        self.cycles += 1
+        self.sweep.record(end_ns - start_ns)
+
+        if interrupted_ns is not None:
+            self.latency.record(max(0, start_ns - interrupted_ns))
+
+        if overrun_ns is not None:
+            self.overrun.record(overrun_ns)
+
+        if self._window_start_ns is None:
+            self._window_start_ns = start_ns
+
+        elapsed = start_ns - self._window_start_ns
+        if elapsed >= 1000000000:
+            self.wakeup_rate.record(
+              self._window_cycles * 1000000000 // elapsed)
+            self._window_start_ns = start_ns
+            self._window_cycles = 0
+
+        self._window_cycles += 1
+
+    def record_gc_pause(self, pause_ns: 'int') -> 'None':
+        self.gc_pause.record(pause_ns)
+
+    @property
+    def snapshot(self) -> 'Dict[str, Any]':
+        d = {'cycles': self.cycles}
+        for attribute, _, _, _ in self.histograms:
+            d[attribute] = getattr(self, attribute).snapshot
+        return d
+
+    @classmethod
+    def metrics_text(cls, threads: 'Iterable[SupervisedThread]') -> 'str':
+        """ Formats the statistics of the supplied threads in the Prometheus
+        text exposition format."""
+        threads = list(threads)
+        lines = []  # type: List[str]
+
+        for attribute, metric, help_text, in_ns in cls.histograms:
+            scale = 1e9 if in_ns else 1
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} histogram")
+            for t in threads:
+                h = getattr(t.statistics, attribute)
+                label = t.name.replace('\\', '\\\\').replace('"', '\\"')
+                cumulative = 0
+                for bound, c in zip(h.bounds, h.counts):
+                    cumulative += c
+                    le = f"{bound / scale:g}"
+                    lines.append(
+                      f'{metric}_bucket{{thread="{label}",le="{le}"}} '
+                      f'{cumulative}')
+                lines.append(
+                  f'{metric}_bucket{{thread="{label}",le="+Inf"}} {h.count}')
+                lines.append(
+                  f'{metric}_sum{{thread="{label}"}} {h.total / scale:g}')
+                lines.append(
+                  f'{metric}_count{{thread="{label}"}} {h.count}')
+
+        lines.append("# HELP pyautomation_cycles_total Cycles run by loop().")
+        lines.append("# TYPE pyautomation_cycles_total counter")
+        for t in threads:
+            label = t.name.replace('\\', '\\\\').replace('"', '\\"')
+            lines.append(
+              f'pyautomation_cycles_total{{thread="{label}"}} '
+              f'{t.statistics.cycles}')
+
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,242 @@
+import logging
+import multiprocessing
+import queue
+from multiprocessing import shared_memory
+from typing import TYPE_CHECKING
+from pyAutomation.DataObjects.PointAbstract import _SHARED
+from pyAutomation.Supervisory.ConfigurationException import \
+  ConfigurationException
+from pyAutomation.Supervisory.PointStore import PointStore
+from pyAutomation.Supervisory.RemoteWriter import RemoteWriter
+
+if TYPE_CHECKING:
+    from typing import Dict, List, Iterable, Any
+    from pyAutomation.DataObjects.PointAbstract import PointAbstract
+    from pyAutomation.Supervisory.RemoteThread import RemoteThread
+    from pyAutomation.Supervisory.SupervisedThread import SupervisedThread
+
+logger = logging.getLogger('supervisory')
+
+# process index of the Supervisor itself.
+MAIN_PROCESS = 0
+
+# owner column value of a point that hasn't been claimed.
+UNCLAIMED = -1
+
+# kinds of the tuple messages, rows updated by their owner are sent as
+# bare handles.
+REQUEST = 0        # (REQUEST, handle, value, sending process)
+REQUEST_ERROR = 1  # (REQUEST_ERROR, handle, error, owning process)
+THREADS = 2        # (THREADS, [(name, status, statistics)], sending process)
+
+
+class SharedPointTable(object):
+    """ A PointStore held in a multiprocessing shared memory block so that
+    SupervisedThreads can be spread over several worker processes.
+
+    Every process keeps its own copy of the point objects, all of them views
+    of the same rows. Only the process that owns a point (the one running
+    its writer, or the Supervisor for points without a writer) writes its
+    row. It then posts the point's handle to the message queue of every
+    other process, where serve() notifies the local observers. Requests to
+    points owned by another process are forwarded to the owner by a
+    RemoteWriter. Workers also report the status and statistics of their
+    threads to the Supervisor process, where they're kept by the
+    RemoteThread registered under the same name in remote_threads.
+
+    The table must be created, and the owners claimed, before the worker
+    processes are forked.
+
+    """
+
+    def __init__(
+      self,
+      points: 'Iterable[PointAbstract]',
+      processes: 'int',
+    ) -> 'None':
+        self._ctx = multiprocessing.get_context('fork')
+
+        points = list(points)
+        self.processes = processes
+        self.process = MAIN_PROCESS  # type: int
+
+        # the store followed by the owner of each row.
+        store_size = PointStore.buffer_size(len(points))
+        self._shm = shared_memory.SharedMemory(
+          create=True,
+          size=max(store_size + 8 * len(points), 1),
+        )
+        self.store = PointStore(points, buffer=self._shm.buf[:store_size])
+        self.store.shared_table = self
+
+        # handle of each point, by name, and the local point of each handle.
+        self.handles = self.store.handles  # type: Dict[str, int]
+        self.points = self.store.points  # type: List[PointAbstract]
+        self.size = self.store.size
+
+        raw = self._shm.buf[store_size:store_size + 8 * self.size]
+        self._owner = raw.cast('q')
+        self._views = [self._owner, raw]  # type: List[memoryview]
+
+        # sequence number of each row when its observers were last
+        # notified in this process. Taken before the fork so that writes
+        # made by a worker before the other processes attach are notified.
+        self._applied = self.store.seqs()  # type: List[int]
+
+        # stand-ins for the threads of the workers, by name. Only used in
+        # the Supervisor process.
+        self.remote_threads = {}  # type: Dict[str, RemoteThread]
+
+        self._claim_lock = self._ctx.Lock()
+        self._queues = [
+          self._ctx.Queue() for _ in range(processes)
+        ]  # type: List[multiprocessing.Queue]
+
+        for h in range(self.size):
+            self._owner[h] = UNCLAIMED
+
+    @property
+    def name(self) -> 'str':
+        return self._shm.name
+
+    def claim(self, point_name: 'str', process: 'int') -> 'None':
+        """ Makes process the owner of a point. A point has exactly one
+        owner across all of the processes."""
+        h = self.handles[point_name]
+        with self._claim_lock:
+            owner = self._owner[h]
+            if owner != UNCLAIMED and owner != process:
+                raise ConfigurationException(
+                  f"Point {point_name} is written by process {owner} and "
+                  f"can't also be written by process {process}."
+                )
+            self._owner[h] = process
+
+    def owner(self, point_name: 'str') -> 'int':
+        return self._owner[self.handles[point_name]]
+
+    def attach(self, process: 'int') -> 'None':
+        """ Called in each process after the fork. Points owned by the
+        process publish their writes to the table, points owned by other
+        processes forward interrupts to their owner."""
+        self.process = process
+        for h, p in enumerate(self.points):
+            owner = self._owner[h]
+            if owner == UNCLAIMED:
+                owner = MAIN_PROCESS
+            if owner == process:
+                p._flags |= _SHARED
+            elif p.writer is not None:
+                p._writer = RemoteWriter(
+                  name=p.writer.name,
+                  table=self,
+                  process=owner,
+                )
+
+    def publish(self, p: 'PointAbstract') -> 'None':
+        """ Lets the other processes know that a locally owned point
+        changed. """
+        h = p._handle
+        self._applied[h] = self.store.seq(h)
+        for i, q in enumerate(self._queues):
+            if i != self.process:
+                q.put_nowait(h)
+
+    def read(self, h: 'int') -> 'tuple':
+        """ Returns a consistent (value, quality, timestamp) of a row. """
+        return self.store.read(h)
+
+    def send_request(
+      self,
+      process: 'int',
+      point_name: 'str',
+      value: 'Any',
+    ) -> 'None':
+        self._queues[process].put_nowait(
+          (REQUEST, self.handles[point_name], value, self.process))
+
+    def report_threads(self, threads: 'List[SupervisedThread]') -> 'None':
+        """ Sends the status and statistics of the threads of this process
+        to the Supervisor process. """
+        self._queues[MAIN_PROCESS].put_nowait((
+          THREADS,
+          [(t.name, t.pickle_dict, t.statistics) for t in threads],
+          self.process,
+        ))
+
+    def _apply(self, h: 'int') -> 'None':
+        seq = self.store.seq(h)
+        if seq == self._applied[h]:
+            return
+        self._applied[h] = seq
+        self.points[h]._notify_observers()
+
+    def _request(self, h: 'int', value: 'Any') -> 'None':
+        p = self.points[h]
+        if p.requestable and value is not None:
+            p.request_value = value
+        elif p.writer is not None:
+            p.writer.interrupt(name=p.name, reason=p)
+
+    def serve(self) -> 'None':
+        """ Applies the messages sent to this process until stop() is
+        called. Updates to the same point that queued up while the previous
+        batch was being applied are only applied once. A request that fails
+        is logged and the error is sent back to the process that made it,
+        where it's logged too."""
+        q = self._queues[self.process]
+        while True:
+            messages = [q.get()]
+            try:
+                while True:
+                    messages.append(q.get_nowait())
+            except queue.Empty:
+                pass
+
+            # handles of the updated rows, in the order they arrived.
+            updates = {}  # type: Dict[int, None]
+            for m in messages:
+                if m is None:
+                    return
+                if not isinstance(m, tuple):
+                    updates[m] = None
+                elif m[0] == REQUEST:
+                    _, h, value, sender = m
+                    try:
+                        self._request(h, value)
+                    except Exception as e:
+                        logger.exception(
+                          "Failed to apply a request to %s from process %s",
+                          self.points[h].name, sender)
+                        self._queues[sender].put_nowait(
+                          (REQUEST_ERROR, h, repr(e), self.process))
+                elif m[0] == THREADS:
+                    for name, status, statistics in m[1]:
+                        remote = self.remote_threads.get(name)
+                        if remote is not None:
+                            remote.update(status, statistics)
+                else:
+                    _, h, error, owner = m
+                    logger.error(
+                      "Request to %s failed in process %s: %s",
+                      self.points[h].name, owner, error)
+
+            for h in updates:
+                try:
+                    self._apply(h)
+                except Exception:
+                    logger.exception(
+                      "Failed to apply the update of %s", self.points[h].name)
+
+    def stop(self, process: 'int') -> 'None':
+        """ Makes serve() return in the supplied process. """
+        self._queues[process].put(None)
+
+    def close(self) -> 'None':
+        self.store.close()
+        for view in self._views:
+            view.release()
+        self._views = []
+        self._shm.close()
+        if self.process == MAIN_PROCESS:
+            self._shm.unlink()
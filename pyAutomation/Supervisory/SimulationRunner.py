@@ -0,0 +1,174 @@
+import heapq
+import itertools
+import logging
+from collections import deque
+from typing import TYPE_CHECKING
+from pyAutomation.Supervisory.Clock import Clock
+from pyAutomation.Supervisory.VirtualClock import VirtualClock
+
+if TYPE_CHECKING:
+    from typing import Dict, Iterable, List, Optional, Tuple
+    from pyAutomation.Supervisory.SupervisedThread import SupervisedThread
+
+
+class SimulationRunner(object):
+    """ Runs SupervisedThreads one cycle at a time against a VirtualClock.
+    Instead of sleeping, the clock jumps straight to the next wake deadline,
+    so scenarios that take hours of plant time run as fast as the logic
+    allows, and always in the same order.
+
+    The runner stands in for the executor of its threads: the sleep time
+    returned by run_cycle() arms a virtual timer, None waits for an
+    interrupt and 0.0 runs the thread again at the same instant. Threads
+    woken at the same instant run in the order they were woken, timers that
+    expire together run in the order they were armed.
+
+    The threads must not be started, the runner calls prepare() and
+    run_cycle() itself from the calling thread.
+
+    """
+
+    def __init__(
+      self,
+      threads: 'Iterable[SupervisedThread]',
+      clock: 'Optional[VirtualClock]' = None,
+      logger: 'str' = 'simulation',
+      stall_limit: 'int' = 10000,
+    ) -> 'None':
+        self.logger = logging.getLogger(logger)
+        self.clock = clock if clock is not None else VirtualClock()
+        self.threads = list(threads)  # type: List[SupervisedThread]
+
+        # number of cycles that may run without the clock moving before the
+        # simulation is assumed to be stuck in a busy loop.
+        self.stall_limit = stall_limit  # type: int
+
+        self._ready = deque()  # type: deque
+        self._queued = set()   # type: set
+
+        # min-heap of (due time ns, tie breaker, token, thread), stale
+        # entries are dropped lazily, see SupervisedThreadPool.
+        self._timers = []  # type: List[Tuple[int, int, int, SupervisedThread]]
+        self._sequence = itertools.count()
+        self._token = {}  # type: Dict[int, int]
+
+        self.cycles = 0  # type: int
+        self._started = False
+
+    def start(self) -> 'None':
+        """ Installs the virtual clock and queues the first cycle of every
+        thread. """
+        Clock.install(self.clock)
+        for thread in self.threads:
+            thread.executor = self
+            thread.prepare()
+            self._token[id(thread)] = 0
+            self._queue(thread)
+        self._started = True
+
+    def stop(self) -> 'None':
+        """ Puts the real clock back. """
+        Clock.install(None)
+        self._started = False
+
+    def __enter__(self) -> 'SimulationRunner':
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> 'None':
+        self.stop()
+
+    @property
+    def time(self) -> 'float':
+        """ Seconds of simulated time since the start. """
+        return self.clock.monotonic()
+
+    def wake(self, thread: 'SupervisedThread') -> 'None':
+        """ Called from SupervisedThread.interrupt, queues the thread to run
+        at the current instant. """
+        self._token[id(thread)] += 1
+        self._queue(thread)
+
+    def _queue(self, thread: 'SupervisedThread') -> 'None':
+        if id(thread) not in self._queued:
+            self._queued.add(id(thread))
+            self._ready.append(thread)
+
+    def _next_deadline(self) -> 'Optional[int]':
+        """ Returns the time of the next live timer, dropping stale ones. """
+        while self._timers:
+            due, _, token, thread = self._timers[0]
+            if token == self._token[id(thread)] and not thread._quit:
+                return due
+            heapq.heappop(self._timers)
+        return None
+
+    def _run(self, thread: 'SupervisedThread') -> 'None':
+        self._queued.discard(id(thread))
+        if thread._quit:
+            thread.stopped()
+            return
+
+        sleep_time = thread.run_cycle()
+        self.cycles += 1
+
+        if thread._quit:
+            thread.stopped()
+
+        elif sleep_time is not None and sleep_time <= 0.0:
+            self._queue(thread)
+
+        elif sleep_time is not None:
+            key = id(thread)
+            self._token[key] += 1
+            due = self.clock.monotonic_ns() + int(sleep_time * 1e9)
+            heapq.heappush(
+              self._timers,
+              (due, next(self._sequence), self._token[key], thread),
+            )
+
+    def step(self, until: 'Optional[float]' = None) -> 'bool':
+        """ Runs every thread due at the next instant, moving the clock
+        forward to it. Returns False, without moving the clock, if nothing
+        is due at or before until (seconds since the start).
+
+        """
+        assert self._started, "The simulation has not been started."
+
+        if not self._ready:
+            due = self._next_deadline()
+            if due is None:
+                return False
+            if until is not None and due > int(until * 1e9):
+                return False
+
+            self.clock.advance_to_ns(due)
+
+            # every timer that expires at this instant.
+            while due is not None and due <= self.clock.monotonic_ns():
+                _, _, _, thread = heapq.heappop(self._timers)
+                self._queue(thread)
+                due = self._next_deadline()
+
+        # threads that are woken while these run are run at the same instant.
+        runs = 0
+        while self._ready:
+            runs += 1
+            if runs > self.stall_limit:
+                raise RuntimeError(
+                  f"Simulation stalled at {self.time} s, "
+                  f"{self.stall_limit} cycles ran without time moving."
+                )
+            self._run(self._ready.popleft())
+
+        return True
+
+    def run_until(self, seconds: 'float') -> 'None':
+        """ Runs the simulation until the clock reads seconds. """
+        while self.step(until=seconds):
+            pass
+        self.clock.advance_to_ns(int(seconds * 1e9))
+
+    def run_for(self, seconds: 'float') -> 'None':
+        """ Runs the simulation for a number of seconds of simulated time. """
+        self.run_until(self.time + seconds)
@@ -1,12 +1,21 @@
 import datetime
 import threading
 import traceback
-import time
-from collections import deque
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import TYPE_CHECKING, Dict, Any, Optional
 import logging
+from pyAutomation.DataObjects.ChangeSet import ChangeSet
 from pyAutomation.Supervisory.Interruptable import Interruptable
+from pyAutomation.Supervisory.Clock import Clock
+from pyAutomation.Supervisory.DeadlineScheduler import DeadlineScheduler
+from pyAutomation.Supervisory.Wakeup import Wakeup
+from pyAutomation.Supervisory.ScanStatistics import ScanStatistics
+from pyAutomation.Supervisory.OsScheduling import OsScheduling
+
+if TYPE_CHECKING:
+    from pyAutomation.Supervisory.SupervisedThreadPool import \
+      SupervisedThreadPool
+    from pyAutomation.Supervisory.GcManager import GcManager
 
 
 class SupervisedThread(Interruptable, ABC):
@@ -14,25 +23,77 @@ class SupervisedThread(Interruptable, ABC):
     or when point changes trigger those updates."""
 
     sleep_time = 0                # type: 'float'
-    default_next_run_time = None  # type: 'datetime.datetime'
     sweep_time = -1               # type: 'int'
     last_run_time = None          # type: 'datetime.datetime'
     terminated = False            # type 'bool'
     _quit = False                 # type 'bool'
 
+    # What to do when loop() runs past the next periodic deadline. See
+    # DeadlineScheduler for the valid policies.
+    overrun_policy = 'skip'       # type: 'str'
+    scheduler = None              # type: 'DeadlineScheduler'
+
+    # When set, the thread is run by a shared SupervisedThreadPool rather
+    # than by its own OS thread.
+    executor = None               # type: 'SupervisedThreadPool'
+
+    # Keep a dedicated OS thread even when the supervisor runs a pool. Used
+    # for drivers that block on I/O inside loop().
+    dedicated_thread = False      # type: 'bool'
+
+    # CPU affinity, nice value and real-time priority of the thread. Only
+    # applied to dedicated threads.
+    os_scheduling = None          # type: 'OsScheduling'
+
+    # Name of the worker process the thread runs in, None runs it in the
+    # Supervisor process.
+    process = None                # type: 'str'
+
+    # Runs garbage collections in the idle gaps between cycles, set by the
+    # Supervisor when the gc setting is used.
+    gc_manager = None             # type: 'GcManager'
+
     def __init__(self, name: str, loop, period, logger: str) -> None:
         self._name = name
-        self.period = period  # in microseconds
+        self.period = period  # in seconds
         self._logger = logging.getLogger(logger)
 
-        self.condition = threading.Condition()
-        self.interrupt_request_deque = deque()  # type: deque
-        self.thread = threading.Thread(target=self.thread_loop, args=(loop,))
+        # wakes the thread when it runs on its own OS thread.
+        self._wakeup = None  # type: Wakeup
+
+        # Interrupts received since the start of the last cycle, keyed by the
+        # name of the point, alarm or thread that caused them so repeated
+        # interrupts from the same source are coalesced. The dict is swapped
+        # out whole at the start of each cycle and handed to the loop as
+        # interrupt_reasons.
+        self._interrupt_lock = threading.Lock()
+        self._pending_interrupts = {}  # type: Dict[str, Any]
+        self.interrupt_reasons = {}  # type: Dict[str, Any]
+
+        # arrival time of the first of the pending interrupts.
+        self._interrupted_ns = None  # type: int
+
+        # state of the cycle being run.
+        self._cycle_start_ns = None  # type: int
+        self._cycle_interrupted_ns = None  # type: int
+        self._cycle_overruns = 0  # type: int
+        self.statistics = ScanStatistics()
+        self._loop = loop
+        self.thread = None  # type: threading.Thread
         self.type = "Control"
 
     def start(self):
         """Starts the thread wrapped by this object."""
-        self.thread.start()
+        if self.executor is not None:
+            self.executor.submit(self)
+        else:
+            self._wakeup = Wakeup()
+            self.thread = threading.Thread(
+              target=self.thread_loop,
+              args=(self._loop,),
+              name=self._name,
+            )
+            self.thread.start()
 
     @property
     def name(self) -> 'str':
@@ -47,6 +108,30 @@ class SupervisedThread(Interruptable, ABC):
 
     logger = property(_get_logger)
 
+    def configure_execution(self, data: 'Dict[str, Any]') -> 'None':
+        """ Applies the execution settings from the logic yaml entry for this
+        thread. These control how the thread is scheduled rather than what
+        the logic does, so they are common to all SupervisedThreads.
+
+        """
+        if data is None:
+            return
+
+        if 'overrun_policy' in data:
+            self.overrun_policy = data['overrun_policy']
+
+        if 'dedicated_thread' in data:
+            self.dedicated_thread = bool(data['dedicated_thread'])
+
+        if 'process' in data:
+            self.process = data['process']
+
+        # Pool workers are shared, so a thread with its own OS scheduling
+        # settings always gets a thread of its own.
+        self.os_scheduling = OsScheduling.from_config(data)
+        if self.os_scheduling is not None:
+            self.dedicated_thread = True
+
     @staticmethod
     def get_lowest_sleep_time(float_1: float, float_2: float) -> float:
         """ Get the lowest sleep time and deal with situations where either or
@@ -76,7 +161,8 @@ class SupervisedThread(Interruptable, ABC):
         This is used when points are written to by processes and the new data
         needs to be propagated to all threads that consume that point. As this
         method will be called by the program logic that updated the point, it
-        must block as little as possible.
+        must block as little as possible. The wakeup never waits on the
+        interrupted thread and is never lost, see Wakeup.
 
         """
 
@@ -87,12 +173,38 @@ class SupervisedThread(Interruptable, ABC):
           'Caller has no name defined.'
 
         self.logger.debug("Interrupt on: %s from %s", self.name, name)
-        self.interrupt_request_deque.append(reason)
 
-        if self.condition.acquire(timeout=0):
-            # Got the lock immediately. Notify the thread.
-            self.condition.notify()
-            self.condition.release()
+        with self._interrupt_lock:
+            first = not self._pending_interrupts
+            if first:
+                self._interrupted_ns = Clock.monotonic_ns()
+            if isinstance(reason, ChangeSet):
+                # a batch of point writes, each point is a reason of its own.
+                self._pending_interrupts.update(reason.points)
+            else:
+                key = getattr(reason, 'name', None)
+                if key is None:
+                    key = name
+                self._pending_interrupts[key] = reason
+
+        self._wake(first)
+
+    def _wake(self, first: 'bool') -> 'None':
+        """ Wakes the thread to handle an interrupt. first is True if no
+        other interrupts were pending since the start of the last cycle."""
+        if self.executor is not None:
+            self.executor.wake(self)
+
+        elif self._wakeup is not None:
+            self._wakeup.signal()
+
+    def interrupted_by(self, source: 'Any') -> 'bool':
+        """ Returns True if the current cycle was triggered (at least in part)
+        by a change in the supplied point, alarm or thread. Lets logic limit
+        its work to the inputs that changed since the last cycle.
+
+        """
+        return source.name in self.interrupt_reasons
 
     @abstractmethod
     def config(self, data: 'Dict') -> None:
@@ -105,7 +217,126 @@ class SupervisedThread(Interruptable, ABC):
 
     @abstractmethod
     def loop(self) -> 'float':
-        """ function where the designer inserts logic for this module"""
+        """ function where the designer inserts logic for this module. The
+        points, alarms and threads that interrupted the thread since the last
+        cycle are in self.interrupt_reasons, keyed by name."""
+
+    def prepare(self) -> 'None':
+        """ Sets up the periodic schedule for the thread. Called once before
+        the first cycle is run, by either thread_loop or the thread pool.
+
+        """
+        self.logger.info("Starting thread_loop for: %s", self.name)
+        if self.period is not None:
+            self.scheduler = DeadlineScheduler(
+              period=self.period,
+              policy=self.overrun_policy,
+            )
+            self.scheduler.start(Clock.monotonic_ns())
+
+    def run_cycle(self) -> 'Optional[float]':
+        """ Runs the designer built loop once and works out how long the
+        thread should sleep before the next cycle.
+
+        Returns:
+            None if the thread should sleep until it is interrupted, otherwise
+            the number of seconds to sleep. 0.0 means run again immediately.
+
+        """
+        self._start_cycle()
+        self.sleep_time = self.loop()
+        return self._finish_cycle()
+
+    def _start_cycle(self) -> 'None':
+        """ Bookkeeping done before the loop of a cycle is run. """
+
+        # take the interrupts received so far, any that arrive while the loop
+        # is running go into a fresh dict for the next cycle.
+        with self._interrupt_lock:
+            self.interrupt_reasons = self._pending_interrupts
+            self._pending_interrupts = {}
+            self._cycle_interrupted_ns = self._interrupted_ns
+            self._interrupted_ns = None
+
+        self._cycle_start_ns = Clock.monotonic_ns()
+        if self.scheduler is not None:
+            self.scheduler.cycle_started(self._cycle_start_ns)
+            self._cycle_overruns = self.scheduler.overruns
+
+        self.last_run_time = Clock.now()
+        # run the logic
+        self.logger.debug("Running thread: %s", self._name)
+
+    def _finish_cycle(self) -> 'Optional[float]':
+        """ Bookkeeping done once the loop of a cycle has returned its sleep
+        time. Returns the time to sleep as described in run_cycle."""
+        self.logger.debug("Done thread: %s", self._name)
+        start_time = self._cycle_start_ns
+        end_time = Clock.monotonic_ns()
+        self.sweep_time = (end_time - start_time) / 1e9
+
+        overrun_ns = None
+
+        # setup for sleep.
+        if self.scheduler is not None:
+            self.scheduler.cycle_finished(end_time)
+            if self.scheduler.overruns != self._cycle_overruns:
+                overrun_ns = self.scheduler.last_overrun_ns
+
+            if self.sleep_time is None:
+                # wait the sleep time as defined by the supervisor
+                self.logger.debug(
+                  ("%s returned a null sleep time, using default "
+                   + "sleep time of %s"), self.name, self.period
+                )
+                self.sleep_time = \
+                  self.scheduler.time_until_deadline(end_time)
+
+        self.statistics.record_cycle(
+          start_ns=start_time,
+          end_ns=end_time,
+          interrupted_ns=self._cycle_interrupted_ns,
+          overrun_ns=overrun_ns,
+        )
+
+        # Check and see if there are interrupts queued (i.e. the routine
+        # got an interrupt whilst it was running. If so, restart the
+        # routine.
+        if self._pending_interrupts:
+            self.sleep_time = 0.0
+            self.logger.debug(
+              "%s *NOT* sleeping! pending interrupts",
+              self.name)
+
+        elif self.sleep_time is None:
+            self.logger.debug(
+              "%s sleeping until interrupt", self.name)
+
+        # Got a valid sleep time?
+        elif self.sleep_time > 0.0:
+            self.logger.debug(
+              "%s sleeping %s",
+              self.name,
+              self.sleep_time,
+            )
+
+        else:
+            self.logger.debug(
+              "%s *NOT* sleeping! Got a sleep time of %s.",
+              self.name,
+              self.sleep_time
+            )
+            self.sleep_time = 0.0
+
+        if self.gc_manager is not None:
+            self.gc_manager.cycle_finished(self)
+
+        return self.sleep_time
+
+    def stopped(self) -> 'None':
+        """ Marks the thread as terminated. """
+        self.logger.info("Stopping Logic: %s", self.name)
+        self.terminated = True
 
     def thread_loop(self, loop, ):
         """ function that wraps the designer built loop and ensures that it is
@@ -114,90 +345,39 @@ class SupervisedThread(Interruptable, ABC):
         """
 
         try:
-            self.logger.info("Starting thread_loop for: %s", self.name)
-            self.condition.acquire()
+            if self.os_scheduling is not None:
+                self.os_scheduling.apply(self.logger)
 
-            self.default_next_run_time = datetime.datetime.now()
+            self.prepare()
 
             while not self._quit:
-
-                # clear out any interrupt requests
-                if len(self.interrupt_request_deque) > 0:
-                    self.interrupt_request_deque.clear()
-
-                # increment the next_run_time
-                if self.period is not None:
-                    self.default_next_run_time \
-                        += datetime.timedelta(seconds=self.period)
-
-                start_time = time.monotonic()
-                self.last_run_time = datetime.datetime.now()
-                # run the logic
-                self.logger.debug("Running thread: %s", self._name)
-                self.sleep_time = self.loop()
-                self.logger.debug("Done thread: %s", self._name)
-                self.sweep_time = time.monotonic() - start_time
-
-                # setup for sleep.
-
-                if self.sleep_time is None and self.period is not None:
-                    # wait the sleep time as defined by the supervisor
-                    self.logger.debug(
-                      ("%s returned a null sleep time, using default sleep"
-                       + "time of %s"), self.name, self.period
-                    )
-                    self.sleep_time = (
-                      self.default_next_run_time
-                      - datetime.datetime.now()).total_seconds()
-
-                # Check and see if there are interrupts queued (i.e. the routine
-                # got an interrupt whilst it was running. If so, restart the
-                # routine.
-                if len(self.interrupt_request_deque) > 0:
-                    self.sleep_time = 0.0
-                    self.logger.debug(
-                      "%s *NOT* sleeping! pending interrupts",
-                      self.name)
-                    continue
+                # Clear the wakeup before run_cycle() looks for interrupts, so
+                # an interrupt arriving at any point after this either gets
+                # picked up by the cycle or cuts the following sleep short.
+                self._wakeup.clear()
+                sleep_time = self.run_cycle()
 
                 # sleep until we receive an interrupt.
-                if self.sleep_time is None:
-                    self.logger.debug(
-                      "%s sleeping until interrupt", self.name)
-                    self.condition.wait(None)
-
-                # Got a valid sleep time?
-                elif self.sleep_time > 0.0:
-                    self.logger.debug(
-                      "%s sleeping %s",
-                      self.name,
-                      self.sleep_time,
-                    )
-                    self.condition.wait(self.sleep_time)
-
-                else:
-                    self.logger.debug(
-                      "%s *NOT* sleeping! Got a sleep time of %s.",
-                      self.name,
-                      self.sleep_time
-                    )
-                    self.sleep_time = 0.0
+                if sleep_time is None:
+                    self._wakeup.wait(None)
+
+                elif sleep_time > 0.0:
+                    self._wakeup.wait(sleep_time)
 
         except Exception:
             self.logger.error(traceback.format_exc())
             self._quit = True
 
         finally:
-            self.condition.release()
-            self.logger.info("Stopping Logic: %s", self.name)
-            self.terminated = True
+            self._wakeup.close()
+            self.stopped()
 
     # values for live object data for transport over JSON to the HMI.
     # N.B. these need to be regular dicts, as the HMI doesn't know about
     # the induvidual processes, and SupervisedThread is abstract.
     @property
     def pickle_dict(self) -> 'Dict[str, Any]':
-        return {
+        d = {
           'name': self._name,
           'sleep_time': self.sleep_time,
           'sweep_time': self.sweep_time,
@@ -205,6 +385,17 @@ class SupervisedThread(Interruptable, ABC):
           'terminated': self.terminated,
         }
 
+        if self.scheduler is not None:
+            d.update({
+              'overrun_policy': self.scheduler.policy,
+              'overruns': self.scheduler.overruns,
+              'skipped_cycles': self.scheduler.skipped,
+              'last_jitter': self.scheduler.last_jitter_ns / 1e9,
+              'max_jitter': self.scheduler.max_jitter_ns / 1e9,
+              'mean_jitter': self.scheduler.mean_jitter_ns / 1e9,
+            })
+        return d
+
     # values for live object data for transport over JSON.
     def __getstate__(self) -> 'Dict[str, Any]':
         return {
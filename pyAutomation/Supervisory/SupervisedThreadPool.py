@@ -0,0 +1,174 @@
+import heapq
+import itertools
+import logging
+import threading
+import traceback
+from collections import deque
+from typing import TYPE_CHECKING
+from pyAutomation.Supervisory.Clock import Clock
+
+if TYPE_CHECKING:
+    from typing import Dict, List, Set, Tuple
+    from pyAutomation.Supervisory.SupervisedThread import SupervisedThread
+
+# scheduling states of a SupervisedThread run by the pool.
+IDLE = 0      # sleeping on a timer or waiting for an interrupt.
+READY = 1     # queued for the next free worker.
+RUNNING = 2   # loop() is being executed by a worker.
+STOPPED = 3   # quit or died, never scheduled again.
+
+
+class SupervisedThreadPool(object):
+    """ Runs many SupervisedThreads on a bounded number of worker threads
+    driven by a single timer queue, instead of one mostly sleeping OS thread
+    per SupervisedThread.
+
+    The loop()/sleep time contract is unchanged: the sleep time returned by
+    run_cycle() arms a timer for the thread, None leaves it waiting for an
+    interrupt and 0.0 queues it to run again immediately. A thread is never
+    run by two workers at once. An interrupt that arrives while the thread is
+    running makes it run again as soon as the current cycle is done.
+
+    """
+
+    def __init__(self, workers: 'int', logger: 'str') -> 'None':
+        assert workers > 0, \
+          f"A SupervisedThreadPool needs at least one worker, got {workers}."
+
+        self.logger = logging.getLogger(logger)
+        self._condition = threading.Condition()
+        self._ready = deque()  # type: deque
+
+        # min-heap of (due time ns, tie breaker, token, thread). Entries are
+        # cancelled lazily, an entry is stale if the token no longer matches
+        # the token of the thread.
+        self._timers = []  # type: List[Tuple[int, int, int, SupervisedThread]]
+        self._sequence = itertools.count()
+        self._shutdown = False
+
+        self._state = {}     # type: Dict[int, int]
+        self._token = {}     # type: Dict[int, int]
+        self._rerun = set()  # type: Set[int]
+
+        self.workers = [
+          threading.Thread(
+            target=self._worker_loop,
+            name=f"supervised-pool-{i}",
+            daemon=True,
+          )
+          for i in range(workers)
+        ]  # type: List[threading.Thread]
+
+    def start(self) -> 'None':
+        for w in self.workers:
+            w.start()
+
+    def shutdown(self) -> 'None':
+        with self._condition:
+            self._shutdown = True
+            self._condition.notify_all()
+
+    def submit(self, thread: 'SupervisedThread') -> 'None':
+        """ Adds a thread to the pool and queues its first cycle. """
+        thread.prepare()
+        key = id(thread)
+        with self._condition:
+            self._token[key] = 0
+            self._state[key] = READY
+            self._ready.append(thread)
+            self._condition.notify()
+
+    def wake(self, thread: 'SupervisedThread') -> 'None':
+        """ Called from SupervisedThread.interrupt. Queues the thread to run
+        now, the lock is only ever held for queue manipulation so this never
+        waits on a running loop().
+
+        """
+        key = id(thread)
+        with self._condition:
+            state = self._state.get(key)
+            if state == IDLE:
+                # Cancels any pending timer for the thread.
+                self._token[key] += 1
+                self._state[key] = READY
+                self._ready.append(thread)
+                self._condition.notify()
+
+            elif state == RUNNING:
+                self._rerun.add(key)
+
+    def _next_thread(self) -> 'SupervisedThread':
+        """ Waits for a thread that is ready to run. Must be called with the
+        condition held. Returns None when the pool is shut down."""
+        while not self._shutdown:
+            now = Clock.monotonic_ns()
+
+            # move any expired timers onto the ready queue.
+            while self._timers and self._timers[0][0] <= now:
+                _, _, token, thread = heapq.heappop(self._timers)
+                key = id(thread)
+                if token == self._token[key] and self._state[key] == IDLE:
+                    self._state[key] = READY
+                    self._ready.append(thread)
+
+            if self._ready:
+                thread = self._ready.popleft()
+                self._state[id(thread)] = RUNNING
+                return thread
+
+            if self._timers:
+                self._condition.wait((self._timers[0][0] - now) / 1e9)
+            else:
+                self._condition.wait()
+
+        return None
+
+    def _reschedule(
+      self,
+      thread: 'SupervisedThread',
+      sleep_time: 'float',
+    ) -> 'None':
+        """ Puts a thread back into the pool after a cycle has run. Must be
+        called with the condition held."""
+        key = id(thread)
+        rerun = key in self._rerun
+        self._rerun.discard(key)
+
+        if thread._quit:
+            self._state[key] = STOPPED
+            thread.stopped()
+
+        elif rerun or (sleep_time is not None and sleep_time <= 0.0):
+            self._state[key] = READY
+            self._ready.append(thread)
+            self._condition.notify()
+
+        else:
+            self._state[key] = IDLE
+            if sleep_time is not None:
+                self._token[key] += 1
+                due = Clock.monotonic_ns() + int(sleep_time * 1e9)
+                heapq.heappush(
+                  self._timers,
+                  (due, next(self._sequence), self._token[key], thread),
+                )
+                # a worker may be waiting on a later timer.
+                self._condition.notify()
+
+    def _worker_loop(self) -> 'None':
+        while True:
+            with self._condition:
+                thread = self._next_thread()
+            if thread is None:
+                return
+
+            sleep_time = None
+            if not thread._quit:
+                try:
+                    sleep_time = thread.run_cycle()
+                except Exception:
+                    thread.logger.error(traceback.format_exc())
+                    thread._quit = True
+
+            with self._condition:
+                self._reschedule(thread, sleep_time)
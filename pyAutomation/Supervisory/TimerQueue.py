@@ -0,0 +1,98 @@
+import heapq
+import itertools
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, Dict, List, Optional
+
+
+class TimerQueue(object):
+    """ Deadlines of a set of objects (e.g. the on and off delays of the
+    alarms, see AlarmHandler) kept in a heap, so arming a timer is
+    O(log n) and finding the ones that are due only looks at those.
+
+    An object has at most one deadline. Disarming (or re-arming) marks the
+    entry in the heap as cancelled rather than searching the heap for it,
+    cancelled entries are dropped as they reach the top, or all at once
+    when they make up half the heap.
+
+    The queue can be armed and disarmed from any thread.
+
+    """
+
+    def __init__(self) -> 'None':
+        self._lock = threading.Lock()
+
+        # [deadline, sequence number, object] entries, the object is None
+        # once the entry is cancelled. The sequence number orders entries
+        # with the same deadline so the objects are never compared.
+        self._heap = []  # type: List[List[Any]]
+
+        # entry of each armed object, keyed by id.
+        self._entries = {}  # type: Dict[int, List[Any]]
+
+        self._counter = itertools.count()
+        self._cancelled = 0  # type: int
+
+    def __len__(self) -> 'int':
+        """ Number of armed timers. """
+        return len(self._entries)
+
+    def __contains__(self, item: 'Any') -> 'bool':
+        return id(item) in self._entries
+
+    def arm(self, item: 'Any', deadline: 'float') -> 'bool':
+        """ Sets the deadline of item, replacing any it had. Returns True if
+        it's now the earliest deadline, i.e. whoever waits on the queue has
+        to wake up sooner. """
+        entry = [deadline, next(self._counter), item]
+        with self._lock:
+            old = self._entries.get(id(item))
+            if old is not None:
+                self._cancel(old)
+            self._entries[id(item)] = entry
+            heapq.heappush(self._heap, entry)
+            return self._heap[0] is entry
+
+    def disarm(self, item: 'Any') -> 'bool':
+        """ Cancels the deadline of item, returns False if it had none. """
+        with self._lock:
+            entry = self._entries.pop(id(item), None)
+            if entry is None:
+                return False
+            self._cancel(entry)
+            return True
+
+    def _cancel(self, entry: 'List[Any]') -> 'None':
+        entry[2] = None
+        self._cancelled += 1
+        heap = self._heap
+        if self._cancelled > 64 and self._cancelled * 2 > len(heap):
+            heap[:] = [e for e in heap if e[2] is not None]
+            heapq.heapify(heap)
+            self._cancelled = 0
+
+    def next_deadline(self) -> 'Optional[float]':
+        """ The earliest deadline, None if no timers are armed. """
+        with self._lock:
+            heap = self._heap
+            while heap and heap[0][2] is None:
+                heapq.heappop(heap)
+                self._cancelled -= 1
+            return heap[0][0] if heap else None
+
+    def pop_due(self, now: 'float') -> 'List[Any]':
+        """ Disarms and returns the objects with deadlines up to now, in
+        deadline order. """
+        due = []
+        with self._lock:
+            heap = self._heap
+            while heap and heap[0][0] <= now:
+                _, _, item = heapq.heappop(heap)
+                if item is None:
+                    self._cancelled -= 1
+                else:
+                    del self._entries[id(item)]
+                    due.append(item)
+        return due
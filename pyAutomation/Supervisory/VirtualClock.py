@@ -0,0 +1,82 @@
+import datetime
+import threading
+from typing import TYPE_CHECKING
+from pyAutomation.Supervisory.Clock import Clock, EPOCH
+
+if TYPE_CHECKING:
+    from typing import Optional
+
+
+class VirtualClock(object):
+    """ A clock that only moves when it is told to. Installed in place of the
+    system clocks with Clock.install() (or as a context manager) so logic can
+    be run against simulated time.
+
+    The monotonic time starts at zero, the time of day starts at start which
+    defaults to the time the clock was created. A naive start is taken to be
+    local time, the same as datetime.now().
+
+    """
+
+    def __init__(
+      self,
+      start: 'Optional[datetime.datetime]' = None,
+    ) -> 'None':
+        if start is None:
+            start = datetime.datetime.now(datetime.timezone.utc)
+        elif start.tzinfo is None:
+            start = start.astimezone()
+
+        self._start = start  # type: datetime.datetime
+        # start as ns since the epoch.
+        start_us = (start - EPOCH) // datetime.timedelta(microseconds=1)
+        self._start_ns = start_us * 1000  # type: int
+        self._ns = 0  # type: int
+        self._lock = threading.Lock()
+
+    def monotonic_ns(self) -> 'int':
+        return self._ns
+
+    def monotonic(self) -> 'float':
+        return self._ns / 1e9
+
+    def time_ns(self) -> 'int':
+        return self._start_ns + self._ns
+
+    def now(
+      self,
+      tz: 'Optional[datetime.tzinfo]' = None,
+    ) -> 'datetime.datetime':
+        t = self._start + datetime.timedelta(microseconds=self._ns // 1000)
+        if tz is None:
+            return t.astimezone().replace(tzinfo=None)
+        return t.astimezone(tz)
+
+    def advance(self, seconds: 'float') -> 'None':
+        """ Moves the clock forward by a number of seconds. """
+        assert seconds >= 0.0, \
+          f"Tried to move a virtual clock backwards by {seconds} seconds."
+        with self._lock:
+            self._ns += int(seconds * 1e9)
+
+    def step(self, seconds: 'float') -> 'None':
+        """ Moves the time of day forward, or back, by a number of seconds
+        without moving the monotonic time, as setting the system time (e.g.
+        an NTP step) does. """
+        with self._lock:
+            self._start += datetime.timedelta(seconds=seconds)
+            self._start_ns += int(seconds * 1e9)
+
+    def advance_to_ns(self, ns: 'int') -> 'None':
+        """ Moves the clock forward to a monotonic time, earlier times are
+        ignored. """
+        with self._lock:
+            if ns > self._ns:
+                self._ns = ns
+
+    def __enter__(self) -> 'VirtualClock':
+        Clock.install(self)
+        return self
+
+    def __exit__(self, *args) -> 'None':
+        Clock.install(None)
@@ -0,0 +1,89 @@
+import os
+import select
+import threading
+
+
+class Wakeup(object):
+    """ Wakes a single sleeping thread. signal() never blocks the caller and
+    a signal is never lost: if it arrives before the sleeper calls wait(), the
+    wait returns immediately.
+
+    On Linux the wakeup is an eventfd counter, so signalling is a single
+    non-blocking write. The write is made under an uncontended lock so it
+    can't race close() onto a closed (or reused) descriptor. Elsewhere it
+    falls back to a threading.Event.
+
+    The sleeper must clear() the wakeup *before* checking for work, then
+    wait() if there was none. Any signal sent after the clear() is then
+    guaranteed to either be seen by the check or to end the wait.
+
+    """
+
+    def __init__(self) -> 'None':
+        self._fd = None  # type: int
+        self._poll = None
+        self._event = None  # type: threading.Event
+
+        # held while the eventfd is used by signal() or clear() and while
+        # close() closes it.
+        self._fd_lock = threading.Lock()
+
+        if hasattr(os, 'eventfd'):
+            try:
+                self._fd = os.eventfd(0, os.EFD_NONBLOCK | os.EFD_CLOEXEC)
+            except OSError:
+                self._fd = None
+
+        if self._fd is not None:
+            self._poll = select.poll()
+            self._poll.register(self._fd, select.POLLIN)
+        else:
+            self._event = threading.Event()
+
+    def signal(self) -> 'None':
+        """ Wakes the sleeper, or makes its next wait() return at once. """
+        with self._fd_lock:
+            if self._fd is not None:
+                try:
+                    os.eventfd_write(self._fd, 1)
+                except BlockingIOError:
+                    # The counter is saturated, so a wakeup is already
+                    # pending.
+                    pass
+                return
+        self._event.set()
+
+    def clear(self) -> 'None':
+        """ Consumes any pending signals. """
+        with self._fd_lock:
+            if self._fd is not None:
+                try:
+                    os.eventfd_read(self._fd)
+                except BlockingIOError:
+                    pass
+                return
+        self._event.clear()
+
+    def wait(self, timeout: 'float' = None) -> 'bool':
+        """ Sleeps until signalled or until timeout seconds have passed.
+        Returns True if the wakeup was signalled."""
+        if self._fd is not None:
+            if timeout is None:
+                return bool(self._poll.poll())
+            return bool(self._poll.poll(timeout * 1000.0))
+        return self._event.wait(timeout)
+
+    def fileno(self) -> 'int':
+        """ The eventfd backing this wakeup, or None if there isn't one. Lets
+        the wakeup be registered with select/poll based event loops."""
+        return self._fd
+
+    def close(self) -> 'None':
+        """ Releases the eventfd. Late signals from other threads are
+        absorbed by an Event so they remain harmless. """
+        with self._fd_lock:
+            if self._fd is not None:
+                self._event = threading.Event()
+                self._poll.unregister(self._fd)
+                fd, self._fd = self._fd, None
+                os.close(fd)
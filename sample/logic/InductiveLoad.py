@@ -4,10 +4,10 @@ Created on Apr 16, 2016
 @author: Bruce
 """
 
-import time
 import logging
 from typing import Dict
 from pyAutomation.DataObjects.PointDiscrete import PointDiscrete
+from pyAutomation.Supervisory.Clock import Clock
 import threading
 
 logger = logging.getLogger('controller')
@@ -54,8 +54,8 @@ class InductiveLoad(object):
                 if 0 == InductiveLoad.inrush_active[self.inrush_circuit]:
                     logger.info(self.description + " -> INRUSH")
                     self.mode = "INRUSH"
-                    self.timer = time.monotonic()
-                    self.start_time = time.monotonic()
+                    self.timer = Clock.monotonic()
+                    self.start_time = Clock.monotonic()
                     if self.stop_time is not None:
                         self.last_off_period = self.start_time - self.stop_time
                     InductiveLoad.inrush_active[self.inrush_circuit] = self.inrush_delay
@@ -65,24 +65,24 @@ class InductiveLoad(object):
                         logger.info(self.description + " -> WAITING")
 
         elif self.mode == "INRUSH":
-            if time.monotonic() - self.timer > self.inrush_delay:
+            if Clock.monotonic() - self.timer > self.inrush_delay:
                 logger.info(self.description + " -> ON")
                 self.mode = "ON"
                 InductiveLoad.inrush_active[self.inrush_circuit] = 0
             else:
                 InductiveLoad.inrush_active[self.inrush_circuit] = \
-                    time.monotonic() - self.timer
+                    Clock.monotonic() - self.timer
 
         elif self.mode == "ON":
             if not self.request:
                 logger.info(self.description + " -> COOLDOWN")
                 self.mode = "COOLDOWN"
-                self.timer = time.monotonic()
-                self.stop_time = time.monotonic()
+                self.timer = Clock.monotonic()
+                self.stop_time = Clock.monotonic()
                 self.last_run_period = self.stop_time - self.start_time
 
         elif self.mode == "COOLDOWN":
-            if time.monotonic() - self.timer > self.cool_down_delay:
+            if Clock.monotonic() - self.timer > self.cool_down_delay:
                 logger.info(self.description + " -> OFF")
                 self.mode = "OFF"
         InductiveLoad.thread_condition.release()
@@ -109,7 +109,7 @@ class InductiveLoad(object):
     @property
     def run_timer(self) -> float:
         if "ON" == self.mode:
-            return time.monotonic() - self.start_time
+            return Clock.monotonic() - self.start_time
         else:
             return 0
 
@@ -118,7 +118,7 @@ class InductiveLoad(object):
         if(
           "COOLDOWN" == self.mode
           or self.mode == "INRUSH"):
-            return time.monotonic() - self.timer
+            return Clock.monotonic() - self.timer
 
         elif(
           "OFF" == self.mode
@@ -1,6 +1,7 @@
 import datetime
 from pyAutomation.Supervisory.SupervisedThread import SupervisedThread
 from pyAutomation.Supervisory.PointHandlerLogic import PointHandlerLogic
+from pyAutomation.Supervisory.Clock import Clock
 from InductiveLoad import InductiveLoad
 from typing import TYPE_CHECKING
 
@@ -99,7 +100,7 @@ class PumpController(SupervisedThread, PointHandlerLogic):
           and self.point_liquid_level.value \
           > self.point_liquid_level.control_points['cut_in_1'].value:
             self.state = "RUN_PRIMARY_PUMP"
-            self.timer = datetime.datetime.now()
+            self.timer = Clock.now()
             self.last_level = self.point_liquid_level.value
             self.primary_pump.run(True)
 
@@ -107,14 +108,14 @@ class PumpController(SupervisedThread, PointHandlerLogic):
           and self.point_liquid_level.value \
           > self.point_liquid_level.control_points['cut_in_2'].value:
             self.state = "RUN_BACKUP_PUMP"
-            self.timer = datetime.datetime.now()
+            self.timer = Clock.now()
             self.backup_pump.run(True)
 
         if self.state == "RUN_PRIMARY_PUMP" \
           or self.state == "RUN_BACKUP_PUMP":
 
             if self.timer + datetime.timedelta(seconds=5) < \
-              datetime.datetime.now():
+              Clock.now():
                 if self.point_liquid_level.value > self.last_level:
                     self.alarm_pump_runtime_fault.input = True
                 else:
@@ -1,5 +1,6 @@
 from pyAutomation.Supervisory.SupervisedThread import SupervisedThread
 from pyAutomation.Supervisory.PointHandlerLogic import PointHandlerLogic
+from pyAutomation.Supervisory.Clock import Clock
 import datetime
 from typing import Union
 
@@ -20,7 +21,7 @@ class TankSimulator(SupervisedThread, PointHandlerLogic):
     def __init__(self, name, logger):
         self.level = 0.0
         self.period = 0.5  # Run the loop every 0.5 seconds.
-        self.last_time = datetime.datetime.now()
+        self.last_time = Clock.now()
 
         super().__init__(
             name=name,
@@ -53,7 +54,7 @@ class TankSimulator(SupervisedThread, PointHandlerLogic):
               self.point_pump_2_rate_drain_rate.request_value
             self.point_pump_2_rate_drain_rate.request_value = None
 
-        now = datetime.datetime.now()
+        now = Clock.now()
         time_delta = \
           datetime.timedelta.total_seconds(now - self.last_time) / 60.0
         self.last_time = now
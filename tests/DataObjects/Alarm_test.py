@@ -6,13 +6,13 @@ import jsonpickle
 import ruamel
 
 from io import StringIO
-from mock import patch, Mock
 from typing import Any
 
 from pyAutomation.DataObjects.Alarm import Alarm
 from pyAutomation.DataObjects.AlarmAnalog import AlarmAnalog
 from pyAutomation.Supervisory.AlarmHandler import AlarmHandler
 from pyAutomation.Supervisory.Interruptable import Interruptable
+from pyAutomation.Supervisory.VirtualClock import VirtualClock
 
 
 class TestAlarm(unittest.TestCase, Interruptable):
@@ -190,8 +190,8 @@ class TestAlarm(unittest.TestCase, Interruptable):
 
     def test_alarm_with_timer(self) -> 'None':
         self.logger.debug("---- Start test_alarm_with_timer ----")
-        with patch('pyAutomation.DataObjects.Alarm.datetime') as datetime_mock,\
-          patch('pyAutomation.DataObjects.Alarm.time') as time_mock:
+        with VirtualClock(
+          start=datetime.datetime(2019, 1, 1, 0, 0, 0)) as clock:
             self.interrupts = 0
             self.alarm.on_delay = 5.0
             self.alarm.off_delay = 2.0
@@ -200,13 +200,6 @@ class TestAlarm(unittest.TestCase, Interruptable):
             self.assertFalse(self.alarm.active)
             self.assertTrue(self.alarm._state == "OFF")
             self.assertTrue(self.alarm.alarm_state == "NORMAL")
-
-            # set the time.
-            time_mock.monotonic = Mock(return_value = 0.0)
-            datetime_mock.now = Mock(
-              return_value=datetime.datetime.strptime(
-                '2019/01/01 00:00:00.000',
-                "%Y/%m/%d %H:%M:%S.%f"))
             self.logger.debug("0.0 second mark.")
 
             # Turn on alarm. it's got a 5 second delay so make sure the alarm
@@ -220,13 +213,10 @@ class TestAlarm(unittest.TestCase, Interruptable):
             self.assertFalse(self.alarm.active)
             self.assertEqual(self.alarm._state, "ON_DELAY")
             self.assertEqual(self.alarm.alarm_state, "NORMAL")
+            self.assertEqual(self.alarm.wake_time, 5.0)
 
             # jump 1 second in the future
-            time_mock.monotonic = Mock(return_value = 1.0)
-            datetime_mock.now = Mock(
-              return_value=datetime.datetime.strptime(
-                  '2019/01/01 00:00:01.000',
-                  "%Y/%m/%d %H:%M:%S.%f"))
+            clock.advance(1.0)
             self.logger.debug("1.0 second mark.")
 
             # pretend to run the alarm handler..
@@ -237,11 +227,7 @@ class TestAlarm(unittest.TestCase, Interruptable):
             self.assertEqual(self.alarm.alarm_state, "NORMAL")
 
             # jump 4.001 seconds in the future
-            time_mock.monotonic = Mock(return_value = 5.001)
-            datetime_mock.now = Mock(
-              return_value=datetime.datetime.strptime(
-                  '2019/01/01 00:00:05.001',
-                  "%Y/%m/%d %H:%M:%S.%f"))
+            clock.advance(4.001)
             self.logger.debug("5.001 second mark.")
 
             # pretend to run the alarm handler..
@@ -251,14 +237,13 @@ class TestAlarm(unittest.TestCase, Interruptable):
             self.assertEqual(self.alarm._state, "ALARM")
             self.assertEqual(self.alarm.alarm_state, "ACTIVE")
             self.assertEqual(1, self.interrupts)
+            self.assertEqual(
+              self.alarm._activation_time,
+              datetime.datetime(2019, 1, 1, 0, 0, 5, 1000).astimezone(),
+            )
 
             # jump to 6 seconds.
-            time_mock.monotonic = Mock(return_value = 6.0)
-            datetime_mock.now = Mock(
-              return_value=datetime.datetime.strptime(
-                '2019/01/01 00:00:06.000',
-                "%Y/%m/%d %H:%M:%S.%f"))
-
+            clock.advance(0.999)
             self.logger.debug("6.00 second mark.")
 
             # Turn the alarm off and run the interrupt handler.
@@ -275,12 +260,7 @@ class TestAlarm(unittest.TestCase, Interruptable):
             self.assertEqual(self.alarm.alarm_state, "ACTIVE")
 
             # jump to 7 seconds.
-            time_mock.monotonic = Mock(return_value = 7.0)
-            datetime_mock.now = Mock(
-              return_value=datetime.datetime.strptime(
-              '2019/01/01 00:00:06.000',
-              "%Y/%m/%d %H:%M:%S.%f"))
-
+            clock.advance(1.0)
             self.logger.debug("7.0 second mark.")
 
             # pretend to run the alarm handler..
@@ -293,12 +273,7 @@ class TestAlarm(unittest.TestCase, Interruptable):
             self.assertEqual(self.alarm.alarm_state, "ACTIVE")
 
             # jump to 8.001 seconds..
-            time_mock.monotonic = Mock(return_value = 8.001)
-            datetime_mock.now = Mock(
-              return_value=datetime.datetime.strptime(
-                '2019/01/01 00:00:08.001',
-                "%Y/%m/%d %H:%M:%S.%f"))
-
+            clock.advance(1.001)
             self.logger.debug("8.001 second mark.")
 
             # pretend to run the alarm handler..
@@ -310,12 +285,7 @@ class TestAlarm(unittest.TestCase, Interruptable):
             self.assertEqual(2, self.interrupts)
 
             # jump to 9 seconds.
-            time_mock.monotonic = Mock(return_value = 9.0)
-            datetime_mock.now = Mock(
-              return_value=datetime.datetime.strptime(
-               '2019/01/01 00:00:09.000',
-               "%Y/%m/%d %H:%M:%S.%f"))
-
+            clock.advance(0.999)
             self.logger.debug("9.0 second mark.")
 
             # acknowledge the alarm ito ensure that it's removed from the
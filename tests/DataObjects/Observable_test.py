@@ -0,0 +1,135 @@
+import unittest
+
+import jsonpickle
+
+from pyAutomation.DataObjects.Alarm import Alarm
+from pyAutomation.DataObjects.AlarmAnalog import AlarmAnalog
+from pyAutomation.DataObjects.PointAnalog import PointAnalog
+from pyAutomation.DataObjects.PointAnalogScaled import PointAnalogScaled
+from pyAutomation.DataObjects.PointDiscrete import PointDiscrete
+from pyAutomation.DataObjects.PointEnumeration import PointEnumeration
+from pyAutomation.DataObjects.ProcessValue import ProcessValue
+from pyAutomation.Supervisory.Interruptable import Interruptable
+
+
+class Observer(Interruptable):
+
+    def __init__(self, name):
+        self._name = name
+        self.reasons = []
+
+    @property
+    def name(self):
+        return self._name
+
+    def interrupt(self, name, reason):
+        self.reasons.append(reason)
+
+
+class TestObservable(unittest.TestCase):
+
+    def setUp(self):
+        self.writer = Observer("observable_writer")
+        self.points = []
+        for i in range(3):
+            p = PointDiscrete(description=f"observable point {i}")
+            p.name = f"observable_point_{i}"
+            p.writer = self.writer
+            self.points.append(p)
+
+    def test_observers_per_instance(self):
+        observers = [Observer(f"observer_{i}") for i in range(3)]
+        for p, o in zip(self.points, observers):
+            p.add_observer(o.name, o.interrupt)
+
+        self.points[1].value = True
+
+        self.assertEqual(observers[0].reasons, [])
+        self.assertEqual(observers[1].reasons, [self.points[1]])
+        self.assertEqual(observers[2].reasons, [])
+        self.assertEqual(list(self.points[0].observers), ["observer_0"])
+
+        alarm_1 = Alarm(description="observable alarm 1")
+        alarm_1.name = "observable_alarm_1"
+        alarm_2 = Alarm(description="observable alarm 2")
+        alarm_1.add_observer("observer_0", observers[0].interrupt)
+        self.assertEqual(alarm_2.observers, {})
+
+    def test_del_observer(self):
+        o = Observer("observer")
+        p = self.points[0]
+        p.add_observer(o.name, o.interrupt)
+        p.del_observer(o.name)
+
+        p.value = True
+        self.assertEqual(o.reasons, [])
+        with self.assertRaises(KeyError):
+            p.del_observer(o.name)
+
+    def test_readonly_proxy(self):
+        o = Observer("observer")
+        p = self.points[0]
+        proxy = p.readonly_object
+        proxy.add_observer(o.name, o.interrupt)
+        self.assertIn(o.name, p.observers)
+
+        p.value = True
+        self.assertEqual(o.reasons, [p])
+
+        proxy.del_observer(o.name)
+        self.assertEqual(p.observers, {})
+
+    def test_process_value(self):
+        point = PointAnalog(description="observable pv point")
+        pv = ProcessValue(point)
+        pv.name = "observable_pv"
+        pv.config()
+        point.writer = self.writer
+
+        o = Observer("observer")
+        pv.add_observer(o.name, o.interrupt)
+        point.value = 12.5
+
+        self.assertEqual(o.reasons, [pv])
+
+    def test_scaled_point(self):
+        point = PointAnalog(description="observable raw point")
+        point.name = "observable_raw"
+        point.writer = self.writer
+        scaled = PointAnalogScaled(
+          scaling=2.0, offset=0.0, point=point, readonly=False)
+        scaled.name = "observable_scaled"
+
+        o = Observer("observer")
+        scaled.readonly_object.add_observer(o.name, o.interrupt)
+        scaled.value = 5.0
+
+        self.assertEqual(o.reasons, [scaled])
+        self.assertEqual(point.value, 10.0)
+
+        scaled.del_observer(o.name)
+        self.assertEqual(point.observers, {})
+
+    def test_slots(self):
+        objects = [
+          PointAnalog(description="slotted analog", u_of_m="kPa"),
+          PointDiscrete(description="slotted discrete"),
+          PointEnumeration(description="slotted enum", states=["A", "B"]),
+          Alarm(description="slotted alarm", on_delay=1.0),
+          AlarmAnalog(description="slotted analog alarm", alarm_value=5.0),
+          self.points[0].readonly_object,
+        ]
+        for o in objects:
+            self.assertFalse(hasattr(o, '__dict__'), type(o).__name__)
+            o._name = "slotted_" + type(o).__name__
+
+            unpickled = jsonpickle.decode(jsonpickle.encode(o))
+            self.assertEqual(o, unpickled)
+            self.assertIsNone(unpickled.observers.get("observer"))
+
+        with self.assertRaises(AttributeError):
+            objects[0].vaule = 1.0
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,193 @@
+import unittest
+import jsonpickle
+
+from pyAutomation.DataObjects.PointAnalog import PointAnalog
+from pyAutomation.DataObjects.PointAnalogAggregate import \
+  PointAnalogAggregate
+from pyAutomation.DataObjects.ProcessValue import ProcessValue
+from pyAutomation.Supervisory.PointManager import PointManager
+
+
+class Writer(object):
+    name = "aggregate_writer"
+
+
+class TestPointAnalogAggregate(unittest.TestCase):
+
+    def setUp(self):
+        self.inputs = []
+        for i in range(3):
+            p = PointAnalog(description=f"Tank level {i}", u_of_m="m")
+            p.name = f"aggregate_level_{i}"
+            p.writer = Writer()
+            p.value = 2.0 + i
+            self.inputs.append(p)
+
+        self.calls = []
+
+    def aggregate(self, mode, **kwargs):
+        point = PointAnalogAggregate(
+          points=[
+            self.inputs[0],
+            self.inputs[1].readonly_object,
+            self.inputs[2].readonly_object,
+          ],
+          description="Tank level",
+          mode=mode,
+          **kwargs
+        )
+        point.name = "aggregate_level_" + mode
+        point.add_observer(
+          "aggregate_observer",
+          lambda name, reason: self.calls.append(reason),
+        )
+        point.config()
+        return point
+
+    def test_modes(self):
+        expected = {
+          'average': 3.0,
+          'median': 3.0,
+          'min': 2.0,
+          'max': 4.0,
+          '2oo3': 3.0,
+        }
+        for mode, value in expected.items():
+            kwargs = {'tolerance': 1.0} if mode == '2oo3' else {}
+            point = self.aggregate(mode, **kwargs)
+            self.assertEqual(point.value, value, mode)
+            self.assertTrue(point.quality, mode)
+            self.assertEqual(point.u_of_m, "m")
+            self.assertFalse(point.hmi_writeable)
+
+    def test_update(self):
+        point = self.aggregate('max')
+        self.inputs[1].value = 10.0
+        self.assertEqual(point.value, 10.0)
+        self.assertEqual(self.calls, [point])
+        self.assertEqual(point.last_update, self.inputs[1].last_update)
+
+        # a change that doesn't move the result isn't passed on.
+        self.inputs[0].value = 5.0
+        self.assertEqual(point.value, 10.0)
+        self.assertEqual(len(self.calls), 1)
+
+    def test_quality(self):
+        point = self.aggregate('average')
+        self.inputs[2].quality = False
+        self.assertEqual(point.value, 2.5)
+        self.assertTrue(point.quality)
+
+        self.inputs[0].quality = False
+        self.inputs[1].quality = False
+        self.assertFalse(point.quality)
+        self.assertEqual(point.value, 3.0)
+
+        self.inputs[1].value = 7.0
+        self.assertTrue(point.quality)
+        self.assertEqual(point.value, 7.0)
+
+    def test_2oo3(self):
+        point = self.aggregate('2oo3', tolerance=0.5)
+        self.assertEqual(point.min_good, 2)
+
+        # the inputs disagree, only the median is within tolerance.
+        self.assertFalse(point.quality)
+
+        self.inputs[0].value = 3.2
+        self.assertTrue(point.quality)
+        self.assertAlmostEqual(point.value, 3.1)
+
+        # a drifting transmitter is outvoted.
+        self.inputs[2].value = 9.0
+        self.assertTrue(point.quality)
+        self.assertAlmostEqual(point.value, 3.1)
+
+        # two out of three are needed.
+        self.inputs[1].quality = False
+        self.assertFalse(point.quality)
+
+    def test_2oo3_config(self):
+        with self.assertRaises(AssertionError):
+            self.aggregate('2oo3')
+        with self.assertRaises(AssertionError):
+            PointAnalogAggregate(
+              points=self.inputs[:2],
+              description="Tank level",
+              mode='2oo3',
+              tolerance=0.5,
+            )
+
+    def test_process_value_input(self):
+        level = PointAnalog(description="Tank level 3", u_of_m="m")
+        level.writer = Writer()
+        level.value = 4.0
+        process_value = ProcessValue(level)
+        process_value.name = "aggregate_process_value"
+        process_value.config()
+        self.inputs[2] = process_value
+
+        point = self.aggregate('max')
+        self.assertEqual(point.value, 4.0)
+
+        # the process value passes itself to its observers, only it is read
+        # again when it changes.
+        self.assertEqual(point._index[id(process_value)], [2])
+        level.value = 8.0
+        self.assertEqual(point.value, 8.0)
+        self.assertEqual(self.calls, [point])
+
+    def test_batch(self):
+        point = self.aggregate('average')
+        with PointManager.batch():
+            self.inputs[0].value = 5.0
+            self.inputs[1].value = 6.0
+            self.inputs[2].value = 7.0
+            self.assertEqual(self.calls, [])
+        self.assertEqual(point.value, 6.0)
+        self.assertEqual(self.calls, [point])
+
+    def test_json_pickle(self):
+        point = self.aggregate('median')
+        unpickled_point = jsonpickle.decode(jsonpickle.encode(point))
+        self.assertEqual(point.value, unpickled_point.value)
+        self.assertEqual(point.quality, unpickled_point.quality)
+        self.assertEqual(point.last_update, unpickled_point.last_update)
+        self.assertEqual(point.mode, unpickled_point.mode)
+
+    def test_yaml(self):
+        PointManager().load_points_from_yaml_string(
+          "points:\n"
+          "  aggregate_yaml: !PointAnalogAggregate\n"
+          "    description: Tank level\n"
+          "    mode: 2oo3\n"
+          "    tolerance: 0.5\n"
+          "    points:\n"
+          "      - &level_1 !PointAnalog\n"
+          "        description: Tank level 1\n"
+          "        u_of_m: m\n"
+          "      - !PointAnalog\n"
+          "        description: Tank level 2\n"
+          "        u_of_m: m\n"
+          "      - !PointAnalog\n"
+          "        description: Tank level 3\n"
+          "        u_of_m: m\n"
+          "  aggregate_yaml_level_1: *level_1\n"
+        )
+        point = PointManager().find_point("aggregate_yaml")
+        self.assertIsInstance(point, PointAnalogAggregate)
+        self.assertEqual(point.mode, '2oo3')
+        self.assertEqual(point.tolerance, 0.5)
+        self.assertEqual(len(point.points), 3)
+        self.assertIs(
+          point.points[0],
+          PointManager().find_point("aggregate_yaml_level_1"),
+        )
+
+        s = PointManager().dump_database_to_yaml()
+        self.assertIn("!PointAnalogAggregate", s)
+        self.assertIn("mode: 2oo3", s)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -74,6 +74,28 @@ class TestPointAnalogScaled(unittest.TestCase):
         point_scaled.value = 44.0
         self.assertEqual(point_analog.value, 87.0)
 
+    def test_cached_value(self):
+        point_analog = \
+          PointManager().find_point("temperature_source").readwrite_object
+        point_scaled = PointManager().find_point("test_scaled_point")
+        self.assertIs(
+          point_scaled.readonly_object, point_scaled.readonly_object)
+
+        point_analog.value = 10.0
+        self.assertEqual(point_scaled.value, 5.5)
+        point_scaled.offset = 0.0
+        self.assertEqual(point_scaled.value, 5.0)
+        point_scaled.offset = -1.0
+        point_analog.value = 12.0
+        self.assertEqual(point_scaled.value, 6.5)
+
+        # the cached pair is dropped when the scaling changes.
+        point_scaled.scaling = 1.0
+        self.assertIsNone(point_scaled._cache)
+        self.assertEqual(point_scaled.value, 13.0)
+        self.assertEqual(point_scaled._cache, (12.0, 13.0))
+        point_scaled.scaling = 2.0
+
     def test_yaml_pickle(self):
         point = PointManager().find_point("test_scaled_point")
         s = PointManager().dump_database_to_yaml()
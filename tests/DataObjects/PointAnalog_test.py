@@ -1,9 +1,12 @@
 import unittest
+from datetime import timedelta
+
 import jsonpickle
 import ruamel.yaml
 from ruamel.yaml.compat import StringIO
 
 from pyAutomation.DataObjects.PointAnalog import PointAnalog
+from pyAutomation.Supervisory.VirtualClock import VirtualClock
 
 
 class TestPointAnalog(unittest.TestCase):
@@ -68,6 +71,92 @@ class TestPointAnalog(unittest.TestCase):
         self.point.value = 100.0
         self.assertEqual('100.0 ºC', self.point.hmi_value)
 
+    def test_next_update(self):
+        with VirtualClock() as clock:
+            point = PointAnalog(description="next update", update_period=1.0)
+            clock.advance(0.5)
+            point.value = 1.0
+            self.assertEqual(point.update_period, timedelta(seconds=1.0))
+            self.assertEqual(point.last_update, clock.now())
+            self.assertEqual(
+              point.next_update, clock.now() + timedelta(seconds=0.5))
+
+            # any number of missed periods are skipped in one step.
+            clock.advance(3600.25)
+            point.value = 2.0
+            self.assertEqual(
+              point.next_update, clock.now() + timedelta(seconds=0.25))
+
+    def test_next_update_ns(self):
+        with VirtualClock() as clock:
+            point = PointAnalog(description="next update", update_period=1.0)
+            clock.advance(0.5)
+            point.value = 1.0
+            self.assertEqual(
+              point.next_update_ns, clock.monotonic_ns() + 500000000)
+            self.assertEqual(
+              point.readonly_object.next_update_ns, point.next_update_ns)
+
+            # a write inside the deadband still moves the schedule on.
+            point.deadband = 1.0
+            clock.advance(1.0)
+            point.value = 1.5
+            self.assertEqual(point.value, 1.0)
+            self.assertEqual(
+              point.next_update_ns, clock.monotonic_ns() + 500000000)
+
+            point = PointAnalog(description="no update period")
+            self.assertIsNone(point.next_update_ns)
+            self.assertIsNone(point.readonly_object.next_update_ns)
+
+    def test_deadband(self):
+        observed = []
+
+        class Writer(object):
+            name = "writer"
+
+        with VirtualClock() as clock:
+            point = PointAnalog(
+              description="deadband",
+              deadband=0.5,
+              deadband_percent=1.0,
+              max_report_interval=10.0,
+            )
+            point.name = "deadband"
+            point.writer = Writer()
+            point.add_observer(
+              "test", lambda name, reason: observed.append(point.value))
+
+            point.value = 100.0
+            last_update = point.last_update
+
+            # inside the larger of 0.5 and 1% of 100.0.
+            clock.advance(1.0)
+            point.value = 100.9
+            self.assertEqual(point.value, 100.0)
+            self.assertEqual(point.raw_value, 100.9)
+            self.assertEqual(point.last_update, last_update)
+            self.assertEqual(observed, [100.0])
+
+            point.value = 101.5
+            self.assertEqual(point.value, 101.5)
+            self.assertEqual(point.last_update, clock.now())
+            self.assertEqual(observed, [100.0, 101.5])
+
+            # reported when the max report interval is up, moved or not.
+            clock.advance(10.0)
+            point.value = 101.5
+            self.assertEqual(point.last_update, clock.now())
+            self.assertEqual(observed, [100.0, 101.5, 101.5])
+
+            self.assertEqual(point.readonly_object.raw_value, 101.5)
+            self.assertEqual(point.yaml_dict['max_report_interval'], 10.0)
+
+            point.deadband = None
+            point.deadband_percent = None
+            point.max_report_interval = None
+            self.assertIsNone(point._report)
+
     def test_a_yaml_pickle(self):
         yml = ruamel.yaml.YAML(typ='safe', pure=True)
         yml.default_flow_style = False
@@ -79,7 +168,7 @@ class TestPointAnalog(unittest.TestCase):
         yml.dump(self.point, stream)
         s=stream.getvalue()
         unpickled_point = yml.load(s)
-        unpickled_point.nane = "feed_state"
+        unpickled_point.name = "feed_state"
 
         self.assertEqual(
           self.point.description,
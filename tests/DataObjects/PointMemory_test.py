@@ -0,0 +1,98 @@
+import gc
+import tracemalloc
+import unittest
+
+from pyAutomation.DataObjects.Alarm import Alarm
+from pyAutomation.DataObjects.AlarmAnalog import AlarmAnalog
+from pyAutomation.DataObjects.PointAbstract import PointAbstract
+from pyAutomation.DataObjects.PointAnalog import PointAnalog
+from pyAutomation.DataObjects.PointDiscrete import PointDiscrete
+from pyAutomation.DataObjects.PointEnumeration import PointEnumeration
+from pyAutomation.Supervisory.PointManager import PointManager
+
+
+class Writer(object):
+    name = "memory_writer"
+
+
+class TestPointMemory(unittest.TestCase):
+    """ Keeps the bytes per object, measured as benchmarks/point_memory.py
+    does, within the budget of each type. """
+
+    OBJECTS = 5000
+
+    # bytes per object, see the README.
+    BUDGET = {
+      PointAnalog: 208,
+      PointDiscrete: 192,
+      PointEnumeration: 184,
+      Alarm: 192,
+      AlarmAnalog: 216,
+    }
+
+    def setUp(self):
+        # the change log ring is a fixed cost rather than a per point one,
+        # keep it out of the measurement.
+        self.old_log = PointAbstract.change_log
+        PointManager.use_change_log(1)
+
+    def tearDown(self):
+        PointAbstract.change_log = self.old_log
+
+    @staticmethod
+    def build(kind, i, name, writer):
+        if kind is PointAnalog:
+            p = PointAnalog(description="analog point", u_of_m="kPa")
+        elif kind is PointDiscrete:
+            p = PointDiscrete(description="discrete point")
+        elif kind is PointEnumeration:
+            p = PointEnumeration(
+              description="enumeration point", states=["Hand", "Off", "Auto"])
+        elif kind is AlarmAnalog:
+            p = AlarmAnalog(description="analog alarm", alarm_value=10.0)
+        else:
+            p = Alarm(description="alarm", on_delay=1.0)
+        p.name = name
+
+        if kind is PointAnalog:
+            p.writer = writer
+            p.value = float(i)
+        elif kind is PointDiscrete:
+            p.writer = writer
+            p.value = True
+        return p
+
+    def measure(self, kind):
+        count = TestPointMemory.OBJECTS
+        writer = Writer()
+        names = [f"memory_{kind.__name__}_{i}" for i in range(count)]
+        objects = [None] * count
+        warm_up = [None] * 100
+        gc.collect()
+
+        tracemalloc.start()
+        try:
+            # one-off allocations (caches, interned states, the free lists of
+            # the interpreter filling up) aren't per object, so they're made
+            # before the measurement starts.
+            for i in range(len(warm_up)):
+                warm_up[i] = TestPointMemory.build(
+                  kind, i, f"warm_up_{kind.__name__}_{i}", writer)
+
+            start = tracemalloc.get_traced_memory()[0]
+            for i in range(count):
+                objects[i] = TestPointMemory.build(kind, i, names[i], writer)
+            total = tracemalloc.get_traced_memory()[0] - start
+        finally:
+            tracemalloc.stop()
+        # whole bytes, as point_memory.py reports them.
+        return round(total / count)
+
+    def test_budget(self):
+        for kind, budget in TestPointMemory.BUDGET.items():
+            with self.subTest(kind=kind.__name__):
+                self.assertLessEqual(self.measure(kind), budget)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -49,6 +49,14 @@ class TestPointReadOnly(unittest.TestCase):
           obj = self.point_enumeration,
         )
 
+    def test_readonly_object(self):
+        view = self.point_analog.readonly_object
+        self.assertIs(view, self.point_analog.readonly_object)
+        self.assertIs(view.readonly_object, view)
+
+        # a view of a view reads the point directly.
+        self.assertIs(PointReadOnly(view)._point, self.point_analog)
+
     def test_json_pickle_analog(self):
         self.point = PointReadOnly(self.point_analog)
         pickle_text = jsonpickle.encode(self.point)
@@ -0,0 +1,116 @@
+import sys
+import threading
+import unittest
+
+from pyAutomation.DataObjects.PointAnalog import PointAnalog
+from pyAutomation.DataObjects.PointDiscrete import PointDiscrete
+from pyAutomation.DataObjects.VQT import VQT
+from pyAutomation.Supervisory.PointStore import PointStore
+
+
+class Writer(object):
+    name = "vqt_writer"
+
+
+class TestVQT(unittest.TestCase):
+
+    WRITES = 5000
+    POINTS = 3
+    READERS = 3
+
+    def setUp(self):
+        # switch threads as often as possible so the readers land in the
+        # middle of writes.
+        self.switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+        self.points = []
+        for i in range(TestVQT.POINTS):
+            p = PointAnalog(description=f"vqt point {i}", u_of_m="kPa")
+            p.name = f"vqt_point_{i}"
+            p.writer = Writer()
+            self.points.append(p)
+
+    def tearDown(self):
+        sys.setswitchinterval(self.switch_interval)
+
+    def test_snapshot(self):
+        p = self.points[0]
+        p.value = 12.5
+        vqt = p.vqt
+        self.assertIsInstance(vqt, VQT)
+        self.assertEqual(vqt.value, 12.5)
+        self.assertTrue(vqt.quality)
+        self.assertEqual(vqt.last_update, p.last_update)
+
+        # the views and the stored state give the same snapshot.
+        self.assertEqual(p.readonly_object.vqt, vqt)
+        store = PointStore(self.points)
+        self.assertEqual(p.vqt, vqt)
+        store.close()
+        self.assertEqual(p.vqt, vqt)
+
+        d = PointDiscrete(description="vqt discrete")
+        self.assertEqual(d.vqt, (None, False, 0))
+
+    def hammer(self):
+        """ Writes each point from its own thread while the readers take
+        snapshots of every point, then checks each snapshot is one the
+        writer made. """
+
+        # (value, quality, timestamp) of every state each writer published.
+        published = [set() for _ in self.points]
+        snapshots = []
+        done = threading.Event()
+
+        def write(i):
+            p = self.points[i]
+            for k in range(1, TestVQT.WRITES + 1):
+                p.value = float(k)
+                published[i].add(tuple(p.vqt))
+                if k % 3 == 0:
+                    p.quality = False
+                    published[i].add(tuple(p.vqt))
+
+        def read():
+            seen = []
+            while not done.is_set():
+                for i, p in enumerate(self.points):
+                    seen.append((i, tuple(p.vqt)))
+            snapshots.append(seen)
+
+        for i, p in enumerate(self.points):
+            published[i].add(tuple(p.vqt))
+
+        readers = [
+          threading.Thread(target=read) for _ in range(TestVQT.READERS)]
+        writers = [
+          threading.Thread(target=write, args=(i,))
+          for i in range(TestVQT.POINTS)
+        ]
+        for t in readers + writers:
+            t.start()
+        for t in writers:
+            t.join()
+        done.set()
+        for t in readers:
+            t.join()
+
+        count = 0
+        for seen in snapshots:
+            for i, vqt in seen:
+                self.assertIn(vqt, published[i])
+            count += len(seen)
+        self.assertGreater(count, 0)
+
+    def test_concurrent(self):
+        self.hammer()
+
+    def test_concurrent_store(self):
+        store = PointStore(self.points)
+        self.hammer()
+        store.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
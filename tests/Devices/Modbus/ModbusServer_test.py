@@ -1,5 +1,7 @@
 import pytest
+import socket
 from pyAutomation.Devices.Modbus.ModbusServer import ModbusServer
+from pyAutomation.Supervisory.AsyncEventLoop import AsyncEventLoop
 from pyAutomation.Supervisory.PointManager import PointManager
 import ruamel
 import os
@@ -31,6 +33,7 @@ def modbus_server():
       os.path.dirname(__file__),
       "./test_points.yaml",
     )
+    PointManager().clear_database()
     PointManager().load_points_from_yaml_file(filename)
 
     parameters = {
@@ -106,4 +109,41 @@ def test_cmd_05_fail(modbus_server):
     command is invalid.
 
     '''
-    pd1 = PointManager().get_point_test('point_discrete_1')
\ No newline at end of file
+    pd1 = PointManager().get_point_test('point_discrete_1')
+
+def test_tcp(modbus_server):
+    ''' Run the server on an event loop and read coils over TCP. Several
+    requests can be made on the one connection.
+
+    '''
+    pd1 = PointManager().get_point_test('point_discrete_1')
+    pd1.value = True
+
+    event_loop = AsyncEventLoop(logger='testbench')
+    event_loop.start()
+    modbus_server.endpoint_address = '127.0.0.1'
+    modbus_server.port = 0
+    modbus_server.event_loop = event_loop
+    modbus_server.start()
+
+    try:
+        # wait for the server to start listening.
+        for _ in range(100):
+            if modbus_server.server is not None:
+                break
+            event_loop.thread.join(0.01)
+        port = modbus_server.server.sockets[0].getsockname()[1]
+
+        request = bytearray(
+          [0x12, 0x34, 0x00, 0x00, 0x00, 0x06, 0x01]
+          + [0x01, 0x00, 0x03, 0x00, 0x01])
+
+        with socket.create_connection(('127.0.0.1', port), timeout=5) as s:
+            for _ in range(2):
+                s.sendall(request)
+                reply = s.recv(64)
+                assert reply == bytearray(
+                  [0x12, 0x34, 0x00, 0x00, 0x00, 0x04, 0x01]
+                  + [0x01, 0x01, 0x01])
+    finally:
+        event_loop.shutdown()
@@ -0,0 +1,150 @@
+import email
+import socketserver
+import threading
+import unittest
+
+from pyAutomation.DataObjects.Alarm import Alarm
+from pyAutomation.Supervisory.AlarmEmailer import AlarmEmailer
+from pyAutomation.Supervisory.AlarmHandler import AlarmHandler
+
+
+class SmtpHandler(socketserver.StreamRequestHandler):
+    """ Just enough of an SMTP server for smtplib. """
+
+    def reply(self, line):
+        self.wfile.write(line.encode() + b"\r\n")
+
+    def handle(self):
+        server = self.server
+        with server.lock:
+            server.connections += 1
+        self.reply("220 localhost")
+        while True:
+            line = self.rfile.readline().decode().strip()
+            command = line[:4].upper()
+            if command in ('EHLO', 'HELO'):
+                self.reply("250 localhost")
+            elif command in ('MAIL', 'RCPT', 'RSET', 'NOOP'):
+                self.reply("250 OK")
+            elif command == 'DATA':
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                lines = []
+                while True:
+                    line = self.rfile.readline().decode()
+                    if line in (".\r\n", ""):
+                        break
+                    lines.append(line)
+                with server.lock:
+                    server.messages.append(
+                      email.message_from_string("".join(lines)))
+                    hang_up = server.hang_up
+                    server.hang_up = False
+                self.reply("250 OK")
+                if hang_up:
+                    return
+            else:
+                self.reply("221 Bye")
+                return
+
+
+class SmtpServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), SmtpHandler)
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.messages = []
+        # drops the connection after the next message.
+        self.hang_up = False
+
+
+class TestAlarmEmailer(unittest.TestCase):
+
+    def setUp(self):
+        self.server = SmtpServer()
+        threading.Thread(target=self.server.serve_forever, daemon=True) \
+          .start()
+
+        self.previous_handler = Alarm.alarm_handler
+        self.previous_notifiers = Alarm.alarm_notifiers
+        Alarm.alarm_handler = AlarmHandler(
+          logger='testbench', name="emailer_alarm_handler")
+
+        self.emailer = AlarmEmailer(name="test_emailer", logger='testbench')
+        self.emailer.mailhost = "127.0.0.1"
+        self.emailer.mailport = self.server.server_address[1]
+        self.emailer.mail_sender = "noreply@fake.com"
+        self.emailer.mail_receivers = "operator@fake.com"
+        self.emailer.digest_window = 0.0
+        Alarm.alarm_notifiers = [self.emailer]
+
+        self.alarms = []
+        for i in range(20):
+            a = Alarm(
+              description=f"Tank {i} high level",
+              consequences="Tank overflow",
+              more_info="Check the inlet valve",
+            )
+            a.name = f"emailed_alarm_{i}"
+            self.alarms.append(a)
+
+    def tearDown(self):
+        self.emailer.close(timeout=5.0)
+        self.server.shutdown()
+        self.server.server_close()
+        Alarm.alarm_handler = self.previous_handler
+        Alarm.alarm_notifiers = self.previous_notifiers
+
+    def test_single(self):
+        self.alarms[0].input = True
+        self.emailer.close(timeout=5.0)
+
+        self.assertEqual(len(self.server.messages), 1)
+        message = self.server.messages[0]
+        self.assertEqual(message['Subject'], "Tank 0 high level alarm")
+        self.assertEqual(message['To'], "operator@fake.com")
+        self.assertIn("Consequences: Tank overflow", message.get_payload())
+
+    def test_flood(self):
+        self.emailer.digest_window = 0.5
+        # the reset comes before the alarm flood, during one it'd be held
+        # back by the alarm handler.
+        self.alarms[0].input = True
+        self.alarms[0].input = False
+        for a in self.alarms[1:]:
+            a.input = True
+        self.emailer.close(timeout=5.0)
+
+        self.assertEqual(len(self.server.messages), 1)
+        message = self.server.messages[0]
+        self.assertEqual(message['Subject'], "20 alarms changed")
+        text = message.get_payload()
+        self.assertIn("Tank 0 high level reset (2 transitions)", text)
+        self.assertIn("Tank 19 high level activated", text)
+
+    def test_connection_reuse(self):
+        for i, a in enumerate(self.alarms[:3]):
+            a.input = True
+            self.wait_for_messages(i + 1)
+        self.assertEqual(self.server.connections, 1)
+
+        # the server closing the connection costs a new one, not a message.
+        self.server.hang_up = True
+        self.alarms[3].input = True
+        self.wait_for_messages(4)
+        self.alarms[4].input = True
+        self.wait_for_messages(5)
+        self.assertEqual(self.server.connections, 2)
+
+    def wait_for_messages(self, count):
+        for _ in range(500):
+            with self.server.lock:
+                if len(self.server.messages) >= count:
+                    return
+            threading.Event().wait(0.01)
+        self.fail(f"{count} messages weren't sent")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,229 @@
+import datetime
+import unittest
+
+import jsonpickle
+
+from pyAutomation.DataObjects.Alarm import Alarm
+from pyAutomation.Supervisory.AlarmHandler import AlarmHandler
+from pyAutomation.Supervisory.PointManager import PointManager
+from pyAutomation.Supervisory.RpcServer import RpcServer
+from pyAutomation.Supervisory.VirtualClock import VirtualClock
+
+
+class Notifier(object):
+
+    def __init__(self):
+        self.notifications = []
+        self.summaries = []
+
+    def notify(self, alarm, verb):
+        self.notifications.append((alarm.name, verb))
+
+    def notify_summary(self, alarm, text):
+        self.summaries.append((alarm.name, text))
+
+
+class TestAlarmHandler(unittest.TestCase):
+
+    def setUp(self):
+        self.previous_handler = Alarm.alarm_handler
+        self.handler = AlarmHandler(
+          logger='testbench', name="test_alarm_handler")
+        Alarm.alarm_handler = self.handler
+        self.alarms = []
+        for i in range(3):
+            a = Alarm(description=f"delayed alarm {i}", on_delay=10.0 + i)
+            a.name = f"timer_alarm_{i}"
+            self.alarms.append(a)
+
+    def tearDown(self):
+        Alarm.alarm_handler = self.previous_handler
+
+    def test_delays(self):
+        with VirtualClock(start=datetime.datetime(2019, 1, 1)) as clock:
+            for a in self.alarms:
+                a.input = True
+
+            # only the first timer has to wake the handler.
+            self.assertEqual(len(self.handler._pending_interrupts), 1)
+            self.assertEqual(self.handler.count_alarm_timer_list(), 3)
+
+            self.alarms[1].input = False
+            self.assertEqual(self.handler.count_alarm_timer_list(), 2)
+
+            self.assertEqual(self.handler.run_cycle(), 10.0)
+            clock.advance(10.0)
+            self.assertEqual(self.handler.run_cycle(), 2.0)
+            self.assertTrue(self.alarms[0].active)
+            self.assertFalse(self.alarms[2].active)
+
+            # a lengthened delay is waited out.
+            self.alarms[2].on_delay = 15.0
+            clock.advance(2.0)
+            self.assertEqual(self.handler.run_cycle(), 3.0)
+            self.assertFalse(self.alarms[2].active)
+            clock.advance(3.0)
+            self.assertIsNone(self.handler.run_cycle())
+            self.assertTrue(self.alarms[2].active)
+            self.assertFalse(self.alarms[1].active)
+
+    def test_active_alarms(self):
+        for a in self.alarms:
+            a.on_delay = 0.0
+        twin = Alarm(description="delayed alarm 0")
+        twin.name = "timer_alarm_twin"
+
+        for a in self.alarms + [twin]:
+            a.input = True
+        self.assertEqual(self.handler.active_alarm_list, self.alarms + [twin])
+
+        # alarms configured alike are still different alarms.
+        self.alarms[0].input = False
+        self.alarms[0].acknowledge()
+        self.assertNotIn(self.alarms[0].handle, self.handler.active_alarms)
+        self.assertIn(twin.handle, self.handler.active_alarms)
+        with self.assertRaises(ValueError):
+            self.handler.remove_active_alarm(self.alarms[0])
+
+        # still listed until acknowledged.
+        self.alarms[1].input = False
+        self.assertEqual(
+          self.handler.active_alarm_list,
+          self.alarms[1:] + [twin],
+        )
+
+    def test_flood(self):
+        handler = AlarmHandler(
+          logger='testbench',
+          name="flood_alarm_handler",
+          flood_threshold=4,
+          flood_window=60.0,
+          hmi_period=5.0,
+        )
+        Alarm.alarm_handler = handler
+        notifier = Notifier()
+        previous_notifiers = Alarm.alarm_notifiers
+        Alarm.alarm_notifiers = [notifier]
+        server = RpcServer()
+        server.alarm_handler = handler
+
+        alarms = []
+        for i in range(8):
+            a = Alarm(description=f"pump {i // 4} alarm {i}")
+            if i >= 4:
+                a.group = "pump 1"
+            a.name = f"flood_alarm_{i}"
+            alarms.append(a)
+
+        try:
+            with VirtualClock(start=datetime.datetime(2019, 1, 1)) as clock:
+                for a in alarms[:4]:
+                    a.input = True
+                    clock.advance(1.0)
+                self.assertFalse(handler.flooded)
+                self.assertEqual(len(notifier.notifications), 4)
+
+                # the fifth alarm starts the flood and is passed on, the
+                # rest of its group is held back.
+                for a in alarms[4:]:
+                    a.input = True
+                self.assertTrue(handler.flooded)
+                self.assertEqual(notifier.notifications[4:], [
+                  ("flood_alarm_4", "activated"),
+                ])
+
+                # the HMI list isn't encoded again for a while.
+                self.assertEqual(
+                  len(jsonpickle.decode(
+                    server.exposed_get_active_alarm_list())),
+                  8)
+                alarms[7].input = False
+                alarms[7].acknowledge()
+                self.assertEqual(
+                  len(jsonpickle.decode(
+                    server.exposed_get_active_alarm_list())),
+                  8)
+                clock.advance(5.0)
+                self.assertEqual(
+                  len(jsonpickle.decode(
+                    server.exposed_get_active_alarm_list())),
+                  7)
+
+                # every transition is recorded.
+                self.assertEqual(len(handler.events), 9)
+                self.assertEqual(
+                  handler.events[-1][1:], (alarms[7].handle, "reset"))
+
+                # the handler wakes up as each activation leaves the window
+                # until the flood is over.
+                sleep_times = []
+                sleep_time = handler.run_cycle()
+                while sleep_time is not None:
+                    sleep_times.append(sleep_time)
+                    clock.advance(sleep_time)
+                    sleep_time = handler.run_cycle()
+                self.assertEqual(sleep_times, [51.0, 1.0, 1.0, 1.0, 1.0])
+                self.assertFalse(handler.flooded)
+                self.assertEqual(len(notifier.notifications), 5)
+                self.assertEqual(notifier.summaries, [
+                  ("flood_alarm_4",
+                   "and 4 related alarm transitions (alarm flood)"),
+                ])
+        finally:
+            Alarm.alarm_notifiers = previous_notifiers
+
+    def test_flood_group_limit(self):
+        handler = AlarmHandler(
+          logger='testbench',
+          name="flood_limit_alarm_handler",
+          flood_threshold=2,
+          flood_window=60.0,
+          flood_group_limit=1,
+        )
+        Alarm.alarm_handler = handler
+        notifier = Notifier()
+        previous_notifiers = Alarm.alarm_notifiers
+        Alarm.alarm_notifiers = [notifier]
+
+        alarms = []
+        for i in range(5):
+            a = Alarm(description=f"ungrouped alarm {i}")
+            a.name = f"flood_limit_alarm_{i}"
+            alarms.append(a)
+
+        try:
+            with VirtualClock(start=datetime.datetime(2019, 1, 1)) as clock:
+                # each ungrouped alarm is a group of its own, only the
+                # first of the flood is passed on.
+                for a in alarms:
+                    a.input = True
+                self.assertTrue(handler.flooded)
+                self.assertEqual(
+                  [name for name, _ in notifier.notifications],
+                  [a.name for a in alarms[:3]])
+
+                alarms[3].input = False
+                clock.advance(60.0)
+                self.assertIsNone(handler.run_cycle())
+                self.assertFalse(handler.flooded)
+                self.assertEqual(notifier.summaries, [
+                  ("flood_limit_alarm_3",
+                   "2 alarm transitions held back (alarm flood)"),
+                  ("flood_limit_alarm_4",
+                   "1 alarm transitions held back (alarm flood)"),
+                ])
+        finally:
+            Alarm.alarm_notifiers = previous_notifiers
+
+    def test_handles(self):
+        a = Alarm(description="registered alarm")
+        b = Alarm(description="registered alarm")
+        PointManager.add_to_database(name="handle_alarm_a", obj=a)
+        PointManager.add_to_database(name="handle_alarm_b", obj=b)
+        self.assertEqual(b.handle, a.handle + 1)
+        self.assertNotEqual(a, b)
+        self.assertEqual(len({a, b}), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
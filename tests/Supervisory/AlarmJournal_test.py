@@ -0,0 +1,220 @@
+import datetime
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from pyAutomation.DataObjects.Alarm import Alarm
+from pyAutomation.DataObjects.AlarmAnalog import AlarmAnalog
+from pyAutomation.Supervisory.AlarmHandler import AlarmHandler
+from pyAutomation.Supervisory.AlarmJournal import AlarmJournal
+from pyAutomation.Supervisory.VirtualClock import VirtualClock
+
+UTC = datetime.timezone.utc
+
+
+class TestAlarmJournal(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.previous_handler = Alarm.alarm_handler
+        Alarm.alarm_handler = AlarmHandler(
+          logger='testbench', name="journal_alarm_handler")
+        self.journal = AlarmJournal(
+          directory=self.directory,
+          segment_period=3600.0,
+          logger='testbench',
+        )
+        Alarm.alarm_journal = self.journal
+
+        self.alarm = Alarm(description="pump fault", off_delay=5.0)
+        self.alarm.name = "journal_pump_fault"
+        self.level = AlarmAnalog(
+          description="tank high level", alarm_value=90.0)
+        self.level.name = "journal_tank_high"
+
+    def tearDown(self):
+        self.journal.close(timeout=5.0)
+        Alarm.alarm_journal = None
+        Alarm.alarm_handler = self.previous_handler
+        shutil.rmtree(self.directory)
+
+    def run_alarms(self, start=None):
+        """ Two hours of transitions, by default starting half an hour into
+        the hour. """
+        if start is None:
+            start = datetime.datetime(2019, 1, 1, 0, 30, tzinfo=UTC)
+        self.journal.start()
+        with VirtualClock(start=start) as clock:
+            for _ in range(4):
+                self.alarm.input = True
+                self.level.evaluate_analog(95.0)
+                clock.advance(900.0)
+                self.alarm.input = False
+                self.level.evaluate_analog(50.0)
+                clock.advance(900.0)
+        self.journal.close(timeout=5.0)
+        return start
+
+    def test_record(self):
+        start = self.run_alarms()
+        self.assertEqual(len(AlarmJournal.segments(self.directory)), 3)
+
+        entries = list(AlarmJournal.query(self.directory))
+        self.assertEqual(len(entries), 16)
+        self.assertEqual(
+          [(e.name, e.old_state, e.new_state, e.value) for e in entries[:4]],
+          [
+            ("journal_pump_fault", "OFF", "ALARM", 1.0),
+            ("journal_tank_high", "OFF", "ALARM", 95.0),
+            ("journal_pump_fault", "ALARM", "OFF_DELAY", 0.0),
+            ("journal_tank_high", "ALARM", "OFF", 50.0),
+          ])
+        self.assertEqual(entries[0].time, start)
+        self.assertEqual(entries[0].handle, self.alarm.handle)
+        self.assertEqual(
+          entries[2].monotonic_ns - entries[0].monotonic_ns, 900 * 10 ** 9)
+
+    def test_query(self):
+        start = self.run_alarms()
+        hour = datetime.timedelta(hours=1)
+
+        entries = list(AlarmJournal.query(
+          self.directory, start=start + hour, end=start + 2 * hour))
+        self.assertEqual(len(entries), 8)
+        self.assertEqual(entries[0].time, start + hour)
+        self.assertTrue(all(e.time < start + 2 * hour for e in entries))
+
+        entries = list(AlarmJournal.query(
+          self.directory,
+          start=start + hour,
+          alarms=["journal_tank_high"],
+        ))
+        self.assertEqual(len(entries), 4)
+        self.assertTrue(all(e.name == "journal_tank_high" for e in entries))
+
+        entries = list(AlarmJournal.query(
+          self.directory, alarms=[self.alarm.handle]))
+        self.assertEqual(len(entries), 8)
+
+    @unittest.skipUnless(hasattr(time, 'tzset'), "needs time.tzset()")
+    def test_daylight_saving(self):
+        # the clocks go back from 02:00 EDT to 01:00 EST during the run.
+        tz = os.environ.get('TZ')
+        os.environ['TZ'] = 'EST5EDT,M3.2.0,M11.1.0'
+        time.tzset()
+        try:
+            start = self.run_alarms(
+              start=datetime.datetime(2019, 11, 3, 5, 0, tzinfo=UTC))
+        finally:
+            if tz is None:
+                del os.environ['TZ']
+            else:
+                os.environ['TZ'] = tz
+            time.tzset()
+
+        entries = list(AlarmJournal.query(self.directory))
+        self.assertEqual(len(entries), 16)
+        for e in entries:
+            self.assertEqual(
+              e.time,
+              start + datetime.timedelta(microseconds=e.monotonic_ns // 1000))
+
+    def test_time_set_back(self):
+        start = datetime.datetime(2019, 1, 1, 0, 30, tzinfo=UTC)
+        self.journal.start()
+        with VirtualClock(start=start) as clock:
+            for _ in range(4):
+                self.alarm.input = True
+                clock.advance(900.0)
+                self.alarm.input = False
+                clock.advance(900.0)
+
+            # set back half an hour, into the time already journaled.
+            clock.step(-1800.0)
+            self.alarm.input = True
+            clock.advance(60.0)
+            self.alarm.input = False
+        self.journal.close(timeout=5.0)
+        self.assertEqual(len(AlarmJournal.segments(self.directory)), 4)
+
+        # the records are merged into time order.
+        entries = list(AlarmJournal.query(self.directory))
+        self.assertEqual(len(entries), 10)
+        times = [e.time for e in entries]
+        self.assertEqual(times, sorted(times))
+
+        # a query in the overlap finds the records from before and after
+        # the time was set back.
+        entries = list(AlarmJournal.query(
+          self.directory,
+          start=start + datetime.timedelta(minutes=90),
+          end=start + datetime.timedelta(minutes=105),
+        ))
+        self.assertEqual(
+          [e.time for e in entries],
+          [
+            start + datetime.timedelta(minutes=90),
+            start + datetime.timedelta(minutes=90),
+            start + datetime.timedelta(minutes=91),
+          ])
+
+    def test_segment_name_taken(self):
+        start = datetime.datetime(2019, 1, 1, 0, 30, tzinfo=UTC)
+        taken = os.path.join(
+          self.directory, start.strftime("alarms-%Y%m%dT%H%M%S.%fZ.journal"))
+        open(taken, 'wb').close()
+
+        self.journal.start()
+        with VirtualClock(start=start):
+            self.alarm.input = True
+        self.journal.close(timeout=5.0)
+
+        self.assertEqual(os.path.getsize(taken), 0)
+        entries = list(AlarmJournal.query(self.directory))
+        self.assertEqual(len(entries), 1)
+        self.assertEqual(entries[0].time, start)
+
+    def test_open_failure(self):
+        # a segment can't be opened while the directory is missing, the
+        # next batch after it's back starts one.
+        utc_ns = 1546302600 * 10 ** 9
+        record = (self.alarm.handle, self.alarm.name, 0, 3, 0, utc_ns, 1.0)
+        os.rmdir(self.directory)
+        with self.assertRaises(FileNotFoundError):
+            self.journal._write([record])
+
+        os.mkdir(self.directory)
+        self.journal._write([record[:5] + (utc_ns + 1000, 0.0)])
+        self.journal._close_segment()
+        entries = list(AlarmJournal.query(self.directory))
+        self.assertEqual(len(entries), 1)
+        self.assertEqual(entries[0].value, 0.0)
+
+    def test_partial_record(self):
+        self.run_alarms()
+        _, path = AlarmJournal.segments(self.directory)[-1]
+        with open(path, 'ab') as f:
+            f.write(b"\x01\x02\x03")
+        self.assertEqual(len(list(AlarmJournal.query(self.directory))), 16)
+
+    def test_restart(self):
+        # each run of the journal starts a segment of its own.
+        self.run_alarms()
+        segments = len(AlarmJournal.segments(self.directory))
+        self.journal = AlarmJournal(directory=self.directory)
+        Alarm.alarm_journal = self.journal
+        self.journal.start()
+        self.alarm.input = True
+        self.journal.close(timeout=5.0)
+        self.assertEqual(
+          len(AlarmJournal.segments(self.directory)), segments + 1)
+        self.assertTrue(
+          os.path.exists(
+            AlarmJournal.segments(self.directory)[-1][1][:-len(".journal")]
+            + ".names"))
+
+
+if __name__ == '__main__':
+    unittest.main()
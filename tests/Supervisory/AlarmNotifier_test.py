@@ -0,0 +1,115 @@
+import threading
+import time
+import unittest
+
+from pyAutomation.DataObjects.Alarm import Alarm
+from pyAutomation.Supervisory.AlarmHandler import AlarmHandler
+from pyAutomation.Supervisory.AlarmNotifier import AlarmNotifier
+
+
+class StalledNotifier(AlarmNotifier):
+    """ Holds each batch until released, like a mail server that hangs. """
+
+    def __init__(self, name, logger):
+        super().__init__(name=name, logger=logger)
+        self.release = threading.Event()
+        self.sending = threading.Event()
+        self.batches = []
+
+    def send(self, events, dropped):
+        self.sending.set()
+        self.release.wait(5.0)
+        events = [(e.name, e.verb, e.transitions) for e in events]
+        self.batches.append((events, dropped))
+
+
+class TestAlarmNotifier(unittest.TestCase):
+
+    def setUp(self):
+        self.previous_handler = Alarm.alarm_handler
+        self.previous_notifiers = Alarm.alarm_notifiers
+        Alarm.alarm_handler = AlarmHandler(
+          logger='testbench', name="notifier_alarm_handler")
+
+        self.notifier = StalledNotifier(
+          name="stalled_notifier", logger='testbench')
+        self.notifier.queue_size = 2
+        self.notifier.digest_window = 0.0
+        Alarm.alarm_notifiers = [self.notifier]
+
+        self.alarms = []
+        for i in range(4):
+            a = Alarm(description=f"notified alarm {i}")
+            a.name = f"notified_alarm_{i}"
+            self.alarms.append(a)
+
+    def tearDown(self):
+        self.notifier.release.set()
+        self.notifier.close(timeout=5.0)
+        Alarm.alarm_handler = self.previous_handler
+        Alarm.alarm_notifiers = self.previous_notifiers
+
+    def test_overload(self):
+        self.alarms[0].input = True
+        self.assertTrue(self.notifier.sending.wait(5.0))
+
+        # the worker is stuck, the logic isn't.
+        start = time.perf_counter()
+        for a in self.alarms:
+            a.input = False
+            a.input = True
+        self.assertLess(time.perf_counter() - start, 1.0)
+
+        self.notifier.release.set()
+        self.notifier.close(timeout=5.0)
+        self.assertEqual(self.notifier.batches, [
+          ([("notified_alarm_0", "activated", 1)], 0),
+          # merged while queued, the last two alarms didn't fit.
+          ([
+            ("notified_alarm_0", "activated", 2),
+            ("notified_alarm_1", "activated", 1),
+          ], 2),
+        ])
+
+    def test_digest(self):
+        self.notifier.digest_window = 0.2
+        self.notifier.release.set()
+        for a in self.alarms[:2]:
+            a.input = True
+        self.notifier.close(timeout=5.0)
+        self.assertEqual(self.notifier.batches, [
+          ([
+            ("notified_alarm_0", "activated", 1),
+            ("notified_alarm_1", "activated", 1),
+          ], 0),
+        ])
+
+        # nothing is queued once closed.
+        self.notifier.notify_summary(self.alarms[0], "flood summary")
+        self.alarms[0].input = False
+        self.assertEqual(len(self.notifier.batches), 1)
+
+    def test_summary(self):
+        self.alarms[0].input = True
+        self.assertTrue(self.notifier.sending.wait(5.0))
+
+        # a summary doesn't overwrite the queued transition of its alarm.
+        self.alarms[1].input = True
+        self.notifier.notify_summary(
+          self.alarms[1], "and 3 related alarm transitions (alarm flood)")
+        self.notifier.notify_summary(self.alarms[2], "held back")
+
+        self.notifier.release.set()
+        self.notifier.close(timeout=5.0)
+        self.assertEqual(self.notifier.batches, [
+          ([("notified_alarm_0", "activated", 1)], 0),
+          ([
+            ("notified_alarm_1", "activated", 1),
+            ("notified_alarm_1",
+             "and 3 related alarm transitions (alarm flood)", 1),
+          ], 1),
+        ])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import asyncio
+import threading
+import unittest
+
+from pyAutomation.DataObjects.PointDiscrete import PointDiscrete
+from pyAutomation.Supervisory.AsyncEventLoop import AsyncEventLoop
+from pyAutomation.Supervisory.AsyncSupervisedTask import AsyncSupervisedTask
+
+
+class CountingTask(AsyncSupervisedTask):
+
+    def __init__(self, name, period):
+        self.runs = 0
+        self.reasons = []
+        self.ran = threading.Event()
+        self.opened = False
+        self.closed = False
+        super().__init__(
+          name=name,
+          loop=self.loop,
+          period=period,
+          logger='testbench',
+        )
+
+    def config(self, data):
+        pass
+
+    async def open(self):
+        self.opened = True
+
+    async def close(self):
+        self.closed = True
+
+    async def loop(self):
+        # hand control back to the event loop mid cycle.
+        await asyncio.sleep(0)
+        self.runs += 1
+        self.reasons.append(list(self.interrupt_reasons))
+        self.ran.set()
+        return None
+
+
+class TestAsyncSupervisedTask(unittest.TestCase):
+
+    def setUp(self):
+        self.event_loop = AsyncEventLoop(logger='testbench')
+        self.event_loop.start()
+
+    def tearDown(self):
+        self.event_loop.shutdown()
+
+    def test_interrupt_from_thread(self):
+        task = CountingTask("async_interrupt", None)
+        task.event_loop = self.event_loop
+
+        point = PointDiscrete(description="async point")
+        point.name = "async_point"
+        point.writer = task
+        point.add_observer(task.name, task.interrupt)
+
+        try:
+            task.start()
+            self.assertTrue(task.ran.wait(1.0))
+            self.assertTrue(task.opened)
+            task.ran.clear()
+
+            # written from a thread other than the event loop.
+            writer = threading.Thread(
+              target=setattr, args=(point, 'value', True))
+            writer.start()
+            writer.join()
+
+            self.assertTrue(task.ran.wait(1.0))
+            self.assertEqual(task.reasons[-1], ["async_point"])
+        finally:
+            point.observers.pop(task.name, None)
+
+        task.quit()
+        task.future.result(1.0)
+        self.assertTrue(task.terminated)
+        self.assertTrue(task.closed)
+
+    def test_tasks_share_loop(self):
+        tasks = [CountingTask(f"async_periodic_{i}", 0.01) for i in range(20)]
+        for t in tasks:
+            t.event_loop = self.event_loop
+            t.start()
+
+        threading.Event().wait(0.1)
+        for t in tasks:
+            t.quit()
+        for t in tasks:
+            t.future.result(1.0)
+            self.assertGreater(t.runs, 3, t.name)
+            self.assertTrue(t.terminated, t.name)
+
+    def test_shutdown_cancels_tasks(self):
+        task = CountingTask("async_cancelled", None)
+        task.event_loop = self.event_loop
+        task.start()
+        self.assertTrue(task.ran.wait(1.0))
+
+        self.event_loop.shutdown()
+        self.assertTrue(task.terminated)
+        self.assertTrue(task.closed)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import unittest
+
+from pyAutomation.DataObjects.PointAbstract import PointAbstract
+from pyAutomation.DataObjects.PointAnalog import PointAnalog
+from pyAutomation.DataObjects.PointDiscrete import PointDiscrete
+from pyAutomation.Supervisory.ChangeLog import ChangeLog
+from pyAutomation.Supervisory.PointManager import PointManager
+
+
+class TestChangeLog(unittest.TestCase):
+
+    def test_changed_since(self):
+        log = ChangeLog(capacity=4)
+        a = PointDiscrete(description="log a")
+        b = PointDiscrete(description="log b")
+
+        self.assertEqual(log.changed_since(0), (0, []))
+        log.record(a)
+        log.record(b)
+        seq = log.record(a)
+        self.assertEqual(seq, 3)
+
+        # each point is listed once, in the order of its first change.
+        seq, points = log.changed_since(0)
+        self.assertEqual(seq, 3)
+        self.assertEqual([id(p) for p in points], [id(a), id(b)])
+
+        seq, points = log.changed_since(2)
+        self.assertEqual([id(p) for p in points], [id(a)])
+        self.assertEqual(log.changed_since(3), (3, []))
+
+        self.assertEqual(log.seq_of(a), 3)
+        self.assertEqual(log.seq_of(b), 2)
+
+    def test_overrun(self):
+        log = ChangeLog(capacity=4)
+        a = PointDiscrete(description="log a")
+        for i in range(6):
+            log.record(a)
+        self.assertEqual(log.changed_since(1), (6, None))
+        self.assertEqual(len(log.changed_since(2)[1]), 1)
+
+        # sequence numbers from another log.
+        self.assertEqual(log.changed_since(10), (6, None))
+
+        # b's change has been overwritten.
+        b = PointDiscrete(description="log b")
+        log.record(b)
+        for i in range(4):
+            log.record(a)
+        self.assertEqual(log.seq_of(a), 11)
+        self.assertEqual(log.seq_of(b), 0)
+
+
+class TestPointChanges(unittest.TestCase):
+
+    def setUp(self):
+        self.old_log = PointAbstract.change_log
+        PointManager.use_change_log(16)
+
+        self.point = PointAnalog(description="changes", u_of_m="kPa")
+        self.point.name = "changes"
+
+    def tearDown(self):
+        PointAbstract.change_log = self.old_log
+
+    def test_point_changes(self):
+        seq, points = PointManager.changed_since(0)
+        self.assertEqual(points, [])
+
+        self.point.value = 1.0
+        self.point.value = 1.0
+        self.point.quality = False
+        self.assertEqual(self.point.change_seq, 2)
+
+        seq, points = PointManager.changed_since(seq)
+        self.assertEqual(seq, 2)
+        self.assertIs(points[0], self.point)
+        self.assertEqual(len(points), 1)
+
+        self.point.forced = True
+        self.assertEqual(PointManager.changed_since(seq)[0], 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import datetime
+import os
+import time
+import unittest
+
+from pyAutomation.Supervisory.Clock import Clock
+from pyAutomation.Supervisory.VirtualClock import VirtualClock
+
+UTC = datetime.timezone.utc
+
+
+class TestClock(unittest.TestCase):
+
+    def test_round_trip(self):
+        now = Clock.monotonic_ns()
+        d = Clock.to_datetime(now)
+        self.assertLess(abs(d - datetime.datetime.now()).total_seconds(), 1.0)
+        self.assertLess(abs(Clock.to_monotonic_ns(d) - now), 1000)
+
+        # aware times are converted too.
+        self.assertLess(
+          abs(Clock.to_monotonic_ns(d.astimezone(UTC)) - now), 1000)
+
+    def test_step(self):
+        with VirtualClock(start=datetime.datetime(2019, 1, 1, tzinfo=UTC)) \
+          as clock:
+            ns = clock.monotonic_ns()
+            self.assertEqual(Clock.to_datetime(ns), clock.now())
+
+            # the time is set back an hour (e.g. by NTP on a board without
+            # an RTC), conversions from then on follow the new time.
+            clock.step(-3600.0)
+            self.assertEqual(Clock.to_datetime(ns), clock.now())
+            self.assertEqual(Clock.to_utc_ns(ns), clock.time_ns())
+            self.assertEqual(Clock.to_monotonic_ns(clock.now()), ns)
+
+    @unittest.skipUnless(hasattr(time, 'tzset'), "needs time.tzset()")
+    def test_daylight_saving(self):
+        # the clocks go back from 02:00 EDT to 01:00 EST an hour in.
+        tz = os.environ.get('TZ')
+        os.environ['TZ'] = 'EST5EDT,M3.2.0,M11.1.0'
+        time.tzset()
+        try:
+            start = datetime.datetime(2019, 11, 3, 5, 0, tzinfo=UTC)
+            with VirtualClock(start=start) as clock:
+                before = clock.monotonic_ns()
+                clock.advance(7200.0)
+                self.assertEqual(
+                  Clock.to_datetime(before), datetime.datetime(2019, 11, 3, 1))
+                self.assertEqual(
+                  Clock.to_datetime(clock.monotonic_ns()),
+                  datetime.datetime(2019, 11, 3, 2))
+        finally:
+            if tz is None:
+                del os.environ['TZ']
+            else:
+                os.environ['TZ'] = tz
+            time.tzset()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import unittest
+
+from pyAutomation.Supervisory.DeadlineScheduler import DeadlineScheduler
+from pyAutomation.Supervisory.ConfigurationException import \
+  ConfigurationException
+
+MS = 1000000  # nanoseconds in a millisecond.
+
+
+class TestDeadlineScheduler(unittest.TestCase):
+
+    def run_cycle(self, scheduler, start, end):
+        periodic = scheduler.cycle_started(start)
+        scheduler.cycle_finished(end)
+        return periodic
+
+    def test_on_time(self):
+        s = DeadlineScheduler(period=0.05, policy='skip')
+        s.start(0)
+
+        self.assertTrue(self.run_cycle(s, 0, 10 * MS))
+        self.assertEqual(s.deadline_ns, 50 * MS)
+
+        # 2 ms late.
+        self.assertTrue(self.run_cycle(s, 52 * MS, 60 * MS))
+        self.assertEqual(s.deadline_ns, 100 * MS)
+        self.assertEqual(s.last_jitter_ns, 2 * MS)
+        self.assertEqual(s.max_jitter_ns, 2 * MS)
+        self.assertEqual(s.overruns, 0)
+
+    def test_interrupt_does_not_shift_phase(self):
+        s = DeadlineScheduler(period=0.05, policy='skip')
+        s.start(0)
+        self.run_cycle(s, 0, 1 * MS)
+
+        # an interrupt driven run between deadlines.
+        self.assertFalse(self.run_cycle(s, 20 * MS, 30 * MS))
+        self.assertEqual(s.deadline_ns, 50 * MS)
+        self.assertAlmostEqual(s.time_until_deadline(30 * MS), 0.02)
+
+    def test_skip(self):
+        s = DeadlineScheduler(period=0.05, policy='skip')
+        s.start(0)
+
+        # runs for 130 ms, the 50 and 100 ms deadlines are missed.
+        self.run_cycle(s, 0, 130 * MS)
+        self.assertEqual(s.overruns, 1)
+        self.assertEqual(s.skipped, 2)
+        self.assertEqual(s.deadline_ns, 150 * MS)
+        self.assertEqual(s.last_overrun_ns, 80 * MS)
+
+    def test_catch_up(self):
+        s = DeadlineScheduler(period=0.05, policy='catch_up')
+        s.start(0)
+
+        self.run_cycle(s, 0, 130 * MS)
+        self.assertEqual(s.overruns, 1)
+        self.assertEqual(s.deadline_ns, 50 * MS)
+
+        # the missed cycles are run back to back.
+        self.run_cycle(s, 130 * MS, 131 * MS)
+        self.assertEqual(s.deadline_ns, 100 * MS)
+        self.run_cycle(s, 131 * MS, 132 * MS)
+        self.assertEqual(s.deadline_ns, 150 * MS)
+        self.assertEqual(s.overruns, 1)
+
+    def test_fixed_delay(self):
+        s = DeadlineScheduler(period=0.05, policy='fixed_delay')
+        s.start(0)
+
+        self.run_cycle(s, 0, 10 * MS)
+        self.assertEqual(s.deadline_ns, 60 * MS)
+
+        self.run_cycle(s, 60 * MS, 200 * MS)
+        self.assertEqual(s.overruns, 1)
+        self.assertEqual(s.deadline_ns, 250 * MS)
+
+    def test_invalid_policy(self):
+        with self.assertRaises(ConfigurationException):
+            DeadlineScheduler(period=0.05, policy='sometimes')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import gc
+import unittest
+
+from pyAutomation.Supervisory.ConfigurationException import \
+  ConfigurationException
+from pyAutomation.Supervisory.GcManager import GcManager
+from pyAutomation.Supervisory.SupervisedThread import SupervisedThread
+
+
+class GarbageThread(SupervisedThread):
+    """ Makes reference cycles for the collector to clean up. """
+
+    def __init__(self, name, sleep_time):
+        self.sleep = sleep_time
+        super().__init__(
+          name=name,
+          loop=self.loop,
+          period=None,
+          logger='testbench',
+        )
+
+    def config(self, data):
+        pass
+
+    def loop(self):
+        for _ in range(2000):
+            a = []
+            a.append(a)
+        return self.sleep
+
+
+class TestGcManager(unittest.TestCase):
+
+    def setUp(self):
+        self.thresholds = gc.get_threshold()
+
+    def tearDown(self):
+        gc.enable()
+        gc.unfreeze()
+        gc.set_threshold(*self.thresholds)
+
+    def test_from_config(self):
+        self.assertIsNone(GcManager.from_config(None))
+
+        manager = GcManager.from_config(
+          {'thresholds': [1000, 20, 20], 'min_idle': 0.01})
+        self.assertTrue(manager.freeze)
+        self.assertFalse(manager.automatic)
+        self.assertEqual(manager.thresholds, (1000, 20, 20))
+
+        with self.assertRaises(ConfigurationException):
+            GcManager.from_config({'bogus': 1})
+        with self.assertRaises(ConfigurationException):
+            GcManager.from_config({'thresholds': [0, 10, 10]})
+
+    def test_freeze(self):
+        manager = GcManager(freeze=True, automatic=False)
+        manager.start()
+        try:
+            self.assertGreater(gc.get_freeze_count(), 0)
+            self.assertFalse(gc.isenabled())
+        finally:
+            manager.stop()
+        self.assertTrue(gc.isenabled())
+
+    def test_idle_collection(self):
+        manager = GcManager(freeze=False, automatic=False, min_idle=0.005)
+        manager.start()
+        try:
+            t = GarbageThread("gc_idle", sleep_time=None)
+            t.gc_manager = manager
+            t.run_cycle()
+        finally:
+            manager.stop()
+
+        self.assertEqual(manager.collections, 1)
+        self.assertEqual(t.statistics.gc_pause.count, 1)
+        self.assertLess(gc.get_count()[0], 700)
+
+    def test_busy_thread_does_not_collect(self):
+        manager = GcManager(freeze=False, automatic=False, min_idle=0.005)
+        manager.start()
+        try:
+            t = GarbageThread("gc_busy", sleep_time=0.0)
+            t.gc_manager = manager
+            t.run_cycle()
+        finally:
+            manager.stop()
+
+        self.assertEqual(manager.collections, 0)
+        self.assertEqual(t.statistics.gc_pause.count, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
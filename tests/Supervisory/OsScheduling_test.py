@@ -0,0 +1,59 @@
+import logging
+import os
+import threading
+import unittest
+
+from pyAutomation.Supervisory.ConfigurationException import \
+  ConfigurationException
+from pyAutomation.Supervisory.OsScheduling import OsScheduling
+
+
+class TestOsScheduling(unittest.TestCase):
+
+    def test_from_config(self):
+        self.assertIsNone(OsScheduling.from_config(None))
+        self.assertIsNone(OsScheduling.from_config({'logger': 'x'}))
+
+        s = OsScheduling.from_config({'cpu_affinity': 1, 'nice': '5'})
+        self.assertEqual(s.cpu_affinity, [1])
+        self.assertEqual(s.nice, 5)
+        self.assertIsNone(s.sched_priority)
+
+    def test_invalid(self):
+        with self.assertRaises(ConfigurationException):
+            OsScheduling(cpu_affinity=[])
+        with self.assertRaises(ConfigurationException):
+            OsScheduling(nice=40)
+        with self.assertRaises(ConfigurationException):
+            OsScheduling(sched_priority=0)
+
+    @unittest.skipUnless(
+      hasattr(os, 'sched_getaffinity'), "requires Linux affinity support")
+    def test_apply_to_thread(self):
+        before = os.sched_getaffinity(0)
+        cpu = min(before)
+        scheduling = OsScheduling(
+          cpu_affinity=[cpu],
+          nice=os.getpriority(os.PRIO_PROCESS, 0) + 1,
+          # most test environments aren't allowed to use SCHED_FIFO, that
+          # must only be logged.
+          sched_priority=10,
+        )
+        result = {}
+
+        def target():
+            scheduling.apply(logging.getLogger('testbench'))
+            result['affinity'] = os.sched_getaffinity(0)
+
+        t = threading.Thread(target=target)
+        t.start()
+        t.join()
+
+        self.assertEqual(result['affinity'], {cpu})
+
+        # the calling thread is unaffected.
+        self.assertEqual(os.sched_getaffinity(0), before)
+
+
+if __name__ == '__main__':
+    unittest.main()
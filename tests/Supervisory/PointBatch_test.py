@@ -0,0 +1,108 @@
+import unittest
+
+from pyAutomation.DataObjects.ChangeSet import ChangeSet
+from pyAutomation.DataObjects.PointAnalog import PointAnalog
+from pyAutomation.DataObjects.PointDiscrete import PointDiscrete
+from pyAutomation.Supervisory.PointBatch import PointBatch
+from pyAutomation.Supervisory.PointManager import PointManager
+from pyAutomation.Supervisory.SupervisedThread import SupervisedThread
+
+
+class RecordingThread(SupervisedThread):
+
+    def __init__(self, name):
+        self.seen = []
+        self.calls = []
+        super().__init__(
+          name=name,
+          loop=self.loop,
+          period=None,
+          logger='testbench',
+        )
+
+    def config(self, data):
+        pass
+
+    def interrupt(self, name, reason):
+        self.calls.append(reason)
+        super().interrupt(name, reason)
+
+    def loop(self):
+        self.seen.append(dict(self.interrupt_reasons))
+        return None
+
+
+class TestPointBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.writer = RecordingThread("batch_writer")
+        self.reader = RecordingThread("batch_reader")
+        self.other = RecordingThread("batch_other")
+
+        self.points = []
+        for i in range(3):
+            p = PointAnalog(description=f"batch point {i}", u_of_m="kPa")
+            p.name = f"batch_point_{i}"
+            p.writer = self.writer
+            p.add_observer(self.reader.name, self.reader.interrupt)
+            self.points.append(p)
+
+        self.discrete = PointDiscrete(description="batch discrete")
+        self.discrete.name = "batch_discrete"
+        self.discrete.writer = self.writer
+        self.discrete.add_observer(self.other.name, self.other.interrupt)
+
+    def test_one_interrupt_per_observer(self):
+        with PointManager.batch() as change_set:
+            for i, p in enumerate(self.points):
+                p.value = float(i + 1)
+            self.points[0].value = 10.0
+            self.discrete.value = True
+            self.discrete.quality = False
+            self.assertEqual(self.reader.calls, [])
+
+        self.assertEqual(len(change_set), 4)
+        self.assertIsNone(PointBatch.current())
+
+        self.assertEqual(len(self.reader.calls), 1)
+        reason = self.reader.calls[0]
+        self.assertIsInstance(reason, ChangeSet)
+        self.assertEqual(list(reason), self.points)
+        self.assertNotIn(self.discrete, reason)
+
+        self.assertEqual(len(self.other.calls), 1)
+        self.assertEqual(list(self.other.calls[0]), [self.discrete])
+
+        # the loop sees the points as if they had interrupted it one by one.
+        self.reader.run_cycle()
+        self.assertEqual(
+          self.reader.seen[-1],
+          {p.name: p for p in self.points},
+        )
+        self.assertTrue(self.reader.interrupted_by(self.points[2]))
+
+    def test_nested(self):
+        with PointManager.batch() as outer:
+            self.points[0].value = 1.0
+            with PointManager.batch() as inner:
+                self.points[1].value = 1.0
+            self.assertIs(inner, outer)
+            self.assertEqual(self.reader.calls, [])
+        self.assertEqual(len(self.reader.calls), 1)
+        self.assertEqual(len(self.reader.calls[0]), 2)
+
+    def test_exception(self):
+        with self.assertRaises(ValueError):
+            with PointManager.batch():
+                self.points[0].value = 1.0
+                raise ValueError()
+        self.assertEqual(list(self.reader.calls[0]), [self.points[0]])
+        self.assertIsNone(PointBatch.current())
+
+    def test_unbatched(self):
+        self.points[0].value = 1.0
+        self.assertIs(self.reader.calls[0], self.points[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+import unittest
+from datetime import datetime
+
+import jsonpickle
+
+from pyAutomation.DataObjects.PointAnalog import PointAnalog
+from pyAutomation.DataObjects.PointDiscrete import PointDiscrete
+from pyAutomation.DataObjects.PointEnumeration import PointEnumeration
+from pyAutomation.Supervisory.Clock import Clock
+from pyAutomation.Supervisory.Interruptable import Interruptable
+from pyAutomation.Supervisory.PointManager import PointManager
+from pyAutomation.Supervisory.PointStore import PointStore
+
+
+class Writer(Interruptable):
+
+    def __init__(self, name):
+        self._name = name
+        self.interrupts = []
+
+    @property
+    def name(self):
+        return self._name
+
+    def interrupt(self, name, reason):
+        self.interrupts.append(reason)
+
+
+class TestPointStore(unittest.TestCase):
+
+    def setUp(self):
+        self.writer = Writer("store_logic")
+
+        self.analog = PointAnalog(description="store analog", u_of_m="kPa")
+        self.analog.name = "store_analog"
+        self.analog.writer = self.writer
+        self.analog.value = 12.5
+
+        self.discrete = PointDiscrete(description="store discrete")
+        self.discrete.name = "store_discrete"
+        self.discrete.writer = self.writer
+
+        self.enumeration = PointEnumeration(
+          description="store enumeration", states=["Hand", "Off", "Auto"])
+        self.enumeration.name = "store_enumeration"
+        self.enumeration.writer = self.writer
+        self.enumeration.value = "Auto"
+
+        self.store = PointStore(
+          [self.analog, self.discrete, self.enumeration, self.analog])
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_bind(self):
+        self.assertEqual(len(self.store), 3)
+        h = self.store.handles["store_analog"]
+
+        # the state is moved into the store.
+        self.assertEqual(self.store.read(h)[:2], (12.5, True))
+        self.assertEqual(self.analog.value, 12.5)
+        self.assertEqual(self.enumeration.value, "Auto")
+        self.assertIsNone(self.discrete.value)
+
+        self.analog.value = 20.0
+        self.discrete.value = True
+        self.assertEqual(self.store.value(h), 20.0)
+        self.assertIs(
+          self.store.value(self.store.handles["store_discrete"]), True)
+        self.assertEqual(self.store.timestamp(h), self.analog._update_ns)
+        self.assertEqual(
+          Clock.to_datetime(self.store.timestamp(h)), self.analog.last_update)
+
+        # points keep working once moved back out of the store.
+        self.store.close()
+        self.assertIsNone(self.analog._store)
+        self.assertEqual(self.analog.value, 20.0)
+        self.assertTrue(self.discrete.value)
+        self.analog.value = 21.0
+        self.assertEqual(self.analog.value, 21.0)
+
+    def test_forced(self):
+        h = self.store.handles["store_analog"]
+        self.analog.forced = True
+        self.assertTrue(self.store.forced(h))
+
+        self.analog.value = 99.0
+        self.assertEqual(self.analog.value, 12.5)
+
+        self.analog.forced = False
+        self.assertFalse(self.store.forced(h))
+        self.assertEqual(self.writer.interrupts, [self.analog])
+
+    def test_bulk(self):
+        seqs = self.store.seqs()
+        self.discrete.value = True
+        self.assertEqual(
+          self.store.changed(seqs), [self.store.handles["store_discrete"]])
+
+        self.assertEqual(self.store.values(), [12.5, True, 2])
+        # the enumeration was written by index, which leaves the quality.
+        self.assertEqual(self.store.bad_quality(), [2])
+        self.discrete.quality = False
+        self.assertEqual(self.store.bad_quality(), [1, 2])
+
+        stale = self.store.stale(Clock.monotonic_ns() + 1)
+        self.assertEqual(sorted(stale), [0, 1, 2])
+
+        self.assertEqual(self.store.column('value')[0], 12.5)
+        with self.assertRaises(TypeError):
+            self.store.column('value')[0] = 1.0
+
+    def test_json_pickle(self):
+        unpickled = jsonpickle.decode(jsonpickle.encode(self.analog))
+        self.assertIsNone(unpickled._store)
+        self.assertEqual(unpickled.value, 12.5)
+        self.assertEqual(unpickled.last_update, self.analog.last_update)
+
+
+class TestPointManagerStore(unittest.TestCase):
+
+    def setUp(self):
+        PointManager.clear_database()
+        PointManager.load_points_from_yaml_string(
+          "points:\n"
+          "  pm_store_analog: !PointAnalog\n"
+          "    description: manager store analog\n"
+          "    hmi_writeable: false\n"
+          "    requestable: false\n"
+          "    retentive: true\n"
+          "    update_period: null\n"
+          "    value: 4.0\n"
+        )
+
+    def tearDown(self):
+        PointManager.clear_database()
+
+    def test_create_point_store(self):
+        point = PointManager.find_point("pm_store_analog")
+        store = PointManager.create_point_store()
+        self.assertIs(point._store, store)
+        self.assertEqual(store.values(), [4.0])
+        self.assertIsInstance(point.last_update, datetime)
+
+        PointManager.clear_database()
+        self.assertIsNone(PointManager.point_store)
+        self.assertIsNone(point._store)
+        self.assertEqual(point.value, 4.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+
+import jsonpickle
+
+from pyAutomation.DataObjects.PointAbstract import PointAbstract
+from pyAutomation.DataObjects.PointAnalog import PointAnalog
+from pyAutomation.DataObjects.PointDiscrete import PointDiscrete
+from pyAutomation.DataObjects.ProcessValue import ProcessValue
+from pyAutomation.Supervisory.PointManager import PointManager
+from pyAutomation.Supervisory.RpcServer import RpcServer
+
+
+class TestRpcServer(unittest.TestCase):
+
+    def setUp(self):
+        self.old_log = PointAbstract.change_log
+        PointManager.use_change_log(8)
+
+        self.discrete = PointDiscrete(description="rpc discrete")
+        self.discrete.name = "rpc_discrete"
+
+        self.pv = ProcessValue(
+          PointAnalog(description="rpc analog", u_of_m="kPa"))
+        self.pv.name = "rpc_pv"
+        self.pv.config()
+        self.analog = self.pv.readwrite_object
+
+        points = {
+          "rpc_discrete": self.discrete.readonly_object,
+          "rpc_pv": self.pv,
+        }
+        self.server = RpcServer()
+        self.server.point_dict = points
+        self.server.get_hmi_point = points.get
+        self.server.exposed_add_monitored_points(list(points))
+
+    def tearDown(self):
+        PointAbstract.change_log = self.old_log
+
+    def poll(self):
+        return sorted(jsonpickle.decode(
+          self.server.exposed_get_hmi_points_list()))
+
+    def test_deltas(self):
+        # everything is sent after the points are added.
+        self.assertEqual(self.poll(), ["rpc_discrete", "rpc_pv"])
+        self.assertEqual(self.poll(), [])
+
+        self.discrete.value = True
+        self.assertEqual(self.poll(), ["rpc_discrete"])
+
+        # the process value is sent when the point it wraps changes.
+        self.analog.value = 5.0
+        self.assertEqual(self.poll(), ["rpc_pv"])
+
+        # everything is sent when the change log has been overrun.
+        for i in range(10):
+            self.discrete.value = not self.discrete.value
+        self.assertEqual(self.poll(), ["rpc_discrete", "rpc_pv"])
+
+    def test_remove(self):
+        self.server.exposed_remove_monitored_points(["rpc_discrete"])
+        self.assertEqual(self.poll(), ["rpc_pv"])
+        self.discrete.value = True
+        self.assertEqual(self.poll(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
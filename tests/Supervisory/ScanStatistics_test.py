@@ -0,0 +1,97 @@
+import unittest
+import urllib.request
+
+from pyAutomation.Supervisory.Histogram import Histogram
+from pyAutomation.Supervisory.MetricsServer import MetricsServer
+from pyAutomation.Supervisory.ScanStatistics import ScanStatistics
+from pyAutomation.Supervisory.SupervisedThread import SupervisedThread
+
+
+class IdleThread(SupervisedThread):
+
+    def __init__(self, name):
+        super().__init__(
+          name=name,
+          loop=self.loop,
+          period=None,
+          logger='testbench',
+        )
+
+    def config(self, data):
+        pass
+
+    def loop(self):
+        return None
+
+
+class TestScanStatistics(unittest.TestCase):
+
+    def test_histogram(self):
+        h = Histogram((10, 100, 1000))
+        for v in (5, 10, 50, 500, 5000):
+            h.record(v)
+
+        self.assertEqual(h.counts.tolist(), [2, 1, 1, 1])
+        self.assertEqual(h.count, 5)
+        self.assertEqual(h.total, 5565)
+        self.assertEqual(h.percentile(40), 10)
+        self.assertEqual(h.percentile(60), 100)
+        self.assertEqual(h.percentile(100), 5000)
+
+    def test_record_cycle(self):
+        s = ScanStatistics()
+        s.record_cycle(start_ns=0, end_ns=30000)
+        s.record_cycle(
+          start_ns=500000000,
+          end_ns=500030000,
+          interrupted_ns=499900000,
+          overrun_ns=15000,
+        )
+        s.record_cycle(start_ns=1000000000, end_ns=1000030000)
+
+        self.assertEqual(s.cycles, 3)
+        self.assertEqual(s.sweep.count, 3)
+        self.assertEqual(s.latency.snapshot['sum'], 100000)
+        self.assertEqual(s.overrun.count, 1)
+
+        # two cycles in the first second.
+        self.assertEqual(s.wakeup_rate.count, 1)
+        self.assertEqual(s.wakeup_rate.total, 2)
+
+    def test_thread_records_interrupt_latency(self):
+        t = IdleThread("stats_thread")
+        t.run_cycle()
+        t.interrupt(name="testbench", reason=None)
+        t.run_cycle()
+
+        self.assertEqual(t.statistics.cycles, 2)
+        self.assertEqual(t.statistics.latency.count, 1)
+
+    def test_metrics_server(self):
+        t = IdleThread("metrics_thread")
+        t.run_cycle()
+
+        server = MetricsServer(thread_list=[t], port=0)
+        server.start()
+        try:
+            url = f"http://127.0.0.1:{server.port}/metrics"
+            with urllib.request.urlopen(url, timeout=5) as response:
+                text = response.read().decode('utf-8')
+        finally:
+            server.close()
+
+        self.assertIn(
+          'pyautomation_sweep_seconds_count{thread="metrics_thread"} 1',
+          text,
+        )
+        self.assertIn(
+          'pyautomation_sweep_seconds_bucket{thread="metrics_thread",'
+          'le="+Inf"} 1',
+          text,
+        )
+        self.assertIn(
+          'pyautomation_cycles_total{thread="metrics_thread"} 1', text)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,168 @@
+import multiprocessing
+import threading
+import unittest
+
+from pyAutomation.DataObjects.PointAnalog import PointAnalog
+from pyAutomation.DataObjects.PointDiscrete import PointDiscrete
+from pyAutomation.Supervisory.ConfigurationException import \
+  ConfigurationException
+from pyAutomation.Supervisory.Interruptable import Interruptable
+from pyAutomation.Supervisory.RemoteThread import RemoteThread
+from pyAutomation.Supervisory.ScanStatistics import ScanStatistics
+from pyAutomation.Supervisory.SharedPointTable import SharedPointTable, \
+  MAIN_PROCESS
+
+
+class Writer(Interruptable):
+
+    def __init__(self, name):
+        self._name = name
+        self.interrupts = []
+
+    @property
+    def name(self):
+        return self._name
+
+    def interrupt(self, name, reason):
+        self.interrupts.append(reason)
+
+    @property
+    def pickle_dict(self):
+        return {'name': self._name, 'terminated': False}
+
+
+class TestSharedPointTable(unittest.TestCase):
+
+    def setUp(self):
+        self.analog = PointAnalog(
+          description="shared analog", requestable=True)
+        self.analog.name = "shared_analog"
+        self.analog.writer = Writer("worker_logic")
+
+        self.discrete = PointDiscrete(description="shared discrete")
+        self.discrete.name = "shared_discrete"
+        self.discrete.writer = Writer("main_logic")
+
+        self.table = SharedPointTable(
+          points=[self.analog, self.discrete],
+          processes=2,
+        )
+        self.table.claim("shared_analog", 1)
+        self.table.claim("shared_discrete", MAIN_PROCESS)
+
+    def tearDown(self):
+        self.table.close()
+
+    def test_claim(self):
+        self.assertEqual(self.table.owner("shared_analog"), 1)
+        with self.assertRaises(ConfigurationException):
+            self.table.claim("shared_analog", MAIN_PROCESS)
+
+    def test_worker_process(self):
+        changed = threading.Event()
+        self.analog.add_observer(
+          "testbench", lambda name, reason: changed.set())
+
+        def worker():
+            self.table.attach(1)
+            self.analog.value = 42.5
+
+            # wait for the request from the main process.
+            self.table.serve()
+            self.analog.value = self.analog.request_value
+
+        process = multiprocessing.get_context('fork').Process(target=worker)
+        process.start()
+
+        self.table.attach(MAIN_PROCESS)
+        server = threading.Thread(target=self.table.serve)
+        server.start()
+        try:
+            self.assertTrue(changed.wait(5.0))
+            self.assertEqual(self.analog.value, 42.5)
+            self.assertTrue(self.analog.quality)
+
+            # requests go to the owning process.
+            changed.clear()
+            self.analog.request_value = 7.0
+            self.table.stop(1)
+            self.assertTrue(changed.wait(5.0))
+            self.assertEqual(self.analog.value, 7.0)
+
+        finally:
+            self.table.stop(1)
+            process.join(5.0)
+            self.table.stop(MAIN_PROCESS)
+            server.join(5.0)
+            self.analog.observers.pop("testbench", None)
+
+        self.assertEqual(process.exitcode, 0)
+
+    def test_failed_request(self):
+        self.table.attach(MAIN_PROCESS)
+
+        def fail(name, reason):
+            raise ValueError("bad request")
+        self.discrete.writer.interrupt = fail
+
+        changed = threading.Event()
+        self.discrete.add_observer(
+          "testbench", lambda name, reason: changed.set())
+        server = threading.Thread(target=self.table.serve)
+        with self.assertLogs('supervisory', 'ERROR') as logs:
+            server.start()
+            try:
+                self.table.send_request(
+                  MAIN_PROCESS, "shared_discrete", None)
+
+                # the server carries on with the next message.
+                h = self.table.handles["shared_discrete"]
+                self.table.store.write(h, True, True, 1)
+                self.table._queues[MAIN_PROCESS].put_nowait(h)
+                self.assertTrue(changed.wait(5.0))
+            finally:
+                self.table.stop(MAIN_PROCESS)
+                server.join(5.0)
+                self.discrete.observers.pop("testbench", None)
+
+        self.assertFalse(server.is_alive())
+        self.assertIn("ValueError('bad request')", logs.output[-1])
+
+    def test_read(self):
+        self.table.attach(MAIN_PROCESS)
+        self.discrete.value = True
+        self.assertEqual(
+          self.table.read(self.table.handles["shared_discrete"])[:2],
+          (True, True),
+        )
+
+    def test_thread_report(self):
+        thread = self.analog.writer
+        thread.statistics = ScanStatistics()
+        remote = RemoteThread(thread)
+        self.table.remote_threads[remote.name] = remote
+
+        def worker():
+            self.table.attach(1)
+            thread.statistics.record_cycle(0, 1000000)
+            self.table.report_threads([thread])
+
+        process = multiprocessing.get_context('fork').Process(target=worker)
+        process.start()
+        process.join(5.0)
+
+        self.table.attach(MAIN_PROCESS)
+        self.table.stop(MAIN_PROCESS)
+        self.table.serve()
+
+        # the stand-in shows the statistics of the thread in the worker.
+        self.assertEqual(remote.name, "worker_logic")
+        self.assertEqual(remote.statistics.cycles, 1)
+        self.assertEqual(remote.statistics.sweep.count, 1)
+        self.assertEqual(thread.statistics.cycles, 0)
+        self.assertEqual(
+          remote.pickle_dict, {'name': "worker_logic", 'terminated': False})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+import datetime
+import unittest
+
+from pyAutomation.DataObjects.Alarm import Alarm
+from pyAutomation.Supervisory.AlarmHandler import AlarmHandler
+from pyAutomation.Supervisory.Clock import Clock
+from pyAutomation.Supervisory.SimulationRunner import SimulationRunner
+from pyAutomation.Supervisory.SupervisedThread import SupervisedThread
+from pyAutomation.Supervisory.VirtualClock import VirtualClock
+
+
+class RecordingThread(SupervisedThread):
+    """ Records the simulated time of every cycle. """
+
+    def __init__(self, name, period, sleep_time=None, order=None):
+        self.times = []
+        self.sleep = sleep_time
+        self.order = order
+        super().__init__(
+          name=name,
+          loop=self.loop,
+          period=period,
+          logger='testbench',
+        )
+
+    def config(self, data):
+        pass
+
+    def loop(self):
+        self.times.append(Clock.monotonic())
+        if self.order is not None:
+            self.order.append(self.name)
+        return self.sleep
+
+
+class AlarmTrigger(RecordingThread):
+    """ Raises the input of an alarm ten seconds into the simulation. """
+
+    def __init__(self, name, alarm):
+        self.alarm = alarm
+        super().__init__(name, None)
+
+    def loop(self):
+        super().loop()
+        if Clock.monotonic() < 10.0:
+            return 10.0 - Clock.monotonic()
+        self.alarm.input = True
+        return None
+
+
+class TestSimulationRunner(unittest.TestCase):
+
+    def tearDown(self):
+        Clock.install(None)
+
+    def test_periodic_thread(self):
+        thread = RecordingThread("sim_periodic", 60.0)
+        clock = VirtualClock(start=datetime.datetime(2019, 1, 1))
+
+        with SimulationRunner([thread], clock=clock) as runner:
+            runner.run_for(3600.0)
+            self.assertTrue(Clock.is_virtual())
+
+        self.assertFalse(Clock.is_virtual())
+        self.assertEqual(thread.times, [60.0 * i for i in range(61)])
+        self.assertEqual(
+          thread.last_run_time,
+          datetime.datetime(2019, 1, 1, 1, 0, 0),
+        )
+        self.assertEqual(runner.time, 3600.0)
+
+    def test_deterministic_order(self):
+        order = []
+        a = RecordingThread("a", None, sleep_time=0.5, order=order)
+        b = RecordingThread("b", None, sleep_time=0.25, order=order)
+
+        with SimulationRunner([a, b]) as runner:
+            runner.run_until(1.0)
+
+        self.assertEqual(order, ['a', 'b', 'b', 'a', 'b', 'b', 'a', 'b'])
+
+    def test_alarm_delay(self):
+        alarm = Alarm(description="simulated alarm", on_delay=300.0)
+        alarm.name = "sim_alarm"
+        handler = AlarmHandler(logger='testbench', name="sim_alarm_handler")
+        trigger = AlarmTrigger("sim_trigger", alarm)
+        watcher = RecordingThread("sim_watcher", None)
+        alarm.add_observer(watcher.name, watcher.interrupt)
+
+        previous_handler = Alarm.alarm_handler
+        Alarm.alarm_handler = handler
+        try:
+            with SimulationRunner([handler, trigger, watcher]) as runner:
+                runner.run_for(3600.0)
+        finally:
+            Alarm.alarm_handler = previous_handler
+            alarm.observers.pop(watcher.name, None)
+
+        self.assertTrue(alarm.active)
+        # first cycle at startup, then the alarm activating.
+        self.assertEqual(watcher.times, [0.0, 310.0])
+
+    def test_stall(self):
+        busy = RecordingThread("sim_busy", None, sleep_time=0.0)
+        with SimulationRunner([busy], stall_limit=100) as runner:
+            with self.assertRaises(RuntimeError):
+                runner.step()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import threading
+import time
+import unittest
+
+from pyAutomation.Supervisory.SupervisedThread import SupervisedThread
+from pyAutomation.Supervisory.SupervisedThreadPool import \
+  SupervisedThreadPool
+
+
+class CountingThread(SupervisedThread):
+
+    def __init__(self, name, period):
+        self.runs = 0
+        self.running = False
+        self.overlapped = False
+        self.event = threading.Event()
+        super().__init__(
+          name=name,
+          loop=self.loop,
+          period=period,
+          logger='testbench',
+        )
+
+    def config(self, data):
+        pass
+
+    def loop(self):
+        if self.running:
+            self.overlapped = True
+        self.running = True
+        self.runs += 1
+        time.sleep(0.001)
+        self.running = False
+        self.event.set()
+        return None
+
+
+class TestSupervisedThreadPool(unittest.TestCase):
+
+    def setUp(self):
+        self.pool = SupervisedThreadPool(workers=2, logger='testbench')
+        self.pool.start()
+
+    def tearDown(self):
+        self.pool.shutdown()
+
+    def test_periodic_threads(self):
+        threads = [CountingThread(f"periodic_{i}", 0.02) for i in range(40)]
+        for t in threads:
+            t.executor = self.pool
+            t.start()
+
+        time.sleep(0.25)
+        for t in threads:
+            t.quit()
+        time.sleep(0.05)
+
+        for t in threads:
+            self.assertGreater(t.runs, 3, t.name)
+            self.assertFalse(t.overlapped, t.name)
+            self.assertTrue(t.terminated, t.name)
+
+    def test_interrupt(self):
+        t = CountingThread("interrupt_driven", None)
+        t.executor = self.pool
+        t.start()
+
+        # the first cycle always runs.
+        self.assertTrue(t.event.wait(1.0))
+        t.event.clear()
+        time.sleep(0.02)
+        self.assertEqual(t.runs, 1)
+
+        t.interrupt(name="testbench", reason=self)
+        self.assertTrue(t.event.wait(1.0))
+        self.assertEqual(t.runs, 2)
+
+        t.quit()
+        time.sleep(0.02)
+        self.assertTrue(t.terminated)
+        self.assertEqual(t.runs, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
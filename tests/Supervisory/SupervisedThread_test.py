@@ -0,0 +1,82 @@
+import unittest
+
+from pyAutomation.DataObjects.PointDiscrete import PointDiscrete
+from pyAutomation.Supervisory.SupervisedThread import SupervisedThread
+
+
+class RecordingThread(SupervisedThread):
+
+    def __init__(self, name):
+        self.seen = []
+        super().__init__(
+          name=name,
+          loop=self.loop,
+          period=None,
+          logger='testbench',
+        )
+
+    def config(self, data):
+        pass
+
+    def loop(self):
+        self.seen.append(dict(self.interrupt_reasons))
+        return None
+
+
+class TestSupervisedThread(unittest.TestCase):
+
+    def setUp(self):
+        self.writer = RecordingThread("writer")
+        self.reader = RecordingThread("reader")
+
+        self.point_a = PointDiscrete(description="point a")
+        self.point_a.name = "point_a"
+        self.point_a.writer = self.writer
+
+        self.point_b = PointDiscrete(description="point b")
+        self.point_b.name = "point_b"
+        self.point_b.writer = self.writer
+
+        self.point_a.add_observer(self.reader.name, self.reader.interrupt)
+        self.point_b.add_observer(self.reader.name, self.reader.interrupt)
+
+    def tearDown(self):
+        self.point_a.observers.pop(self.reader.name, None)
+        self.point_b.observers.pop(self.reader.name, None)
+
+    def test_interrupts_are_coalesced(self):
+        self.point_a.value = True
+        self.point_a.value = False
+        self.point_a.value = True
+        self.point_b.value = True
+
+        self.assertIsNone(self.reader.run_cycle())
+        reasons = self.reader.seen[-1]
+        self.assertEqual(list(reasons), ["point_a", "point_b"])
+        self.assertIs(reasons["point_a"], self.point_a)
+        self.assertTrue(self.reader.interrupted_by(self.point_b))
+
+        # the reasons are cleared for the next cycle.
+        self.reader.run_cycle()
+        self.assertEqual(self.reader.seen[-1], {})
+        self.assertFalse(self.reader.interrupted_by(self.point_b))
+
+    def test_interrupt_while_running(self):
+        def loop():
+            self.point_b.value = not self.point_b.value
+            return None
+
+        self.reader.loop = loop
+        self.assertEqual(self.reader.run_cycle(), 0.0)
+
+    def test_quality_change_interrupts(self):
+        self.point_a.value = True
+        self.reader.run_cycle()
+
+        self.point_a.quality = False
+        self.reader.run_cycle()
+        self.assertEqual(list(self.reader.seen[-1]), ["point_a"])
+
+
+if __name__ == '__main__':
+    unittest.main()
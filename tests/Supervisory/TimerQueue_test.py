@@ -0,0 +1,70 @@
+import unittest
+
+from pyAutomation.Supervisory.TimerQueue import TimerQueue
+
+
+class Timer(object):
+
+    def __init__(self, name):
+        self.name = name
+
+    def __eq__(self, other):
+        raise AssertionError("timers shouldn't be compared")
+
+    __hash__ = object.__hash__
+
+
+class TestTimerQueue(unittest.TestCase):
+
+    def setUp(self):
+        self.queue = TimerQueue()
+        self.timers = [Timer(str(i)) for i in range(5)]
+
+    def test_order(self):
+        for t, deadline in zip(self.timers, (5.0, 1.0, 3.0, 3.0, 2.0)):
+            self.queue.arm(t, deadline)
+        self.assertEqual(len(self.queue), 5)
+        self.assertEqual(self.queue.next_deadline(), 1.0)
+
+        self.assertEqual(self.queue.pop_due(0.5), [])
+        self.assertEqual(
+          self.queue.pop_due(3.0),
+          [self.timers[1], self.timers[4], self.timers[2], self.timers[3]],
+        )
+        self.assertNotIn(self.timers[1], self.queue)
+        self.assertEqual(self.queue.next_deadline(), 5.0)
+
+    def test_earliest(self):
+        self.assertTrue(self.queue.arm(self.timers[0], 5.0))
+        self.assertFalse(self.queue.arm(self.timers[1], 6.0))
+        self.assertTrue(self.queue.arm(self.timers[1], 4.0))
+
+    def test_disarm(self):
+        for i, t in enumerate(self.timers):
+            self.queue.arm(t, float(i))
+        self.assertTrue(self.queue.disarm(self.timers[0]))
+        self.assertFalse(self.queue.disarm(self.timers[0]))
+        self.assertEqual(self.queue.next_deadline(), 1.0)
+
+        # re-arming replaces the deadline.
+        self.queue.arm(self.timers[1], 10.0)
+        self.assertEqual(len(self.queue), 4)
+        self.assertEqual(
+          self.queue.pop_due(4.0),
+          [self.timers[2], self.timers[3], self.timers[4]],
+        )
+        self.assertEqual(self.queue.pop_due(10.0), [self.timers[1]])
+        self.assertIsNone(self.queue.next_deadline())
+
+    def test_compaction(self):
+        timers = [Timer(str(i)) for i in range(1000)]
+        for i, t in enumerate(timers):
+            self.queue.arm(t, float(i))
+        for t in timers[:900]:
+            self.queue.disarm(t)
+        self.assertLess(len(self.queue._heap), 500)
+        self.assertEqual(self.queue.pop_due(2000.0), timers[900:])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import threading
+import time
+import unittest
+
+from pyAutomation.Supervisory.Wakeup import Wakeup
+
+
+class TestWakeup(unittest.TestCase):
+
+    def setUp(self):
+        self.wakeup = Wakeup()
+
+    def tearDown(self):
+        self.wakeup.close()
+
+    def test_signal_before_wait(self):
+        self.wakeup.signal()
+        self.wakeup.signal()
+        self.assertTrue(self.wakeup.wait(1.0))
+
+    def test_clear(self):
+        self.wakeup.signal()
+        self.wakeup.clear()
+        self.assertFalse(self.wakeup.wait(0.01))
+
+    def test_signal_from_other_thread(self):
+        t = threading.Timer(0.01, self.wakeup.signal)
+        start = time.monotonic()
+        t.start()
+        self.assertTrue(self.wakeup.wait(5.0))
+        self.assertLess(time.monotonic() - start, 1.0)
+        t.join()
+
+    def test_signal_after_close(self):
+        self.wakeup.close()
+        self.wakeup.signal()
+
+    def test_close_while_signalling(self):
+        errors = []
+
+        def signal(wakeup):
+            try:
+                for _ in range(1000):
+                    wakeup.signal()
+            except OSError as e:
+                errors.append(e)
+
+        for _ in range(20):
+            wakeup = Wakeup()
+            t = threading.Thread(target=signal, args=(wakeup,))
+            t.start()
+            wakeup.close()
+            t.join()
+        self.assertEqual(errors, [])
+
+
+if __name__ == '__main__':
+    unittest.main()